@@ -1,8 +1,9 @@
 import asyncio
 from threading import Event
 from typing import Callable, Optional, Dict, Any, List, TypedDict
-from auth0_ai.authorizers.async_authorization import AsyncAuthorizationRequest
+from auth0_ai.authorizers.async_authorization import AsyncAuthorizationRequest, CIBANotificationReceiver
 from auth0_ai.interrupts.async_authorization_interrupts import AsyncAuthorizationInterrupt, AuthorizationPendingInterrupt, AuthorizationPollingInterrupt
+from auth0_ai.utils import call_soon_in_loop
 from auth0_ai_langchain.utils.interrupt import get_auth0_interrupts
 from langgraph_sdk.client import LangGraphClient
 from langgraph_sdk.schema import Thread, Interrupt
@@ -19,12 +20,29 @@ class GraphResumerFilters(TypedDict):
     graph_id: str
 
 class GraphResumer:
-    def __init__(self, lang_graph: LangGraphClient, filters: Optional[GraphResumerFilters] = None):
+    def __init__(
+        self,
+        lang_graph: LangGraphClient,
+        filters: Optional[GraphResumerFilters] = None,
+        notifications: Optional[CIBANotificationReceiver] = None,
+        fallback_interval: float = 60.0,
+    ):
         self.lang_graph = lang_graph
         self.filters = filters or {}
         self.map: Dict[str, WatchedThread] = {}
         self._stop_event = Event()
         self._loop_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # With ping-mode notifications, threads are resumed when their request is reported ready,
+        # and otherwise only every `fallback_interval` seconds in case a notification is lost.
+        self._fallback_interval = fallback_interval if notifications is not None else None
+        self._notified: set[str] = set()
+        self._notified_resumes: set[asyncio.Task] = set()
+        # Hash map ids of the threads being resumed, so a thread is never resumed twice at once.
+        self._resuming: set[str] = set()
+        if notifications is not None:
+            notifications.subscribe(self.notify)
 
         # Event callbacks
         self._resume_callbacks: List[Callable[[WatchedThread], None]] = []
@@ -84,12 +102,59 @@ class GraphResumer:
     def _get_hash_map_id(self, thread: Thread) -> str:
         return f"{thread['thread_id']}:{next(iter(thread['interrupts']))}"
 
+    def _get_watched_id(self, t: WatchedThread) -> str:
+        return f"{t['thread_id']}:{t['interruption_id']}"
+
     async def _resume_thread(self, t: WatchedThread):
-        self._emit_resume(t)
+        watched_id = self._get_watched_id(t)
+        self._resuming.add(watched_id)
+        try:
+            self._emit_resume(t)
+
+            await self.lang_graph.runs.wait(t["thread_id"], t["assistant_id"], config=t["config"])
+
+            t["last_run"] = asyncio.get_event_loop().time() * 1000
+        finally:
+            self._resuming.discard(watched_id)
+
+    def notify(self, auth_req_id: str) -> None:
+        """
+        Resume the thread waiting on the authorization request `auth_req_id` now, instead of on its
+        next poll. Can be called from any thread.
+        """
+        if not call_soon_in_loop(self._loop, self._resume_notified, auth_req_id):
+            self._notified.add(auth_req_id)
+
+    def _resume_notified(self, auth_req_id: str) -> None:
+        threads = [t for t in self.map.values() if t["auth_request"]["id"] == auth_req_id]
+        if not threads or any(self._get_watched_id(t) in self._resuming for t in threads):
+            # Not watched yet, or a resume is already running: resumed as soon as the next loop picks it up.
+            self._notified.add(auth_req_id)
+            return
+
+        async def resume(t: WatchedThread):
+            try:
+                await self._resume_thread(t)
+            except Exception as e:
+                self._emit_error(e)
 
-        await self.lang_graph.runs.wait(t["thread_id"], t["assistant_id"], config=t["config"])
+        for t in threads:
+            task = asyncio.ensure_future(resume(t))
+            self._notified_resumes.add(task)
+            task.add_done_callback(self._notified_resumes.discard)
 
-        t["last_run"] = asyncio.get_event_loop().time() * 1000
+    def _is_due(self, t: WatchedThread, now_ms: float) -> bool:
+        if t["auth_request"]["id"] in self._notified:
+            self._notified.discard(t["auth_request"]["id"])
+            return True
+
+        if "last_run" not in t:
+            return True
+
+        interval = t["auth_request"]["interval"]
+        if self._fallback_interval is not None:
+            interval = max(interval, self._fallback_interval)
+        return t["last_run"] + interval * 1000 < now_ms
 
     async def loop(self):
         all_threads = await self._get_all_interrupted_threads()
@@ -123,9 +188,15 @@ class GraphResumer:
                     "auth_request": interrupt["value"]["_request"],
                 }
 
+        # Notifications for requests no interrupted thread is waiting on are dropped; the fallback
+        # interval still covers a thread that was interrupted after its notification arrived.
+        watched_ids = {t["auth_request"]["id"] for t in self.map.values()}
+        self._notified &= watched_ids
+
+        now_ms = asyncio.get_event_loop().time() * 1000
         threads_to_resume = [
             t for t in self.map.values()
-            if "last_run" not in t or (t["last_run"] + t["auth_request"]["interval"] * 1000 < asyncio.get_event_loop().time() * 1000)
+            if self._get_watched_id(t) not in self._resuming and self._is_due(t, now_ms)
         ]
 
         await asyncio.gather(*[
@@ -137,6 +208,7 @@ class GraphResumer:
             return
 
         self._stop_event.clear()
+        self._loop = asyncio.get_running_loop()
 
         async def _run_loop():
             while not self._stop_event.is_set():
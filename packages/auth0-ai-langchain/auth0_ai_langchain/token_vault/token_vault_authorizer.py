@@ -1,8 +1,10 @@
 import copy
 from abc import ABC
+from typing import Optional
 from auth0_ai.authorizers.token_vault_authorizer import TokenVaultAuthorizerBase, \
     TokenVaultAuthorizerParams
 from auth0_ai.authorizers.types import Auth0ClientParams
+from auth0_ai.http_pool import HttpPool
 from auth0_ai.interrupts.token_vault_interrupt import TokenVaultInterrupt
 from auth0_ai_langchain.utils.interrupt import to_graph_interrupt
 from auth0_ai_langchain.utils.tool_wrapper import tool_wrapper
@@ -18,6 +20,7 @@ class TokenVaultAuthorizer(TokenVaultAuthorizerBase, ABC):
         self,
         params: TokenVaultAuthorizerParams,
         auth0: Auth0ClientParams = None,
+        http_pool: Optional[HttpPool] = None,
     ):
         missing_refresh = params.refresh_token.value is None
         missing_access_token = params.access_token.value is None
@@ -26,7 +29,7 @@ class TokenVaultAuthorizer(TokenVaultAuthorizerBase, ABC):
             params = copy.copy(params)
             params.refresh_token.value = default_get_refresh_token
 
-        super().__init__(params, auth0)
+        super().__init__(params, auth0, http_pool)
 
     def _handle_authorization_interrupts(self, err: TokenVaultInterrupt) -> None:
         raise to_graph_interrupt(err)
@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from auth0_ai.authorizers.async_authorization import CIBANotificationReceiver
+from auth0_ai.interrupts.async_authorization_interrupts import AuthorizationPendingInterrupt
+from auth0_ai_langchain.async_authorization.graph_resumer import GraphResumer
+
+
+def make_thread(thread_id: str, auth_req_id: str, interval: int = 0):
+    request = {"id": auth_req_id, "requested_at": time.time(), "expires_in": 300, "interval": interval}
+    interrupt = AuthorizationPendingInterrupt("Authorization pending", request).to_json()
+    return {
+        "thread_id": thread_id,
+        "interrupts": {f"{thread_id}-interrupt": [{"value": interrupt}]},
+        "metadata": {"graph_id": "graph"},
+    }
+
+
+class FakeLangGraph:
+    def __init__(self, threads):
+        self.threads_list = threads
+        self.release = asyncio.Event()
+        self.release.set()
+        self.running: dict[str, int] = {}
+        self.max_running = 0
+        self.resumed: list[str] = []
+
+        self.client = MagicMock()
+        self.client.threads.search = AsyncMock(side_effect=self.search)
+        self.client.runs.wait = AsyncMock(side_effect=self.wait)
+
+    async def search(self, offset=0, **kwargs):
+        return self.threads_list if offset == 0 else []
+
+    async def wait(self, thread_id, assistant_id, config=None):
+        self.resumed.append(thread_id)
+        self.running[thread_id] = self.running.get(thread_id, 0) + 1
+        self.max_running = max(self.max_running, self.running[thread_id])
+        try:
+            await self.release.wait()
+        finally:
+            self.running[thread_id] -= 1
+
+
+@pytest.mark.asyncio
+async def test_polls_every_interval_without_notifications():
+    graph = FakeLangGraph([make_thread("t1", "req-1")])
+    resumer = GraphResumer(graph.client)
+
+    await resumer.loop()
+    await asyncio.sleep(0.01)
+    await resumer.loop()
+
+    assert graph.resumed == ["t1", "t1"]
+
+
+@pytest.mark.asyncio
+async def test_waits_for_the_fallback_interval_with_notifications():
+    graph = FakeLangGraph([make_thread("t1", "req-1")])
+    resumer = GraphResumer(graph.client, notifications=CIBANotificationReceiver(), fallback_interval=60)
+
+    await resumer.loop()
+    await asyncio.sleep(0.01)
+    await resumer.loop()
+
+    assert graph.resumed == ["t1"]
+
+
+@pytest.mark.asyncio
+async def test_notification_before_the_resumer_runs_resumes_on_the_next_loop():
+    graph = FakeLangGraph([make_thread("t1", "req-1"), make_thread("t2", "req-2")])
+    notifications = CIBANotificationReceiver()
+    resumer = GraphResumer(graph.client, notifications=notifications, fallback_interval=60)
+
+    await resumer.loop()
+    notifications.notify("req-2")
+    notifications.notify("unknown")
+    await resumer.loop()
+
+    assert graph.resumed == ["t1", "t2", "t2"]
+    # Notifications of requests no thread waits on are not kept.
+    assert "unknown" not in resumer._notified
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("from_thread", [False, True], ids=["same-loop", "other-thread"])
+async def test_notification_resumes_a_watched_thread_right_away(from_thread):
+    graph = FakeLangGraph([make_thread("t1", "req-1")])
+    notifications = CIBANotificationReceiver()
+    resumer = GraphResumer(graph.client, notifications=notifications, fallback_interval=60)
+    resumer.start()
+    try:
+        while not graph.resumed:
+            await asyncio.sleep(0.01)
+
+        if from_thread:
+            thread = threading.Thread(target=notifications.notify, args=("req-1",))
+            thread.start()
+            thread.join()
+        else:
+            notifications.notify("req-1")
+
+        await asyncio.wait_for(_until(lambda: len(graph.resumed) == 2), 1)
+    finally:
+        resumer.stop()
+
+
+@pytest.mark.asyncio
+async def test_never_resumes_a_thread_twice_at_once():
+    graph = FakeLangGraph([make_thread("t1", "req-1")])
+    notifications = CIBANotificationReceiver()
+    resumer = GraphResumer(graph.client, notifications=notifications, fallback_interval=60)
+    resumer._loop = asyncio.get_running_loop()
+
+    graph.release.clear()
+    first = asyncio.ensure_future(resumer.loop())
+    await _until(lambda: graph.resumed == ["t1"])
+
+    # A notification and a loop while the resume is running don't start another one...
+    notifications.notify("req-1")
+    await resumer.loop()
+    await asyncio.sleep(0.01)
+    assert graph.resumed == ["t1"]
+
+    graph.release.set()
+    await first
+
+    # ...but the notification is kept for the next loop.
+    await resumer.loop()
+    assert graph.resumed == ["t1", "t1"]
+    assert graph.max_running == 1
+
+
+async def _until(predicate):
+    while not predicate():
+        await asyncio.sleep(0.005)
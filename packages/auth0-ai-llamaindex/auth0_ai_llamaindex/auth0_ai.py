@@ -1,8 +1,9 @@
 from typing import Callable, Optional
 from llama_index.core.tools import FunctionTool
-from auth0_ai.authorizers.async_authorization import AsyncAuthorizerParams
+from auth0_ai.authorizers.async_authorization import AsyncAuthorizerParams, CIBAPoller
 from auth0_ai.authorizers.token_vault_authorizer import TokenVaultAuthorizerParams
 from auth0_ai.authorizers.types import Auth0ClientParams
+from auth0_ai.http_pool import HttpPool
 from auth0_ai_llamaindex.async_authorization.async_authorizer import AsyncAuthorizer
 from auth0_ai_llamaindex.token_vault.token_vault_authorizer import TokenVaultAuthorizer
 from auth0_ai_llamaindex.context import set_ai_context
@@ -12,15 +13,37 @@ class Auth0AI:
     """Provides decorators to secure LlamaIndex tools using Auth0 authorization flows.
     """
 
-    def __init__(self, auth0: Optional[Auth0ClientParams] = None):
+    def __init__(
+        self,
+        auth0: Optional[Auth0ClientParams] = None,
+        http_pool: Optional[HttpPool] = None,
+        ciba_poller: Optional[CIBAPoller] = None,
+    ):
         """Initializes the Auth0AI instance.
 
         Args:
             auth0 (Optional[Auth0ClientParams]): Parameters for the Auth0 client.
                 If not provided, values will be automatically read from environment
                 variables: `AUTH0_DOMAIN`, `AUTH0_CLIENT_ID`, and `AUTH0_CLIENT_SECRET`.
+            http_pool (Optional[HttpPool]): Keep-alive HTTP sessions shared by every authorizer created by this
+                instance. Pass one to configure the pool size and keep-alive timeout; a default pool is created
+                otherwise, and closed by `close`.
+            ciba_poller (Optional[CIBAPoller]): Polls every pending async authorization request of the authorizers
+                created by this instance from a single task. A default poller is created otherwise.
         """
         self.auth0 = auth0
+        self.http_pool = http_pool or HttpPool()
+        self._owns_http_pool = http_pool is None
+        self.ciba_poller = ciba_poller or CIBAPoller()
+
+    async def close(self) -> None:
+        """Closes the HTTP sessions of the pool created by this instance, if it created one.
+
+        Sessions are also closed when their event loop shuts down; call this to release the connections of a
+        long-running loop, e.g. on application shutdown.
+        """
+        if self._owns_http_pool:
+            await self.http_pool.close()
 
     def with_token_vault(self, **params: TokenVaultAuthorizerParams) -> Callable[[FunctionTool], FunctionTool]:
         """Enables a tool to obtain an access token from a Token Vault identity provider (e.g., Google, Azure AD).
@@ -62,7 +85,7 @@ class Auth0AI:
             ```
         """
         authorizer = TokenVaultAuthorizer(
-            TokenVaultAuthorizerParams(**params), self.auth0)
+            TokenVaultAuthorizerParams(**params), self.auth0, self.http_pool)
         return authorizer.authorizer()
 
     def with_async_authorization(self, **params: AsyncAuthorizerParams) -> Callable[[FunctionTool], FunctionTool]:
@@ -111,7 +134,7 @@ class Auth0AI:
             )
             ```
         """
-        authorizer = AsyncAuthorizer(AsyncAuthorizerParams(**params), self.auth0)
+        authorizer = AsyncAuthorizer(AsyncAuthorizerParams(**params), self.auth0, self.http_pool, self.ciba_poller)
         return authorizer.authorizer()
 
 
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC
+from typing import Optional
 
 from auth0_ai.authorizers.token_vault_authorizer import (
     TokenVaultAuthorizerBase,
     TokenVaultAuthorizerParams,
 )
 from auth0_ai.authorizers.types import Auth0ClientParams
+from auth0_ai.http_pool import HttpPool
 from auth0_ai_llamaindex.utils.tool_wrapper import tool_wrapper
 from llama_index.core.tools import FunctionTool
 
@@ -16,8 +18,9 @@ class TokenVaultAuthorizer(TokenVaultAuthorizerBase, ABC):
         self,
         params: TokenVaultAuthorizerParams,
         auth0: Auth0ClientParams = None,
+        http_pool: Optional[HttpPool] = None,
     ):
-        super().__init__(params, auth0)
+        super().__init__(params, auth0, http_pool)
 
     def authorizer(self):
         def wrap_tool(tool: FunctionTool) -> FunctionTool:
@@ -1,3 +1,5 @@
 from .async_authorization_request import AsyncAuthorizationRequest as AsyncAuthorizationRequest
 from .async_authorizer_params import AsyncAuthorizerParams as AsyncAuthorizerParams
-from .async_authorizer_base import AsyncAuthorizerBase as AsyncAuthorizerBase
\ No newline at end of file
+from .async_authorizer_base import AsyncAuthorizerBase as AsyncAuthorizerBase
+from .ciba_notifications import CIBANotificationReceiver as CIBANotificationReceiver
+from .ciba_poller import CIBAPoller as CIBAPoller, CIBAPollerStats as CIBAPollerStats
@@ -1,4 +1,3 @@
-import asyncio
 import contextvars
 import hashlib
 import inspect
@@ -9,16 +8,19 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any, Callable, Dict, Generic, Optional, Sequence, TypedDict, Union
 from auth0 import Auth0Error
+from auth0.asyncify import asyncify
 from auth0.authentication.back_channel_login import BackChannelLogin
 from auth0.authentication.get_token import GetToken
 from auth0_ai.credentials import TokenResponse
+from auth0_ai.http_pool import HttpPool
 from auth0_ai.authorizers.async_authorization.async_authorizer_params import AsyncAuthorizerParams
 from auth0_ai.authorizers.async_authorization.async_authorization_request import AsyncAuthorizationRequest
+from auth0_ai.authorizers.async_authorization.ciba_poller import CIBAPoller
 from auth0_ai.authorizers.types import Auth0ClientParams, ToolInput
 from auth0_ai.interrupts.async_authorization_interrupts import AccessDeniedInterrupt, AuthorizationPendingInterrupt, AuthorizationPollingInterrupt, AuthorizationRequestExpiredInterrupt, InvalidGrantInterrupt, UserDoesNotHavePushNotificationsInterrupt
 from auth0_ai.stores import SubStore, InMemoryStore
 from auth0_ai.authorizers.context import ns_from_context, ContextGetter
-from auth0_ai.utils import omit
+from auth0_ai.utils import SingleFlight, omit
 
 class AsyncStorageValue(TypedDict):
     context: Any
@@ -60,7 +62,13 @@ def _ensure_openid_scope(scopes: list[str]) -> str:
     return " ".join(scopes)
 
 class AsyncAuthorizerBase(Generic[ToolInput]):
-    def __init__(self, params: AsyncAuthorizerParams[ToolInput], auth0: Auth0ClientParams = None):
+    def __init__(
+        self,
+        params: AsyncAuthorizerParams[ToolInput],
+        auth0: Auth0ClientParams = None,
+        http_pool: Optional[HttpPool] = None,
+        poller: Optional[CIBAPoller] = None,
+    ):
         auth0 = {
             "domain": (auth0 or {}).get("domain", os.getenv("AUTH0_DOMAIN")),
             "client_id": (auth0 or {}).get("client_id", os.getenv("AUTH0_CLIENT_ID")),
@@ -75,11 +83,24 @@ class AsyncAuthorizerBase(Generic[ToolInput]):
         # Remove keys with None values
         auth0 = {k: v for k, v in auth0.items() if v is not None}
 
-        self.back_channel_login = BackChannelLogin(**auth0)
-        self.get_token = GetToken(**auth0)
+        self.back_channel_login = asyncify(BackChannelLogin)(**auth0)
+        self.get_token = asyncify(GetToken)(**auth0)
+        self._http_pool = http_pool
+        self._poller = poller or CIBAPoller()
+        # Identical requests in flight (same authorize params and credentials context) share one
+        # auth_req_id, so the user gets a single notification for them.
+        self._starts = SingleFlight[AsyncAuthorizationRequest]()
+        # Polling stops once no tool call waits for the request anymore.
+        self._fetches = SingleFlight[TokenResponse](cancel_abandoned=True)
         self.auth0 = auth0
         self.params = params
 
+        # The client config is hashed once; each call only feeds its authorize params to a copy.
+        self._instance_digest = hashlib.blake2b(
+            json.dumps(omit(auth0, ["client_secret", "client_assertion_signing_key"]), sort_keys=True, separators=(",", ":")).encode("utf-8"),
+            digest_size=16
+        )
+
         # TODO: consider moving this to Auth0AI classes
         async_authorization_store = SubStore(params["store"] if "store" in params else InMemoryStore()).create_sub_store("AUTH0_AI_ASYNC_AUTHORIZATION")
 
@@ -95,12 +116,10 @@ class AsyncAuthorizerBase(Generic[ToolInput]):
         raise err
 
     def _get_instance_id(self, authorize_params) -> str:
-        props = {
-            "auth0": omit(self.auth0, ["client_secret", "client_assertion_signing_key"]),
-            "params": authorize_params
-        }
-        sh = json.dumps(props, sort_keys=True, separators=(",", ":"))
-        return hashlib.md5(sh.encode("utf-8")).hexdigest()
+        digest = self._instance_digest.copy()
+        for key in sorted(authorize_params):
+            digest.update(f"{key}\x1e{authorize_params[key]!r}\x1f".encode("utf-8"))
+        return digest.hexdigest()
 
     async def _get_authorize_params(self, *args: ToolInput.args, **kwargs: ToolInput.kwargs) -> Dict[str, Any]:
         authorize_params = {
@@ -141,7 +160,13 @@ class AsyncAuthorizerBase(Generic[ToolInput]):
         requested_at = time.time()
 
         try:
-            response = self.back_channel_login.back_channel_login(**authorize_params)
+            notifications = self._poller.notifications
+            if notifications is not None and notifications.client_notification_token is not None:
+                # Ping mode: the authorization server notifies the client notification endpoint with this token.
+                authorize_params = {**authorize_params, "client_notification_token": notifications.client_notification_token}
+
+            self._bind_http_pool(self.back_channel_login)
+            response = await self.back_channel_login.back_channel_login_async(**authorize_params)
             return AsyncAuthorizationRequest(
                 id=response["auth_req_id"],
                 requested_at=requested_at,
@@ -179,7 +204,11 @@ class AsyncAuthorizerBase(Generic[ToolInput]):
             # If the retry-after value is not a valid integer, return None
             return None
 
-    def _get_credentials_internal(self, auth_request: AsyncAuthorizationRequest) -> TokenResponse | None:
+    def _bind_http_pool(self, client) -> None:
+        if self._http_pool is not None:
+            self._http_pool.bind(client, self.auth0["domain"])
+
+    async def _get_credentials_internal(self, auth_request: AsyncAuthorizationRequest) -> TokenResponse | None:
         try:
             # Calculate elapsed time in seconds
             elapsed_seconds = datetime.now().timestamp() - auth_request["requested_at"]
@@ -190,7 +219,8 @@ class AsyncAuthorizerBase(Generic[ToolInput]):
                     auth_request
                 )
 
-            response = self.get_token.backchannel_login(auth_req_id=auth_request["id"])
+            self._bind_http_pool(self.get_token)
+            response = await self.get_token.backchannel_login_async(auth_req_id=auth_request["id"])
             return TokenResponse(
                 access_token=response["access_token"],
                 expires_in=response["expires_in"],
@@ -219,26 +249,35 @@ class AsyncAuthorizerBase(Generic[ToolInput]):
 
             raise
 
-    def _get_credentials(self, auth_request: AsyncAuthorizationRequest) -> TokenResponse | None:
-        return self._get_credentials_internal(auth_request)
+    async def _get_credentials(self, auth_request: AsyncAuthorizationRequest) -> TokenResponse | None:
+        return await self._fetches.do(auth_request["id"], lambda: self._get_credentials_internal(auth_request))
 
     async def get_credentials_polling(self, auth_request: AsyncAuthorizationRequest) -> TokenResponse | None:
-        credentials: TokenResponse | None = None
-
-        while not credentials:
-            try:
-                credentials = self._get_credentials_internal(auth_request)
-            except (AuthorizationPendingInterrupt, AuthorizationPollingInterrupt) as err:
-                await asyncio.sleep(err.next_retry_interval())
-            except Exception:
-                raise
+        return await self._fetches.do(
+            auth_request["id"],
+            lambda: self._poller.poll(auth_request, self._get_credentials_internal, self.auth0.get("domain"))
+        )
+
+    async def _start_or_attach(self, authorize_params, pending_auth_request_ns: Sequence[str]) -> AsyncAuthorizationRequest:
+        """
+        Return the pending authorization request started for the same authorize params and
+        credentials context, or start a new one. Concurrent callers share a single start.
+        """
+        async def start_or_attach() -> AsyncAuthorizationRequest:
+            auth_request = await self.auth_request_store.get(pending_auth_request_ns, "auth_request")
+            if not auth_request:
+                auth_request = await self._start(authorize_params)
+                await self.auth_request_store.put(pending_auth_request_ns, "auth_request", auth_request)
+            return auth_request
 
-        return credentials
+        return await self._starts.do(tuple(pending_auth_request_ns), start_or_attach)
 
     async def delete_auth_request(self):
         local_store = _get_local_storage()
-        auth_request_ns = local_store["auth_request_ns"]
-        await self.auth_request_store.delete(auth_request_ns, "auth_request")
+        await self.auth_request_store.mdelete([
+            (local_store["auth_request_ns"], "auth_request"),
+            (local_store["pending_auth_request_ns"], "auth_request"),
+        ])
 
     def protect(
         self,
@@ -249,12 +288,15 @@ class AsyncAuthorizerBase(Generic[ToolInput]):
             context = get_context(*args, **kwargs)
             authorize_params = await self._get_authorize_params(*args, **kwargs)
             instance_id = self._get_instance_id(authorize_params)
+            credentials_context_ns = ns_from_context(self.params.get("credentials_context", "tool-call"), context)
             auth_request_ns = [instance_id, "auth_requests", *ns_from_context("tool-call", context)]
-            credentials_ns = [instance_id, "credentials", *ns_from_context(self.params.get("credentials_context", "tool-call"), context)]
+            pending_auth_request_ns = [instance_id, "pending_auth_requests", *credentials_context_ns]
+            credentials_ns = [instance_id, "credentials", *credentials_context_ns]
 
             local_store = {
                 "context": context,
                 "auth_request_ns": auth_request_ns,
+                "pending_auth_request_ns": pending_auth_request_ns,
             }
 
             async with _run_with_local_storage(local_store):
@@ -267,13 +309,13 @@ class AsyncAuthorizerBase(Generic[ToolInput]):
                             auth_request = await self.auth_request_store.get(auth_request_ns, "auth_request")
                             if not auth_request:
                                 # initial request
-                                auth_request = await self._start(authorize_params)
+                                auth_request = await self._start_or_attach(authorize_params, pending_auth_request_ns)
                                 await self.auth_request_store.put(auth_request_ns, "auth_request", auth_request)
 
-                            credentials = self._get_credentials(auth_request)
+                            credentials = await self._get_credentials(auth_request)
                         else:
                             # block mode
-                            auth_request = await self._start(authorize_params)
+                            auth_request = await self._start_or_attach(authorize_params, pending_auth_request_ns)
                             credentials = await self.get_credentials_polling(auth_request)
 
                         await self.delete_auth_request()
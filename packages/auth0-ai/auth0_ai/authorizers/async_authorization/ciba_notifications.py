@@ -0,0 +1,77 @@
+import hmac
+from typing import Callable, List, Optional
+
+NotificationListener = Callable[[str], None]
+
+class CIBANotificationReceiver:
+    """
+    Receives CIBA ping-mode notifications and forwards the `auth_req_id` of each completed
+    authorization request to its listeners (e.g. a CIBAPoller or a GraphResumer), which then
+    fetch the token once instead of waiting for their next poll.
+
+    The receiver doesn't serve HTTP itself: call `notify` (or `handle`) from the route registered
+    as the client notification endpoint.
+    """
+
+    def __init__(self, client_notification_token: Optional[str] = None):
+        """
+        Initialize the CIBANotificationReceiver.
+
+        Args:
+            client_notification_token (str, optional): The bearer token the authorization server sends
+                with every notification. When set, `handle` rejects notifications without it.
+        """
+        self._client_notification_token = client_notification_token
+        self._listeners: List[NotificationListener] = []
+
+    @property
+    def client_notification_token(self) -> Optional[str]:
+        """
+        The bearer token the authorization server is asked to send with every notification.
+        """
+        return self._client_notification_token
+
+    def subscribe(self, listener: NotificationListener) -> Callable[[], None]:
+        """
+        Register a listener called with the `auth_req_id` of every notification.
+
+        Returns:
+            Callable[[], None]: Unsubscribes the listener.
+        """
+        self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return unsubscribe
+
+    def notify(self, auth_req_id: str) -> None:
+        """
+        Mark the authorization request `auth_req_id` as ready to be redeemed.
+        """
+        for listener in list(self._listeners):
+            listener(auth_req_id)
+
+    def handle(self, body: dict, authorization: Optional[str] = None) -> bool:
+        """
+        Handle a ping callback request.
+
+        Args:
+            body (dict): The JSON body of the callback, holding the `auth_req_id`.
+            authorization (str, optional): The value of the request's Authorization header.
+
+        Returns:
+            bool: Whether the notification was accepted.
+        """
+        if self._client_notification_token is not None:
+            expected = f"Bearer {self._client_notification_token}"
+            if authorization is None or not hmac.compare_digest(authorization.encode(), expected.encode()):
+                return False
+
+        auth_req_id = body.get("auth_req_id") if isinstance(body, dict) else None
+        if not isinstance(auth_req_id, str) or not auth_req_id:
+            return False
+
+        self.notify(auth_req_id)
+        return True
@@ -0,0 +1,337 @@
+import asyncio
+import heapq
+import itertools
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypedDict
+from auth0_ai.authorizers.async_authorization.async_authorization_request import AsyncAuthorizationRequest
+from auth0_ai.authorizers.async_authorization.ciba_notifications import CIBANotificationReceiver
+from auth0_ai.credentials import TokenResponse
+from auth0_ai.interrupts.async_authorization_interrupts import AuthorizationPendingInterrupt, AuthorizationPollingInterrupt
+from auth0_ai.utils import call_soon_in_loop
+
+CredentialsFetcher = Callable[[AsyncAuthorizationRequest], Awaitable[TokenResponse]]
+
+class CIBAPollerStats(TypedDict):
+    """
+    Polling counters of a CIBAPoller, per Auth0 domain.
+
+    Attributes:
+        pending (int): The number of authorization requests being polled.
+        polls_per_second (float): The effective rate of token requests over the last minute or so.
+        slow_down_ratio (float): Moving average of the share of polls answered with slow_down.
+        backoff (float): The factor currently applied to every poll interval (1.0 when not throttled).
+    """
+    pending: int
+    polls_per_second: float
+    slow_down_ratio: float
+    backoff: float
+
+class _DomainThrottle:
+    """
+    Tracks how often a domain's token endpoint answers slow_down and derives a backoff factor
+    shared by all the requests polled against it: doubled on every slow_down, decayed back
+    towards 1 on every other response.
+    """
+    __slots__ = ("backoff", "slow_down_ratio", "_window_start", "_window_polls", "_previous_polls")
+
+    WINDOW = 30.0
+
+    def __init__(self):
+        self.backoff = 1.0
+        self.slow_down_ratio = 0.0
+        self._window_start = time.monotonic()
+        self._window_polls = 0
+        self._previous_polls = 0
+
+    def _roll(self, now: float) -> None:
+        elapsed = now - self._window_start
+        if elapsed >= self.WINDOW:
+            self._previous_polls = self._window_polls if elapsed < 2 * self.WINDOW else 0
+            self._window_polls = 0
+            self._window_start = now - elapsed % self.WINDOW
+
+    def record(self, slow_down: bool, max_backoff: float) -> None:
+        self._roll(time.monotonic())
+        self._window_polls += 1
+        self.slow_down_ratio += 0.1 * ((1.0 if slow_down else 0.0) - self.slow_down_ratio)
+        self.backoff = min(self.backoff * 2, max_backoff) if slow_down else max(1.0, self.backoff * 0.9)
+
+    def polls_per_second(self) -> float:
+        now = time.monotonic()
+        self._roll(now)
+        # Sliding window approximated from the current and the previous fixed window.
+        in_window = (now - self._window_start) / self.WINDOW
+        return (self._previous_polls * (1 - in_window) + self._window_polls) / self.WINDOW
+
+class _LoopPolls:
+    """
+    The pending polls of one event loop and the scheduler task sending them. asyncio primitives
+    and futures are bound to a single loop, so each loop using the poller gets its own.
+    """
+    __slots__ = ("heap", "wakeup", "semaphore", "tasks", "by_id", "scheduler")
+
+    def __init__(self, max_concurrency: int):
+        self.heap: list[tuple[float, int, _PendingPoll]] = []
+        self.wakeup = asyncio.Event()
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.tasks: set[asyncio.Task] = set()
+        self.by_id: Dict[str, set[_PendingPoll]] = {}
+        self.scheduler: Optional[asyncio.Task] = None
+
+    def scheduled(self) -> list["_PendingPoll"]:
+        return [pending for due, _, pending in list(self.heap) if not pending.future.done() and pending.due == due]
+
+class _PendingPoll:
+    __slots__ = ("loop_polls", "auth_request", "fetch", "future", "domain", "due", "notified", "interval_increase")
+
+    def __init__(
+        self,
+        loop_polls: _LoopPolls,
+        auth_request: AsyncAuthorizationRequest,
+        fetch: CredentialsFetcher,
+        future: asyncio.Future,
+        domain: Optional[str]
+    ):
+        self.loop_polls = loop_polls
+        self.auth_request = auth_request
+        self.fetch = fetch
+        self.future = future
+        self.domain = domain
+        # The time of the heap entry that is current (older ones are skipped), None while in flight.
+        self.due: Optional[float] = None
+        self.notified = False
+        # Added to the request's interval for good after every slow_down.
+        self.interval_increase = 0.0
+
+class CIBAPoller:
+    """
+    Polls the token endpoint for every pending async authorization (CIBA) request from a single
+    scheduler task, instead of one sleep loop per waiting tool call.
+
+    Pending requests sit in a heap ordered by their next poll time. Due polls are sent with at most
+    `max_concurrency` requests in flight, and each request's future is resolved with its credentials
+    (or the interrupt that ended it) once the user approves or denies it, or it expires.
+
+    The poller can be shared by several event loops (e.g. a web app running each request in its own
+    loop): each loop has its own scheduler, and `max_concurrency` applies per loop.
+
+    When the token endpoint answers slow_down, the interval of that request grows by `slow_down_increase`
+    for all its later polls, as CIBA requires. On top of that, the poll intervals of all the requests
+    against the same domain are backed off together, with jitter, and recover as the throttling stops.
+    A request is never polled sooner than its own interval (or Retry-After).
+
+    With a CIBANotificationReceiver, a request is polled as soon as its ping notification arrives,
+    and otherwise only every `fallback_interval` seconds, in case a notification is lost.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        max_backoff: float = 8.0,
+        jitter: float = 0.2,
+        notifications: Optional[CIBANotificationReceiver] = None,
+        fallback_interval: float = 60.0,
+        slow_down_increase: float = 5.0,
+    ):
+        """
+        Initialize the CIBAPoller.
+
+        Args:
+            max_concurrency (int): Maximum number of token requests in flight at once. Defaults to 10.
+            max_backoff (float): Maximum factor applied to poll intervals while a domain is throttled. Defaults to 8.
+            jitter (float): Poll intervals are stretched by a random fraction up to this value so that requests
+                started together don't keep polling in lockstep. Defaults to 0.2.
+            notifications (CIBANotificationReceiver, optional): Receiver of ping-mode notifications.
+            fallback_interval (float): Seconds between polls of a pending request when `notifications` is set.
+                Defaults to 60s.
+            slow_down_increase (float): Seconds added to a request's poll interval, for good, every time it is
+                answered with slow_down. Defaults to 5s, the minimum required by CIBA.
+        """
+        self._max_concurrency = max_concurrency
+        self._max_backoff = max_backoff
+        self._jitter = jitter
+        self._slow_down_increase = slow_down_increase
+        self._fallback_interval = fallback_interval if notifications is not None else None
+        self._counter = itertools.count()
+        self._throttles: Dict[Optional[str], _DomainThrottle] = {}
+        self._loops: Dict[asyncio.AbstractEventLoop, _LoopPolls] = {}
+        self._loops_lock = threading.Lock()
+        self._notifications = notifications
+
+        if notifications is not None:
+            notifications.subscribe(self.notify)
+
+    @property
+    def notifications(self) -> Optional[CIBANotificationReceiver]:
+        """
+        The receiver of ping-mode notifications, if any.
+        """
+        return self._notifications
+
+    def poll(
+        self,
+        auth_request: AsyncAuthorizationRequest,
+        fetch: CredentialsFetcher,
+        domain: Optional[str] = None
+    ) -> asyncio.Future:
+        """
+        Poll `auth_request` until it completes.
+
+        Args:
+            auth_request (AsyncAuthorizationRequest): The pending authorization request.
+            fetch (Callable): Requests the credentials once. It raises AuthorizationPendingInterrupt or
+                AuthorizationPollingInterrupt while the request is still pending.
+            domain (str, optional): The Auth0 domain polled, whose slow_down responses are tracked together.
+
+        Returns:
+            asyncio.Future[TokenResponse]: Resolved with the credentials, or with the exception that ended the
+            request. Cancelling it stops polling the request.
+        """
+        loop = asyncio.get_running_loop()
+        loop_polls = self._loops.get(loop)
+        if loop_polls is None:
+            with self._loops_lock:
+                # Loops closed while they still had polls (e.g. never awaited) are dropped here.
+                for closed in [other for other in self._loops if other.is_closed()]:
+                    del self._loops[closed]
+                loop_polls = self._loops[loop] = _LoopPolls(self._max_concurrency)
+
+        future = loop.create_future()
+        pending = _PendingPoll(loop_polls, auth_request, fetch, future, domain)
+        loop_polls.by_id.setdefault(auth_request["id"], set()).add(pending)
+        future.add_done_callback(lambda _: self._forget(pending))
+        self._schedule(pending, time.monotonic())
+        return future
+
+    def _forget(self, pending: _PendingPoll) -> None:
+        loop_polls = pending.loop_polls
+        polls = loop_polls.by_id.get(pending.auth_request["id"])
+        if polls is not None:
+            polls.discard(pending)
+            if not polls:
+                del loop_polls.by_id[pending.auth_request["id"]]
+
+        if not loop_polls.by_id:
+            # Idle: release the loop. Its scheduler exits once the remaining heap entries, all stale, are popped.
+            loop = pending.future.get_loop()
+            with self._loops_lock:
+                if self._loops.get(loop) is loop_polls:
+                    del self._loops[loop]
+
+    def notify(self, auth_req_id: str) -> None:
+        """
+        Poll the authorization request `auth_req_id` now, e.g. when its ping notification is received.
+        Can be called from any thread.
+        """
+        with self._loops_lock:
+            loops = list(self._loops.items())
+        for loop, loop_polls in loops:
+            call_soon_in_loop(loop, self._wake, loop_polls, auth_req_id)
+
+    def _wake(self, loop_polls: _LoopPolls, auth_req_id: str) -> None:
+        now = time.monotonic()
+        for pending in list(loop_polls.by_id.get(auth_req_id, ())):
+            if pending.due is None:
+                # In flight: poll again as soon as it returns.
+                pending.notified = True
+            elif pending.due > now:
+                self._schedule(pending, now)
+
+    def _schedule(self, pending: _PendingPoll, due: float) -> None:
+        loop_polls = pending.loop_polls
+        pending.due = due
+        heapq.heappush(loop_polls.heap, (due, next(self._counter), pending))
+        loop_polls.wakeup.set()
+        if loop_polls.scheduler is None or loop_polls.scheduler.done():
+            loop_polls.scheduler = asyncio.ensure_future(self._run(loop_polls))
+
+    async def _run(self, loop_polls: _LoopPolls) -> None:
+        heap = loop_polls.heap
+        while heap:
+            now = time.monotonic()
+            while heap and heap[0][0] <= now:
+                due, _, pending = heapq.heappop(heap)
+                if pending.future.done() or pending.due != due:
+                    continue
+
+                pending.due = None
+                await loop_polls.semaphore.acquire()
+                task = asyncio.ensure_future(self._poll_once(pending))
+                loop_polls.tasks.add(task)
+                task.add_done_callback(loop_polls.tasks.discard)
+
+            if not heap:
+                break
+
+            loop_polls.wakeup.clear()
+            try:
+                await asyncio.wait_for(loop_polls.wakeup.wait(), heap[0][0] - time.monotonic())
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll_once(self, pending: _PendingPoll) -> None:
+        try:
+            credentials = await pending.fetch(pending.auth_request)
+        except (AuthorizationPendingInterrupt, AuthorizationPollingInterrupt) as err:
+            slow_down = isinstance(err, AuthorizationPollingInterrupt)
+            if slow_down:
+                pending.interval_increase += self._slow_down_increase
+            throttle = self._throttle(pending.domain)
+            throttle.record(slow_down, self._max_backoff)
+            if not pending.future.done():
+                if pending.notified:
+                    delay = 0.0
+                else:
+                    interval = max(err.next_retry_interval(), pending.auth_request["interval"] + pending.interval_increase)
+                    delay = interval * throttle.backoff * (1 + random.uniform(0, self._jitter))
+                    if self._fallback_interval is not None:
+                        delay = max(delay, self._fallback_interval)
+                pending.notified = False
+                self._schedule(pending, time.monotonic() + delay)
+        except Exception as err:
+            self._throttle(pending.domain).record(False, self._max_backoff)
+            if not pending.future.done():
+                pending.future.set_exception(err)
+        else:
+            self._throttle(pending.domain).record(False, self._max_backoff)
+            if not pending.future.done():
+                pending.future.set_result(credentials)
+        finally:
+            pending.loop_polls.semaphore.release()
+
+    def _throttle(self, domain: Optional[str]) -> _DomainThrottle:
+        throttle = self._throttles.get(domain)
+        if throttle is None:
+            throttle = self._throttles[domain] = _DomainThrottle()
+        return throttle
+
+    def _all_loop_polls(self) -> list[_LoopPolls]:
+        with self._loops_lock:
+            return list(self._loops.values())
+
+    def pending(self) -> int:
+        """
+        Return the number of authorization requests being polled, across every event loop.
+        """
+        return sum(len(loop_polls.scheduled()) + len(loop_polls.tasks) for loop_polls in self._all_loop_polls())
+
+    def stats(self) -> Dict[Optional[str], CIBAPollerStats]:
+        """
+        Return the polling counters, per Auth0 domain.
+        """
+        pending: Dict[Optional[str], int] = {}
+        for loop_polls in self._all_loop_polls():
+            for poll in loop_polls.scheduled():
+                pending[poll.domain] = pending.get(poll.domain, 0) + 1
+
+        return {
+            domain: CIBAPollerStats(
+                pending=pending.get(domain, 0),
+                polls_per_second=throttle.polls_per_second(),
+                slow_down_ratio=throttle.slow_down_ratio,
+                backoff=throttle.backoff,
+            )
+            for domain, throttle in list(self._throttles.items())
+        }
@@ -21,16 +21,18 @@ def ns_from_context(auth_context: AuthContext, call_context: ToolCallContext) ->
     Returns:
         list[str]: A list of namespace components.
     """
-    thread_ns = ["threads", call_context["thread_id"]]
-    tool_ns = ["tools", call_context["tool_name"]]
-    tool_call_ns = ["tool_calls", call_context["tool_call_id"]]
-
+    # Only the keys the auth context needs are read, so e.g. a thread-level namespace
+    # can be resolved from a context holding just the thread_id.
     match auth_context:
         case "tool-call":
-            return thread_ns + tool_ns + tool_call_ns
+            return [
+                "threads", call_context["thread_id"],
+                "tools", call_context["tool_name"],
+                "tool_calls", call_context["tool_call_id"]
+            ]
         case "tool":
-            return thread_ns + tool_ns
+            return ["threads", call_context["thread_id"], "tools", call_context["tool_name"]]
         case "thread":
-            return thread_ns
+            return ["threads", call_context["thread_id"]]
         case "agent":
             return []
@@ -1,19 +1,23 @@
+import asyncio
 import contextvars
+import functools
 import hashlib
 import inspect
 import json
 import os
-from contextlib import asynccontextmanager
-from typing import Awaitable, Callable, Generic, Optional, Any, TypedDict, Union
+import time
+from typing import Awaitable, Callable, Generic, Iterable, Optional, Any, TypedDict, Union
 from auth0 import Auth0Error
+from auth0.asyncify import asyncify
 from auth0.authentication.get_token import GetToken
-from auth0_ai.authorizers.context import AuthContext, ContextGetter, ns_from_context
+from auth0_ai.authorizers.context import AuthContext, ContextGetter, ToolCallContext, ns_from_context
 from auth0_ai.authorizers.types import Auth0ClientParams, AuthorizerToolParameter, ToolInput
 from auth0_ai.credentials import TokenResponse
+from auth0_ai.http_pool import HttpPool
 from auth0_ai.interrupts.auth0_interrupt import Auth0Interrupt
 from auth0_ai.interrupts.token_vault_interrupt import TokenVaultError, TokenVaultInterrupt
 from auth0_ai.stores import Store, SubStore, InMemoryStore
-from auth0_ai.utils import omit
+from auth0_ai.utils import SingleFlight, omit
 
 # Subject / requested token type constants
 SUBJECT_TYPE_REFRESH_TOKEN = "urn:ietf:params:oauth:token-type:refresh_token"
@@ -41,15 +45,26 @@ def _update_local_storage(data: AsyncStorageValue) -> None:
     updated.update(data)
     _local_storage.set(updated)
 
-@asynccontextmanager
-async def _run_with_local_storage(data: AsyncStorageValue):
-    if _local_storage.get() is not None:
-        raise RuntimeError("Cannot nest tool calls that require Token Vault authorization.")
-    token = _local_storage.set(data)
-    try:
-        yield
-    finally:
-        _local_storage.reset(token)
+class _LocalStorageScope:
+    # A plain class rather than @asynccontextmanager: it is entered on every protected call.
+    __slots__ = ("_data", "_token")
+
+    def __init__(self, data: AsyncStorageValue):
+        self._data = data
+
+    def __enter__(self):
+        if _local_storage.get() is not None:
+            raise RuntimeError("Cannot nest tool calls that require Token Vault authorization.")
+        self._token = _local_storage.set(self._data)
+
+    def __exit__(self, *exc_info):
+        _local_storage.reset(self._token)
+
+@functools.lru_cache(maxsize=1024)
+def _scope_set(scope: str) -> frozenset[str]:
+    # Granted scopes are stored as sorted lists, so a given grant always maps to the same string and
+    # its set is only built once.
+    return frozenset(scope.split())
 
 def get_credentials_from_token_vault() -> TokenResponse | None:
     store = _get_local_storage()
@@ -76,7 +91,9 @@ class TokenVaultAuthorizerParams(Generic[ToolInput]):
         ]] = None,
         login_hint: Optional[str] = None,
         store: Optional[Store] = None,
-        credentials_context: Optional[AuthContext] = "thread"
+        credentials_context: Optional[AuthContext] = "thread",
+        refresh_ahead: Optional[float] = None,
+        negative_cache_ttl_ms: Optional[int] = None
     ):
         """
         Parameters for the Token Vault authorizer.
@@ -97,6 +114,13 @@ class TokenVaultAuthorizerParams(Generic[ToolInput]):
                 - "agent": Credentials are shared globally across all threads and tools in the agent.
                 - "tool": Credentials are shared across multiple calls to the same tool within the same thread.
                 - "tool-call": Credentials are valid only for a single invocation of the tool.
+            refresh_ahead: Optional. Fraction of the credentials lifetime (e.g. 0.8) after which a tool call
+                re-exchanges them in the background, so calls keep using the cached credentials instead of waiting
+                for an exchange once they expire. Disabled by default.
+            negative_cache_ttl_ms: Optional. Milliseconds during which an exchange rejected by Auth0 (e.g. the user has
+                not linked the connection) is remembered for that subject token, so retries raise the same interrupt
+                without calling the token endpoint. Keep it short: a user who completes authorization meanwhile is
+                only picked up once it lapses. Disabled by default.
         """
         def wrap(val, result_type):
             if isinstance(val, AuthorizerToolParameter):
@@ -109,14 +133,19 @@ class TokenVaultAuthorizerParams(Generic[ToolInput]):
         self.login_hint = login_hint
         self.store = store
         self.credentials_context = credentials_context
+        self.refresh_ahead = refresh_ahead
+        self.negative_cache_ttl_ms = negative_cache_ttl_ms
 
 class TokenVaultAuthorizerBase(Generic[ToolInput]):
     def __init__(
         self,
         params: TokenVaultAuthorizerParams[ToolInput],
         config: Auth0ClientParams = None,
+        http_pool: Optional[HttpPool] = None,
     ):
         self.params = params
+        self._http_pool = http_pool
+        self._required_scopes = frozenset(params.scopes)
         auth0 = {
             "domain": (config or {}).get("domain", os.getenv("AUTH0_DOMAIN")),
             "client_id": (config or {}).get("client_id", os.getenv("AUTH0_CLIENT_ID")),
@@ -130,17 +159,35 @@ class TokenVaultAuthorizerBase(Generic[ToolInput]):
 
         # Remove keys with None values
         self.auth0 = {k: v for k, v in auth0.items() if v is not None}
-        self.get_token = GetToken(**self.auth0)
+        self.get_token = asyncify(GetToken)(**self.auth0)
 
         # TODO: consider moving this to Auth0AI classes
         sub_store = SubStore(params.store or InMemoryStore()).create_sub_store("AUTH0_AI_TOKEN_VAULT")
-        instance_id = self._get_instance_id()
-        
+        self.instance_id = self._get_instance_id()
+        connection_id = self._get_connection_id()
+
         self.credentials_store = SubStore[TokenResponse](sub_store, {
-            "base_namespace": [instance_id, "credentials"],
+            "base_namespace": [self.instance_id, "credentials"],
             "get_ttl": lambda credential: credential["expires_in"] * 1000 if "expires_in" in credential else None
         })
 
+        # Credentials of every authorizer on the same connection, in a single entry per credentials
+        # namespace mapping their granted scopes to the token and its absolute expiry, so an authorizer
+        # can find a token obtained by another one that covers the scopes it requires with one read.
+        self.connection_credentials_store = SubStore[dict](sub_store, {
+            "base_namespace": [connection_id, "connection_credentials"]
+        })
+
+        # Exchanges rejected by Auth0, keyed by a digest of the subject token.
+        self.failed_exchanges_store = SubStore[dict](sub_store, {
+            "base_namespace": [connection_id, "failed_exchanges"]
+        })
+        self._exchanges = SingleFlight[TokenResponse]()
+        self._background_refreshes: set[asyncio.Task] = set()
+
+        if params.refresh_ahead is not None and not 0 < params.refresh_ahead < 1:
+            raise ValueError("refresh_ahead must be between 0 and 1.")
+
         has_refresh = params.refresh_token.value is not None
         has_access = params.access_token.value is not None
 
@@ -163,7 +210,16 @@ class TokenVaultAuthorizerBase(Generic[ToolInput]):
     def _get_instance_id(self) -> str:
         props = {
             "auth0": omit(self.auth0, ["client_secret", "client_assertion_signing_key"]),
-            "params": omit(self.params, ["store", "refresh_token", "access_token", "login_hint"])
+            "params": omit(self.params, ["store", "refresh_token", "access_token", "login_hint", "refresh_ahead", "negative_cache_ttl_ms"])
+        }
+        sh = json.dumps(props, sort_keys=True, separators=(",", ":"))
+        return hashlib.md5(sh.encode("utf-8")).hexdigest()
+
+    def _get_connection_id(self) -> str:
+        props = {
+            "auth0": omit(self.auth0, ["client_secret", "client_assertion_signing_key"]),
+            "connection": self.params.connection,
+            "login_hint": self.params.login_hint
         }
         sh = json.dumps(props, sort_keys=True, separators=(",", ":"))
         return hashlib.md5(sh.encode("utf-8")).hexdigest()
@@ -182,11 +238,12 @@ class TokenVaultAuthorizerBase(Generic[ToolInput]):
             )
 
         current_scopes = token_response["scope"]
-        missing_scopes = [s for s in scopes if s not in current_scopes]
         _update_local_storage({"current_scopes": current_scopes})
 
-        if missing_scopes:
-            granted_union = sorted(set(current_scopes) | set(scopes))
+        granted = _scope_set(" ".join(current_scopes))
+        if not self._required_scopes <= granted:
+            missing_scopes = [s for s in scopes if s not in granted]
+            granted_union = sorted(granted | self._required_scopes)
             raise TokenVaultInterrupt(
                 f"Authorization required to access the Token Vault connection: {connection}. Missing scopes: {', '.join(missing_scopes)}",
                 connection,
@@ -198,19 +255,17 @@ class TokenVaultAuthorizerBase(Generic[ToolInput]):
         store = _get_local_storage()
         connection = store["connection"]
 
-        refresh_supplied = self.params.refresh_token.value is not None
-
-        subject_token_type: str
-        if refresh_supplied:
-            subject_token_type = SUBJECT_TYPE_REFRESH_TOKEN
-            subject_token = await self.get_refresh_token(*args, **kwargs)
-        else:
-            subject_token_type = SUBJECT_TYPE_ACCESS_TOKEN
-            subject_token = await self.get_user_access_token(*args, **kwargs)
-
+        subject_token_type, subject_token = await self._get_subject_token(*args, **kwargs)
         if not subject_token:
             return None
 
+        negative_cache = self.params.negative_cache_ttl_ms is not None
+        if negative_cache:
+            subject_digest = self._subject_digest(subject_token)
+            failure = await self.failed_exchanges_store.get([], subject_digest)
+            if failure is not None:
+                raise TokenVaultError(failure["message"])
+
         # login_hint optionally applied to both refresh and access token exchange paths
         login_hint = self.params.login_hint
         try:
@@ -222,17 +277,144 @@ class TokenVaultAuthorizerBase(Generic[ToolInput]):
             )
             if login_hint:
                 request_kwargs["login_hint"] = login_hint
-            response = self.get_token.access_token_for_connection(**request_kwargs)
+            if self._http_pool is not None:
+                self._http_pool.bind(self.get_token, self.auth0["domain"])
+            response = await self.get_token.access_token_for_connection_async(**request_kwargs)
+            if negative_cache:
+                # A failure recorded meanwhile (e.g. by a concurrent exchange) no longer holds.
+                await self.failed_exchanges_store.delete([], subject_digest)
             return TokenResponse(
                 access_token=response["access_token"],
                 expires_in=response["expires_in"],
-                scope=response.get("scope", "").split(),
+                scope=sorted(set(response.get("scope", "").split())),
                 token_type=response.get("token_type"),
                 id_token=response.get("id_token"),
                 refresh_token=response.get("refresh_token"),
             )
         except Auth0Error as err:
-            raise TokenVaultError(err.message) if 400 <= err.status_code <= 499 else err
+            if not 400 <= err.status_code <= 499:
+                raise
+            if negative_cache:
+                await self.failed_exchanges_store.put(
+                    [], subject_digest, {"message": err.message}, {"expires_in": self.params.negative_cache_ttl_ms}
+                )
+            raise TokenVaultError(err.message)
+
+    async def _exchange_and_store(self, credentials_ns: list[str], *args: ToolInput.args, **kwargs: ToolInput.kwargs) -> TokenResponse:
+        credentials = await self.get_access_token_impl(*args, **kwargs)
+        self.validate_token(credentials)
+        await self.credentials_store.put(credentials_ns, "credential", credentials)
+        if credentials.get("scope"):
+            await self._index_connection_credentials(credentials_ns, credentials)
+        return credentials
+
+    async def _index_connection_credentials(self, credentials_ns: list[str], credentials: TokenResponse) -> None:
+        # Concurrent writers on a shared store may drop each other's entries; that only costs an exchange.
+        now = time.time() * 1000
+        index = await self.connection_credentials_store.get(credentials_ns, "by_scopes") or {}
+        index = {
+            scopes: entry for scopes, entry in index.items()
+            if entry["expires_at"] is None or entry["expires_at"] > now
+        }
+        index[" ".join(credentials["scope"])] = {
+            "credentials": credentials,
+            "expires_at": now + credentials["expires_in"] * 1000 if credentials.get("expires_in") else None,
+        }
+
+        await self._put_connection_credentials(credentials_ns, index, now)
+
+    async def _put_connection_credentials(self, credentials_ns: list[str], index: dict, now: float) -> None:
+        # The index lives as long as its longest-lived entry.
+        expirations = [entry["expires_at"] for entry in index.values()]
+        expires_in = None if None in expirations else max(expirations) - now
+        await self.connection_credentials_store.put(
+            credentials_ns, "by_scopes", index, {"expires_in": expires_in} if expires_in is not None else None
+        )
+
+    async def _discard_credentials(self, credentials_ns: list[str], credentials: Optional[TokenResponse]) -> None:
+        await self.credentials_store.delete(credentials_ns, "credential")
+        if not credentials:
+            return
+
+        # Other authorizers on the connection must not reuse the rejected token either.
+        index = await self.connection_credentials_store.get(credentials_ns, "by_scopes")
+        if not index:
+            return
+        kept = {
+            scopes: entry for scopes, entry in index.items()
+            if entry["credentials"]["access_token"] != credentials["access_token"]
+        }
+        if len(kept) == len(index):
+            return
+        if kept:
+            await self._put_connection_credentials(credentials_ns, kept, time.time() * 1000)
+        else:
+            await self.connection_credentials_store.delete(credentials_ns, "by_scopes")
+
+    async def _find_connection_credentials(self, credentials_ns: list[str]) -> TokenResponse | None:
+        index = await self.connection_credentials_store.get(credentials_ns, "by_scopes")
+        if not index:
+            return None
+
+        now = time.time() * 1000
+        for scopes, entry in index.items():
+            if not self._required_scopes <= _scope_set(scopes):
+                continue
+
+            credentials = entry["credentials"]
+            if entry["expires_at"] is not None:
+                # Cache the token for this authorizer only for what is left of its lifetime.
+                ttl = entry["expires_at"] - now
+                if ttl < 1000:
+                    continue
+                credentials = {**credentials, "expires_in": int(ttl // 1000)}
+            return credentials
+
+        return None
+
+    async def _get_or_exchange(self, credentials_ns: list[str], *args: ToolInput.args, **kwargs: ToolInput.kwargs) -> TokenResponse:
+        credentials = await self._find_connection_credentials(credentials_ns)
+        if credentials is None:
+            return await self._exchange_and_store(credentials_ns, *args, **kwargs)
+
+        self.validate_token(credentials)
+        await self.credentials_store.put(credentials_ns, "credential", credentials)
+        if self.params.negative_cache_ttl_ms is not None:
+            # The connection is authorized now, so an exchange rejected before doesn't have to wait for the
+            # failure to lapse.
+            _, subject_token = await self._get_subject_token(*args, **kwargs)
+            if subject_token:
+                await self.failed_exchanges_store.delete([], self._subject_digest(subject_token))
+        return credentials
+
+    def _should_refresh(self, credentials: TokenResponse, ttl: Optional[int]) -> bool:
+        if self.params.refresh_ahead is None or ttl is None or not credentials.get("expires_in"):
+            return False
+        elapsed = 1 - ttl / (credentials["expires_in"] * 1000)
+        return elapsed >= self.params.refresh_ahead
+
+    def _refresh_in_background(self, exchange_key: tuple, credentials_ns: list[str], *args: ToolInput.args, **kwargs: ToolInput.kwargs) -> None:
+        # Failures are ignored: the cached credentials remain valid until they expire, after which the
+        # next call exchanges (and surfaces errors) inline.
+        task = asyncio.ensure_future(
+            self._exchanges.do(exchange_key, lambda: self._exchange_and_store(credentials_ns, *args, **kwargs))
+        )
+        self._background_refreshes.add(task)
+        task.add_done_callback(self._background_refresh_done)
+
+    def _background_refresh_done(self, task: asyncio.Task) -> None:
+        self._background_refreshes.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    async def _get_subject_token(self, *args: ToolInput.args, **kwargs: ToolInput.kwargs) -> tuple[str, str | None]:
+        if self.params.refresh_token.value is not None:
+            return SUBJECT_TYPE_REFRESH_TOKEN, await self.get_refresh_token(*args, **kwargs)
+        return SUBJECT_TYPE_ACCESS_TOKEN, await self.get_user_access_token(*args, **kwargs)
+
+    @staticmethod
+    def _subject_digest(subject_token: str) -> str:
+        return hashlib.blake2b(subject_token.encode("utf-8"), digest_size=16).hexdigest()
 
     async def get_refresh_token(self, *args: ToolInput.args, **kwargs: ToolInput.kwargs):
         token = await self.params.refresh_token.resolve(*args, **kwargs)
@@ -246,38 +428,89 @@ class TokenVaultAuthorizerBase(Generic[ToolInput]):
             return None
         return token
 
+    async def prewarm(
+        self,
+        context: ToolCallContext,
+        *args: ToolInput.args,
+        **kwargs: ToolInput.kwargs
+    ) -> Optional[TokenVaultInterrupt]:
+        """
+        Obtain the credentials for `context` ahead of the first tool call, if they aren't cached yet.
+
+        Args:
+            context: The tool-call context to obtain credentials for. Authorizers sharing credentials per
+                thread only need its `thread_id`.
+            *args, **kwargs: Passed to the refresh_token / access_token callables in place of the tool input.
+
+        Returns:
+            The interrupt the tool call would raise if authorization is missing, or None.
+        """
+        credentials_ns = ns_from_context(self.params.credentials_context, context)
+        if await self.credentials_store.get(credentials_ns, "credential"):
+            return None
+
+        local_store = {
+            "context": context,
+            "scopes": self.params.scopes,
+            "connection": self.params.connection
+        }
+        with _LocalStorageScope(local_store):
+            try:
+                await self._exchanges.do(
+                    (tuple(credentials_ns), self.params.connection, self._required_scopes),
+                    lambda: self._get_or_exchange(credentials_ns, *args, **kwargs)
+                )
+            except TokenVaultError as err:
+                return TokenVaultInterrupt(str(err), self.params.connection, self.params.scopes, self.params.scopes)
+            except TokenVaultInterrupt as err:
+                return err
+
+        return None
+
     def protect(
         self,
         get_context: ContextGetter[ToolInput],
         execute: Callable[ToolInput, any]
     ) -> Callable[ToolInput, any]:
+        is_async = inspect.iscoroutinefunction(execute)
+
         async def wrapped_execute(*args: ToolInput.args, **kwargs: ToolInput.kwargs):
             context = get_context(*args, **kwargs)
+            credentials_ns = ns_from_context(self.params.credentials_context, context)
+            credentials, ttl = await self.credentials_store.get_with_ttl(credentials_ns, "credential")
+
             local_store = {
                 "context": context,
                 "scopes": self.params.scopes,
                 "connection": self.params.connection
             }
+            if credentials:
+                # Cache hit: the local storage is set once, with the credentials already in it.
+                local_store["credentials"] = credentials
 
-            async with _run_with_local_storage(local_store):
-                credentials_ns = ns_from_context(self.params.credentials_context, context)
-
+            with _LocalStorageScope(local_store):
                 try:
-                    credentials = await self.credentials_store.get(credentials_ns, "credential")
-
                     if not credentials:
-                        credentials = await self.get_access_token_impl(*args, **kwargs)
-                        self.validate_token(credentials)
-                        await self.credentials_store.put(credentials_ns, "credential", credentials)
-                    
-                    _update_local_storage({"credentials": credentials})
-
-                    if inspect.iscoroutinefunction(execute):
+                        # Parallel tool calls sharing the credentials namespace wait for a single exchange.
+                        credentials = await self._exchanges.do(
+                            (tuple(credentials_ns), self.params.connection, self._required_scopes),
+                            lambda: self._get_or_exchange(credentials_ns, *args, **kwargs)
+                        )
+                        _update_local_storage({"current_scopes": credentials["scope"], "credentials": credentials})
+                    elif self._should_refresh(credentials, ttl):
+                        self._refresh_in_background(
+                            (tuple(credentials_ns), self.params.connection, self._required_scopes),
+                            credentials_ns,
+                            *args,
+                            **kwargs
+                        )
+
+                    if is_async:
                         return await execute(*args, **kwargs)
                     else:
                         return execute(*args, **kwargs)
                 except TokenVaultError as err:
-                    self.credentials_store.delete(credentials_ns, "credential")
+                    await self._discard_credentials(credentials_ns, credentials)
                     interrupt = TokenVaultInterrupt(
                         str(err),
                         local_store["connection"],
@@ -286,7 +519,34 @@ class TokenVaultAuthorizerBase(Generic[ToolInput]):
                     )
                     return self._handle_authorization_interrupts(interrupt)
                 except Auth0Interrupt as err:
-                    self.credentials_store.delete(credentials_ns, "credential")
+                    await self._discard_credentials(credentials_ns, credentials)
                     return self._handle_authorization_interrupts(err)
 
-        return wrapped_execute
\ No newline at end of file
+        return wrapped_execute
+
+async def prewarm(
+    context: ToolCallContext,
+    authorizers: Iterable[TokenVaultAuthorizerBase],
+    *args: Any,
+    **kwargs: Any
+) -> list[Optional[Union[TokenVaultInterrupt, BaseException]]]:
+    """
+    Obtain the credentials of several Token Vault authorizers concurrently, e.g. at the start of a thread,
+    so that the first call of each protected tool hits a warm cache.
+
+    A failing authorizer doesn't affect the others: every authorizer is warmed up, and its failure is
+    reported in its own result.
+
+    Args:
+        context: The tool-call context to obtain credentials for (usually just the `thread_id`).
+        authorizers: The authorizers to warm up.
+        *args, **kwargs: Passed to the refresh_token / access_token callables in place of the tool input.
+
+    Returns:
+        One result per authorizer, in order: None if its credentials are available, the interrupt if the
+        connection needs user authorization, or the exception raised while obtaining them (e.g. a network error).
+    """
+    return await asyncio.gather(
+        *[authorizer.prewarm(context, *args, **kwargs) for authorizer in authorizers],
+        return_exceptions=True
+    )
@@ -0,0 +1,152 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, TypedDict
+import aiohttp
+
+class HttpPoolStats(TypedDict):
+    """
+    Connection counters of an HttpPool, per Auth0 domain.
+
+    Attributes:
+        requests (int): The number of requests sent.
+        connections_created (int): The number of new connections opened (including TLS handshakes).
+        connections_reused (int): The number of requests sent over an already open keep-alive connection.
+    """
+    requests: int
+    connections_created: int
+    connections_reused: int
+
+class _PooledSession:
+    """
+    Stands in for the session of an `auth0.asyncify` client. Every request is sent over the pool's
+    session for the running event loop, so a client shared by several loops (or threads) never
+    uses a session bound to another loop.
+    """
+
+    def __init__(self, pool: "HttpPool", domain: str):
+        self._pool = pool
+        self._domain = domain
+
+    def request(self, *args: Any, **kwargs: Any):
+        return self._pool.session(self._domain).request(*args, **kwargs)
+
+class HttpPool:
+    """
+    Keep-alive HTTP sessions shared by every authorizer talking to the same Auth0 domain, so
+    connections (and TLS handshakes) are reused across authorizers instead of opened per request.
+
+    Sessions are created lazily on first use, one per event loop and domain, and are closed when
+    their loop shuts down (`asyncio.run` and most sync-to-async bridges cancel the tasks left on the
+    loop, which closes them) or when `close` is called.
+    """
+
+    def __init__(self, limit_per_host: int = 10, keepalive_timeout: float = 30.0):
+        """
+        Initialize the HttpPool.
+
+        Args:
+            limit_per_host (int): Maximum number of simultaneous connections per domain. Defaults to 10.
+            keepalive_timeout (float): Seconds an idle connection is kept open for reuse. Defaults to 30s.
+        """
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._sessions: Dict[tuple[asyncio.AbstractEventLoop, str], aiohttp.ClientSession] = {}
+        # A task per loop closing its sessions when the loop shuts down.
+        self._closers: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+        self._proxies: Dict[str, _PooledSession] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, HttpPoolStats] = {}
+
+    def session(self, domain: str) -> aiohttp.ClientSession:
+        """
+        Return the session for `domain` on the running event loop, creating it if needed. Must be called
+        from a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get((loop, domain))
+        if session is not None and not session.closed:
+            return session
+
+        with self._lock:
+            stats = self._stats.setdefault(domain, HttpPoolStats(requests=0, connections_created=0, connections_reused=0))
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, limit_per_host=self._limit_per_host, keepalive_timeout=self._keepalive_timeout),
+            trace_configs=[self._trace_config(stats)],
+        )
+
+        with self._lock:
+            self._sessions[(loop, domain)] = session
+            if loop not in self._closers:
+                # Forget loops closed without cancelling their tasks; nothing can be awaited on them anymore.
+                for closed in [other for other in self._closers if other.is_closed()]:
+                    del self._closers[closed]
+                    for key in [key for key in self._sessions if key[0] is closed]:
+                        del self._sessions[key]
+                self._closers[loop] = loop.create_task(self._close_on_shutdown(loop))
+        return session
+
+    def bind(self, client: Any, domain: str) -> None:
+        """
+        Point an `auth0.asyncify` client at the shared sessions for `domain`.
+        """
+        with self._lock:
+            proxy = self._proxies.setdefault(domain, _PooledSession(self, domain))
+        if getattr(client, "_session", None) is not proxy:
+            client.set_session(proxy)
+
+    async def _close_on_shutdown(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            await loop.create_future()
+        finally:
+            await self._close_loop(loop)
+
+    async def _close_loop(self, loop: asyncio.AbstractEventLoop, domain: Optional[str] = None) -> None:
+        with self._lock:
+            keys = [key for key in self._sessions if key[0] is loop and (domain is None or key[1] == domain)]
+            sessions = [self._sessions.pop(key) for key in keys]
+            if not any(key[0] is loop for key in self._sessions):
+                closer = self._closers.pop(loop, None)
+                if closer is not None and closer is not asyncio.current_task():
+                    closer.cancel()
+
+        for session in sessions:
+            await session.close()
+
+    @staticmethod
+    def _trace_config(stats: HttpPoolStats) -> aiohttp.TraceConfig:
+        def counter(name: str):
+            async def on_event(session: aiohttp.ClientSession, context: SimpleNamespace, params: Any) -> None:
+                stats[name] += 1
+            return on_event
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(counter("requests"))
+        trace_config.on_connection_create_end.append(counter("connections_created"))
+        trace_config.on_connection_reuseconn.append(counter("connections_reused"))
+        return trace_config
+
+    def stats(self) -> Dict[str, HttpPoolStats]:
+        """
+        Return the connection counters, per domain.
+        """
+        with self._lock:
+            return {domain: HttpPoolStats(**stats) for domain, stats in self._stats.items()}
+
+    async def close(self, domain: Optional[str] = None) -> None:
+        """
+        Close the sessions (or only the sessions of `domain`) and their connections. The sessions of the
+        running loop are closed before returning; other loops are asked to close theirs.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            others = {key[0] for key in self._sessions if key[0] is not loop and (domain is None or key[1] == domain)}
+
+        for other in others:
+            if not other.is_closed():
+                try:
+                    asyncio.run_coroutine_threadsafe(self._close_loop(other, domain), other)
+                except RuntimeError:
+                    # Closed meanwhile.
+                    pass
+        await self._close_loop(loop, domain)
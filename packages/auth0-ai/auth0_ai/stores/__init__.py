@@ -1,4 +1,14 @@
 from .store import Store as Store, StorePutOptions as StorePutOptions
 from .sub_store import SubStore as SubStore
+from .cached_store import CachedStore as CachedStore, CachedStoreStats as CachedStoreStats
+from .eviction import (
+    EvictionPolicy as EvictionPolicy,
+    LRUEvictionPolicy as LRUEvictionPolicy,
+    LFUEvictionPolicy as LFUEvictionPolicy,
+    TTLEvictionPolicy as TTLEvictionPolicy,
+    StoreStats as StoreStats
+)
 from .impl.in_memory_store import InMemoryStore as InMemoryStore
 from .impl.fs_store import FSStore as FSStore
+from .impl.redis_store import RedisStore as RedisStore
+from .impl.sqlite_store import SQLiteStore as SQLiteStore
@@ -0,0 +1,152 @@
+import time
+from typing import Any, Generic, Optional, Sequence, TypeVar, TypedDict
+from auth0_ai.stores.impl.in_memory_store import InMemoryStore
+from auth0_ai.stores.store import Store, StorePutOptions
+
+T = TypeVar("T")
+
+class CachedStoreStats(TypedDict):
+    """
+    Usage counters of a CachedStore.
+
+    Attributes:
+        hits (int): Reads served from the local cache.
+        misses (int): Reads that went to the underlying store.
+        entries (int): The number of entries currently held in the local cache.
+        evictions (int): The number of entries evicted from the local cache to stay within max_entries.
+    """
+    hits: int
+    misses: int
+    entries: int
+    evictions: int
+
+class CachedStore(Store[T], Generic[T]):
+    """
+    A read-through store that keeps a bounded local copy of the values read from (or written to) a
+    parent store, typically a remote one such as RedisStore.
+
+    Cached copies never outlive the underlying entry: their TTL is capped at the entry's remaining
+    lifetime, which is also what `get_with_ttl` reports for them. Writes go through to the parent
+    and deletes invalidate the local copy. Changes made by other processes are only picked up once
+    the local copy expires, after at most `ttl_ms`.
+
+    `mget` serves what it finds in the local cache but doesn't add the values it reads from the
+    parent, since batched reads don't report their lifetime; use `get` for values worth caching.
+    """
+
+    def __init__(self, parent: Store[Any], max_entries: int = 1024, ttl_ms: int = 30_000):
+        """
+        Initialize the CachedStore.
+
+        Args:
+            parent (Store): The store to cache.
+            max_entries (int): Maximum number of locally cached values, evicted least recently used first.
+                Defaults to 1024.
+            ttl_ms (int): Maximum time in milliseconds a value is served from the local cache. Defaults to 30s.
+        """
+        if parent is None:
+            raise ValueError("Parent store is required")
+
+        self._parent = parent
+        self._ttl_ms = ttl_ms
+        # Local copies are stored with the parent entry's absolute expiry (ms since the epoch, or None).
+        self._cache: InMemoryStore[tuple[T, Optional[float]]] = InMemoryStore(
+            max_entries=max_entries,
+            eviction_policy="lru",
+            sweep_interval_ms=ttl_ms
+        )
+        self._hits = 0
+        self._misses = 0
+
+    def _cache_options(self, ttl: Optional[int]) -> StorePutOptions:
+        return {"expires_in": min(self._ttl_ms, ttl) if ttl is not None else self._ttl_ms}
+
+    @staticmethod
+    def _cache_entry(value: T, ttl: Optional[int], now: float) -> tuple[T, Optional[float]]:
+        return value, now + ttl if ttl is not None else None
+
+    def stats(self) -> CachedStoreStats:
+        """
+        Return the cache hit/miss counters.
+        """
+        cache_stats = self._cache.stats()
+        return CachedStoreStats(
+            hits=self._hits,
+            misses=self._misses,
+            entries=cache_stats["entries"],
+            evictions=cache_stats["evictions"],
+        )
+
+    async def get(self, namespace: Sequence[str], key: str) -> T | None:
+        value, _ = await self.get_with_ttl(namespace, key)
+        return value
+
+    async def get_with_ttl(self, namespace: Sequence[str], key: str) -> tuple[T | None, int | None]:
+        entry = await self._cache.get(namespace, key)
+        if entry is not None:
+            self._hits += 1
+            value, expires_at = entry
+            return value, max(0, int(expires_at - time.time() * 1000)) if expires_at is not None else None
+
+        self._misses += 1
+        value, ttl = await self._parent.get_with_ttl(namespace, key)
+        if value is not None and (ttl is None or ttl > 0):
+            await self._cache.put(
+                namespace, key, self._cache_entry(value, ttl, time.time() * 1000), self._cache_options(ttl)
+            )
+
+        return value, ttl
+
+    async def delete(self, namespace: Sequence[str], key: str) -> None:
+        await self._cache.delete(namespace, key)
+        await self._parent.delete(namespace, key)
+
+    async def put(
+        self,
+        namespace: Sequence[str],
+        key: str,
+        value: T,
+        options: Optional[StorePutOptions] = None
+    ) -> None:
+        ttl = options.get("expires_in") if options else None
+        await self._parent.put(namespace, key, value, options)
+        await self._cache.put(namespace, key, self._cache_entry(value, ttl, time.time() * 1000), self._cache_options(ttl))
+
+    async def mget(self, entries: Sequence[tuple[Sequence[str], str]]) -> list[T | None]:
+        values = [entry[0] if entry is not None else None for entry in await self._cache.mget(entries)]
+        missing = [index for index, value in enumerate(values) if value is None]
+        self._hits += len(values) - len(missing)
+        self._misses += len(missing)
+
+        if missing:
+            fetched = await self._parent.mget([entries[index] for index in missing])
+            for index, value in zip(missing, fetched):
+                values[index] = value
+
+        return values
+
+    async def mput(self, items: Sequence[tuple[Sequence[str], str, T, Optional[StorePutOptions]]]) -> None:
+        await self._parent.mput(items)
+        now = time.time() * 1000
+        cached = []
+        for namespace, key, value, options in items:
+            ttl = options.get("expires_in") if options else None
+            cached.append((namespace, key, self._cache_entry(value, ttl, now), self._cache_options(ttl)))
+        await self._cache.mput(cached)
+
+    async def mdelete(self, entries: Sequence[tuple[Sequence[str], str]]) -> None:
+        await self._cache.mdelete(entries)
+        await self._parent.mdelete(entries)
+
+    async def list_keys(self, prefix: Sequence[str]) -> list[tuple[Sequence[str], str]]:
+        return await self._parent.list_keys(prefix)
+
+    async def delete_prefix(self, prefix: Sequence[str]) -> None:
+        await self._cache.delete_prefix(prefix)
+        await self._parent.delete_prefix(prefix)
+
+    async def close(self) -> None:
+        """
+        Stop the local cache sweeper.
+        """
+        await self._cache.close()
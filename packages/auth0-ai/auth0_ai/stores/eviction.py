@@ -0,0 +1,261 @@
+import heapq
+import itertools
+import json
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, Literal, Optional, TypedDict, Union
+
+class StoreStats(TypedDict):
+    """
+    Usage counters of a store.
+
+    Attributes:
+        entries (int): The number of entries currently held (including expired entries not yet removed).
+        bytes (int, optional): The estimated size of the held values, or None when max_bytes is not set.
+        evictions (int): The number of entries removed to stay within the capacity limits.
+        expirations (int): The number of entries removed because their TTL elapsed.
+    """
+    entries: int
+    bytes: Optional[int]
+    evictions: int
+    expirations: int
+
+class EvictionPolicy(ABC):
+    """
+    Decides which entry a capacity-bounded store evicts when it is full.
+
+    A policy only sees store keys; it is notified of every insert, read and removal
+    and must return one of the keys it currently tracks from `select_victim`.
+    """
+
+    @abstractmethod
+    def on_insert(self, key: Hashable, expires_at: Optional[float]) -> None:
+        """Called when a key is inserted or overwritten."""
+        pass
+
+    @abstractmethod
+    def on_access(self, key: Hashable) -> None:
+        """Called when a key is read."""
+        pass
+
+    @abstractmethod
+    def on_remove(self, key: Hashable) -> None:
+        """Called when a key is deleted, expired or evicted."""
+        pass
+
+    @abstractmethod
+    def select_victim(self) -> Optional[Hashable]:
+        """Return the key to evict next, or None if no key is tracked."""
+        pass
+
+class LRUEvictionPolicy(EvictionPolicy):
+    """
+    Evicts the least recently used entry.
+    """
+
+    def __init__(self):
+        self._keys: OrderedDict[Hashable, None] = OrderedDict()
+
+    def on_insert(self, key: Hashable, expires_at: Optional[float]) -> None:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+
+    def on_access(self, key: Hashable) -> None:
+        if key in self._keys:
+            self._keys.move_to_end(key)
+
+    def on_remove(self, key: Hashable) -> None:
+        self._keys.pop(key, None)
+
+    def select_victim(self) -> Optional[Hashable]:
+        return next(iter(self._keys), None)
+
+class _FrequencyBucket:
+    """
+    The keys used `freq` times, in least recently used order, linked to the buckets of the
+    nearest lower and higher frequencies.
+    """
+    __slots__ = ("freq", "keys", "prev", "next")
+
+    def __init__(self, freq: int):
+        self.freq = freq
+        self.keys: OrderedDict[Hashable, None] = OrderedDict()
+        self.prev = self
+        self.next = self
+
+    def insert_after(self, bucket: "_FrequencyBucket") -> None:
+        self.prev = bucket
+        self.next = bucket.next
+        bucket.next.prev = self
+        bucket.next = self
+
+    def unlink(self) -> None:
+        self.prev.next = self.next
+        self.next.prev = self.prev
+
+class LFUEvictionPolicy(EvictionPolicy):
+    """
+    Evicts the least frequently used entry, breaking ties by least recent use.
+    All operations are O(1): buckets of keys per frequency form a list ordered by frequency,
+    so the least used bucket is always the first one.
+    """
+
+    def __init__(self):
+        # Sentinel of the circular bucket list.
+        self._head = _FrequencyBucket(0)
+        self._buckets: Dict[Hashable, _FrequencyBucket] = {}
+
+    def _move(self, key: Hashable, after: _FrequencyBucket, freq: int) -> None:
+        bucket = after.next
+        if bucket.freq != freq:
+            bucket = _FrequencyBucket(freq)
+            bucket.insert_after(after)
+        bucket.keys[key] = None
+        self._buckets[key] = bucket
+
+    def _discard(self, key: Hashable, bucket: _FrequencyBucket) -> None:
+        del bucket.keys[key]
+        if not bucket.keys:
+            bucket.unlink()
+
+    def on_insert(self, key: Hashable, expires_at: Optional[float]) -> None:
+        if key in self._buckets:
+            self.on_access(key)
+            return
+        self._move(key, self._head, 1)
+
+    def on_access(self, key: Hashable) -> None:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return
+        # Place the key before unlinking its bucket, which is the new bucket's predecessor.
+        self._move(key, bucket, bucket.freq + 1)
+        self._discard(key, bucket)
+
+    def on_remove(self, key: Hashable) -> None:
+        bucket = self._buckets.pop(key, None)
+        if bucket is not None:
+            self._discard(key, bucket)
+
+    def select_victim(self) -> Optional[Hashable]:
+        bucket = self._head.next
+        if bucket is self._head:
+            return None
+        return next(iter(bucket.keys))
+
+class TTLEvictionPolicy(EvictionPolicy):
+    """
+    Evicts the entry closest to expiring. Entries without a TTL are evicted last,
+    oldest first.
+    """
+
+    def __init__(self):
+        self._expirations: Dict[Hashable, Optional[float]] = {}
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._counter = itertools.count()
+        self._no_ttl: OrderedDict[Hashable, None] = OrderedDict()
+
+    def on_insert(self, key: Hashable, expires_at: Optional[float]) -> None:
+        self.on_remove(key)
+        self._expirations[key] = expires_at
+        if expires_at is None:
+            self._no_ttl[key] = None
+        else:
+            heapq.heappush(self._heap, (expires_at, next(self._counter), key))
+
+    def on_access(self, key: Hashable) -> None:
+        pass
+
+    def on_remove(self, key: Hashable) -> None:
+        if self._expirations.pop(key, 0) is None:
+            del self._no_ttl[key]
+
+        if len(self._heap) > 2 * len(self._expirations) + 64:
+            self._heap = [entry for entry in self._heap if self._expirations.get(entry[2], 0) == entry[0]]
+            heapq.heapify(self._heap)
+
+    def select_victim(self) -> Optional[Hashable]:
+        # Heap entries for removed or overwritten keys are discarded lazily.
+        while self._heap:
+            expires_at, _, key = self._heap[0]
+            if key in self._expirations and self._expirations[key] == expires_at:
+                return key
+            heapq.heappop(self._heap)
+
+        return next(iter(self._no_ttl), None)
+
+EvictionPolicyName = Literal["lru", "lfu", "ttl"]
+
+_POLICIES: Dict[str, Callable[[], EvictionPolicy]] = {
+    "lru": LRUEvictionPolicy,
+    "lfu": LFUEvictionPolicy,
+    "ttl": TTLEvictionPolicy,
+}
+
+def create_eviction_policy(policy: Union[EvictionPolicyName, Callable[[], EvictionPolicy]]) -> EvictionPolicy:
+    """
+    Build an eviction policy from its name ("lru", "lfu" or "ttl") or from a factory returning an EvictionPolicy.
+    """
+    if isinstance(policy, str):
+        if policy not in _POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        return _POLICIES[policy]()
+    return policy()
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the size in bytes of a value as the length of its JSON encoding.
+    """
+    return len(json.dumps(value, separators=(",", ":"), default=str))
+
+class CapacityLimiter:
+    """
+    Enforces max_entries / max_bytes limits on a single dictionary-backed store
+    using an eviction policy. The store remains responsible for removing the keys
+    returned by `make_room`.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int],
+        max_bytes: Optional[int],
+        policy: Union[EvictionPolicyName, Callable[[], EvictionPolicy]]
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = create_eviction_policy(policy)
+        self.bytes = 0
+        self._sizes: Dict[Hashable, int] = {}
+
+    def size_of(self, value: Any) -> int:
+        return estimate_size(value) if self.max_bytes is not None else 0
+
+    def track(self, key: Hashable, size: int, expires_at: Optional[float]) -> None:
+        if self.max_bytes is not None:
+            self.bytes += size
+            self._sizes[key] = size
+        self.policy.on_insert(key, expires_at)
+
+    def touch(self, key: Hashable) -> None:
+        self.policy.on_access(key)
+
+    def untrack(self, key: Hashable) -> None:
+        if self.max_bytes is not None:
+            self.bytes -= self._sizes.pop(key, 0)
+        self.policy.on_remove(key)
+
+    def make_room(self, entries: int, size: int) -> Iterator[Hashable]:
+        """
+        Yield keys to evict so that one more entry of `size` bytes fits, given the number
+        of entries currently tracked. The caller must remove each yielded key (and call
+        `untrack`) before requesting the next one.
+        """
+        while (
+            (self.max_entries is not None and entries + 1 > self.max_entries)
+            or (self.max_bytes is not None and self.bytes + size > self.max_bytes)
+        ):
+            victim = self.policy.select_victim()
+            if victim is None:
+                return
+            yield victim
+            entries -= 1
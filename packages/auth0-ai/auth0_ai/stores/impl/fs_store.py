@@ -1,8 +1,10 @@
 import asyncio
 import json
+import os
 import time
 from pathlib import Path
-from typing import Any, Dict, Generic, Optional, Sequence, TypeVar
+from typing import Any, Callable, Dict, Generic, Optional, Sequence, TypeVar, Union
+from auth0_ai.stores.eviction import CapacityLimiter, EvictionPolicy, EvictionPolicyName, StoreStats
 
 T = TypeVar("T")
 
@@ -10,18 +12,51 @@ class FSStore(Generic[T]):
     """
     A file-backed key-value store with TTL support and debounced persistence.
     Use for dev/demo purposes only.
+
+    By default the whole store is rewritten as a JSON document on every persist. In journal
+    mode, each put/delete is appended to the file as one JSON line instead, and the log is
+    compacted in the background once it grows past `compaction_ratio` times the live entries.
     """
 
-    def __init__(self, filepath: str, debounce_ms: int = 100):
+    def __init__(
+        self,
+        filepath: str,
+        debounce_ms: int = 100,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        eviction_policy: Union[EvictionPolicyName, Callable[[], EvictionPolicy]] = "ttl",
+        journal: bool = False,
+        compaction_ratio: float = 2.0
+    ):
         """
         Initialize the FSStore.
 
         Args:
             filepath (str): Path to the backing JSON file.
             debounce_ms (int): Milliseconds to debounce writes. Defaults to 100ms.
+            max_entries (int, optional): Maximum number of entries to keep. Defaults to no limit.
+            max_bytes (int, optional): Maximum total size of the stored values, estimated from their JSON encoding.
+                Defaults to no limit.
+            eviction_policy (str | Callable[[], EvictionPolicy]): How to pick the entry to evict when a limit is
+                reached: "ttl" (closest to expiring, default), "lru", "lfu", or a factory returning a custom
+                EvictionPolicy.
+            journal (bool): Persist changes as an append-only log of JSON lines instead of rewriting the whole
+                file. Existing JSON documents are converted on the first write. Defaults to False.
+            compaction_ratio (float): In journal mode, rewrite the log with only the live entries once it holds
+                more than this many records per live entry. Defaults to 2.0.
         """
         self._filepath = Path(filepath).resolve()
         self._store: Dict[str, tuple[T, Optional[float]]] = {}
+        self._limiter = (
+            CapacityLimiter(max_entries, max_bytes, eviction_policy)
+            if max_entries is not None or max_bytes is not None else None
+        )
+        self._evictions = 0
+        self._expirations = 0
+        self._journal = journal
+        self._compaction_ratio = compaction_ratio
+        self._journal_records = 0
+        self._pending_records: list[Dict[str, Any]] = []
         self._lock = asyncio.Lock()
         self._persist_task: Optional[asyncio.TimerHandle] = None
         self._loop = asyncio.get_running_loop()
@@ -31,6 +66,49 @@ class FSStore(Generic[T]):
     def _make_key(self, namespace: Sequence[str], key: str) -> str:
         return "/".join(namespace) + "/" + key
 
+    def _insert(self, full_key: str, value: T, expires_at: Optional[float]) -> list[str]:
+        evicted: list[str] = []
+        if self._limiter is not None:
+            # Stop tracking an overwritten entry first so it is never picked as its own victim.
+            if full_key in self._store:
+                self._remove(full_key)
+
+            size = self._limiter.size_of(value)
+            for victim in self._limiter.make_room(len(self._store), size):
+                self._remove(victim)
+                self._evictions += 1
+                evicted.append(victim)
+            self._limiter.track(full_key, size, expires_at)
+
+        self._store[full_key] = (value, expires_at)
+        return evicted
+
+    def _remove(self, full_key: str) -> bool:
+        if self._store.pop(full_key, None) is None:
+            return False
+        if self._limiter is not None:
+            self._limiter.untrack(full_key)
+        return True
+
+    def _record(self, op: str, full_key: str, value: Optional[T] = None, expires_at: Optional[float] = None) -> None:
+        if not self._journal:
+            return
+        if op == "put":
+            self._pending_records.append({"op": op, "key": full_key, "value": value, "expiresAt": expires_at})
+        else:
+            self._pending_records.append({"op": op, "key": full_key})
+
+    def stats(self) -> StoreStats:
+        """
+        Return the store usage counters.
+        """
+        return StoreStats(
+            entries=len(self._store),
+            bytes=self._limiter.bytes if self._limiter is not None and self._limiter.max_bytes is not None else None,
+            evictions=self._evictions,
+            expirations=self._expirations,
+        )
+
     async def _load(self) -> None:
         try:
             if not self._filepath.exists():
@@ -40,17 +118,49 @@ class FSStore(Generic[T]):
                 return self._filepath.read_text(encoding="utf-8")
 
             raw = await asyncio.to_thread(_read)
-            data = json.loads(raw)
             now = time.time() * 1000
 
-            for k, entry in data.items():
-                value = entry["value"]
-                expires_at = entry.get("expiresAt")
-                if expires_at is None or expires_at > now:
-                    self._store[k] = (value, expires_at)
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                data = None
+
+            if isinstance(data, dict) and "op" not in data:
+                for k, entry in data.items():
+                    value = entry["value"]
+                    expires_at = entry.get("expiresAt")
+                    if expires_at is None or expires_at > now:
+                        self._insert(k, value, expires_at)
+
+                # A JSON document can't be appended to; rewrite it as a log on the first persist.
+                self._journal_records = float("inf")
+            else:
+                self._journal_records = self._replay(raw)
+                for k in [k for k, (_, expires_at) in self._store.items() if expires_at is not None and expires_at <= now]:
+                    self._remove(k)
         except Exception as e:
             print(f"[FSStore] Failed to load: {e}")
 
+    def _replay(self, raw: str) -> float:
+        records = 0
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A torn write at the end of the log; everything before it is intact. Compact
+                # on the next persist so new records aren't appended after the partial line.
+                return float("inf")
+
+            if record["op"] == "put":
+                self._insert(record["key"], record["value"], record.get("expiresAt"))
+            elif record["op"] == "del":
+                self._remove(record["key"])
+            records += 1
+
+        return records
+
     async def get(self, namespace: Sequence[str], key: str) -> T | None:
         await self._load_task
         full_key = self._make_key(namespace, key)
@@ -64,19 +174,30 @@ class FSStore(Generic[T]):
             now = time.time() * 1000
 
             if expires_at is not None and now >= expires_at:
-                del self._store[full_key]
+                self._remove(full_key)
+                self._expirations += 1
                 self._debounced_persist()
                 return None
 
+            if self._limiter is not None:
+                self._limiter.touch(full_key)
             return value
 
+    async def get_with_ttl(self, namespace: Sequence[str], key: str) -> tuple[T | None, int | None]:
+        value = await self.get(namespace, key)
+        if value is None:
+            return None, None
+
+        expires_at = self._store.get(self._make_key(namespace, key), (None, None))[1]
+        return value, int(expires_at - time.time() * 1000) if expires_at is not None else None
+
     async def delete(self, namespace: Sequence[str], key: str) -> None:
         await self._load_task
         full_key = self._make_key(namespace, key)
 
         async with self._lock:
-            if full_key in self._store:
-                del self._store[full_key]
+            if self._remove(full_key):
+                self._record("del", full_key)
                 self._debounced_persist()
 
     async def put(
@@ -92,9 +213,98 @@ class FSStore(Generic[T]):
         expires_at = time.time() * 1000 + expires_in if expires_in is not None else None
 
         async with self._lock:
-            self._store[full_key] = (value, expires_at)
+            for victim in self._insert(full_key, value, expires_at):
+                self._record("del", victim)
+            self._record("put", full_key, value, expires_at)
             self._debounced_persist()
 
+    async def mget(self, entries: Sequence[tuple[Sequence[str], str]]) -> list[T | None]:
+        await self._load_task
+        full_keys = [self._make_key(namespace, key) for namespace, key in entries]
+        values: list[T | None] = []
+        expired = False
+
+        async with self._lock:
+            now = time.time() * 1000
+            for full_key in full_keys:
+                entry = self._store.get(full_key)
+                if not entry:
+                    values.append(None)
+                    continue
+
+                value, expires_at = entry
+                if expires_at is not None and now >= expires_at:
+                    self._remove(full_key)
+                    self._expirations += 1
+                    expired = True
+                    values.append(None)
+                    continue
+
+                if self._limiter is not None:
+                    self._limiter.touch(full_key)
+                values.append(value)
+
+            if expired:
+                self._debounced_persist()
+
+        return values
+
+    async def mput(self, items: Sequence[tuple[Sequence[str], str, T, Optional[Dict[str, Any]]]]) -> None:
+        await self._load_task
+        now = time.time() * 1000
+
+        async with self._lock:
+            for namespace, key, value, options in items:
+                full_key = self._make_key(namespace, key)
+                expires_in = options.get("expires_in") if options else None
+                expires_at = now + expires_in if expires_in is not None else None
+                for victim in self._insert(full_key, value, expires_at):
+                    self._record("del", victim)
+                self._record("put", full_key, value, expires_at)
+
+            if items:
+                self._debounced_persist()
+
+    async def mdelete(self, entries: Sequence[tuple[Sequence[str], str]]) -> None:
+        await self._load_task
+
+        async with self._lock:
+            removed = False
+            for namespace, key in entries:
+                full_key = self._make_key(namespace, key)
+                if self._remove(full_key):
+                    self._record("del", full_key)
+                    removed = True
+
+            if removed:
+                self._debounced_persist()
+
+    async def list_keys(self, prefix: Sequence[str]) -> list[tuple[Sequence[str], str]]:
+        await self._load_task
+        key_prefix = "".join(part + "/" for part in prefix)
+        now = time.time() * 1000
+
+        async with self._lock:
+            full_keys = [
+                k for k, (_, expires_at) in self._store.items()
+                if k.startswith(key_prefix) and (expires_at is None or now < expires_at)
+            ]
+
+        return [(parts[:-1], parts[-1]) for parts in (k.split("/") for k in full_keys)]
+
+    async def delete_prefix(self, prefix: Sequence[str]) -> None:
+        await self._load_task
+        key_prefix = "".join(part + "/" for part in prefix)
+
+        async with self._lock:
+            full_keys = [k for k in self._store if k.startswith(key_prefix)]
+            for full_key in full_keys:
+                self._remove(full_key)
+                self._record("del", full_key)
+
+            if full_keys:
+                self._debounced_persist()
+
     def _debounced_persist(self) -> None:
         if self._persist_task:
             self._persist_task.cancel()
@@ -104,6 +314,9 @@ class FSStore(Generic[T]):
         )
 
     async def _persist(self) -> None:
+        if self._journal:
+            return await self._persist_journal()
+
         async with self._lock:
             data: Dict[str, Dict[str, Any]] = {}
             now = time.time() * 1000
@@ -123,3 +336,42 @@ class FSStore(Generic[T]):
                 await asyncio.to_thread(_write)
             except Exception as e:
                 print(f"[FSStore] Failed to persist: {e}")
+
+    async def _persist_journal(self) -> None:
+        async with self._lock:
+            # Pending records are only dropped once written, so a failed append is retried with the next persist.
+            # Mutations take the same lock, so none are queued while the write is in progress.
+            records = self._pending_records
+            compact = self._journal_records + len(records) > self._compaction_ratio * max(len(self._store), 64)
+
+            if compact:
+                now = time.time() * 1000
+                records = [
+                    {"op": "put", "key": k, "value": value, "expiresAt": expires_at}
+                    for k, (value, expires_at) in self._store.items()
+                    if expires_at is None or expires_at > now
+                ]
+            elif not records:
+                return
+
+            lines = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+
+            def _append():
+                self._filepath.parent.mkdir(parents=True, exist_ok=True)
+                with self._filepath.open("a", encoding="utf-8") as f:
+                    f.write(lines)
+
+            def _compact():
+                self._filepath.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self._filepath.with_name(self._filepath.name + ".tmp")
+                tmp.write_text(lines, encoding="utf-8")
+                os.replace(tmp, self._filepath)
+
+            try:
+                await asyncio.to_thread(_compact if compact else _append)
+                self._journal_records = len(records) if compact else self._journal_records + len(records)
+                self._pending_records = []
+            except Exception as e:
+                # The failed append may have left a partial line; rewrite the whole log next time.
+                self._journal_records = float("inf")
+                print(f"[FSStore] Failed to persist: {e}")
@@ -1,44 +1,336 @@
 import asyncio
+import heapq
+import math
 import time
-from typing import Dict, TypeVar, Sequence
+import weakref
+from typing import Callable, Dict, Generic, Iterator, Optional, TypeVar, Sequence, Union
+from auth0_ai.stores.eviction import CapacityLimiter, EvictionPolicy, EvictionPolicyName, StoreStats
 from auth0_ai.stores.store import Store, StorePutOptions
 
 T = TypeVar("T")
 
+# Store keys are the namespace segments followed by the key, so they can be mapped back
+# onto the namespace index without ambiguity.
+StoreKey = tuple[str, ...]
+
+class _IndexNode:
+    """
+    A node of the namespace trie. Holds the store keys whose namespace ends at this node.
+    """
+
+    __slots__ = ("children", "keys")
+
+    def __init__(self):
+        self.children: Dict[str, "_IndexNode"] = {}
+        self.keys: set[StoreKey] = set()
+
+    def iter_keys(self) -> Iterator[StoreKey]:
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield from node.keys
+            stack.extend(node.children.values())
+
+class _Shard(Generic[T]):
+    """
+    A partition of the in-memory store with its own lock, dictionary, expiry index and capacity limits.
+    """
+
+    __slots__ = ("store", "lock", "expiry_heap", "index", "limiter", "evictions", "expirations")
+
+    def __init__(self, limiter: Optional[CapacityLimiter] = None):
+        self.store: Dict[StoreKey, tuple[T, float | None]] = {}
+        self.lock = asyncio.Lock()
+        # Min-heap of (expires_at, store_key). Entries are not removed when a key is
+        # overwritten or deleted; stale entries are skipped when they reach the top.
+        self.expiry_heap: list[tuple[float, StoreKey]] = []
+        # Trie over the namespace segments, used to list and delete keys by prefix.
+        self.index = _IndexNode()
+        self.limiter = limiter
+        self.evictions = 0
+        self.expirations = 0
+
+    def track_expiry(self, store_key: StoreKey, expires_at: float) -> None:
+        heapq.heappush(self.expiry_heap, (expires_at, store_key))
+
+        # Rebuild the heap when stale entries dominate so it stays proportional to the store.
+        if len(self.expiry_heap) > 2 * len(self.store) + 64:
+            self.expiry_heap = [
+                (entry_expires_at, k)
+                for k, (_, entry_expires_at) in self.store.items()
+                if entry_expires_at is not None
+            ]
+            heapq.heapify(self.expiry_heap)
+
+    def _index_add(self, store_key: StoreKey) -> None:
+        node = self.index
+        for segment in store_key[:-1]:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _IndexNode()
+            node = child
+        node.keys.add(store_key)
+
+    def _index_discard(self, store_key: StoreKey) -> None:
+        node = self._find(store_key[:-1])
+        if node is not None:
+            node.keys.discard(store_key)
+            self._prune(store_key[:-1])
+
+    def _prune(self, namespace: Sequence[str]) -> None:
+        path = [self.index]
+        for segment in namespace:
+            node = path[-1].children.get(segment)
+            if node is None:
+                return
+            path.append(node)
+
+        # Remove the nodes left empty, bottom-up.
+        for depth in range(len(path) - 1, 0, -1):
+            node = path[depth]
+            if node.keys or node.children:
+                break
+            del path[depth - 1].children[namespace[depth - 1]]
+
+    def _find(self, prefix: Sequence[str]) -> Optional[_IndexNode]:
+        node = self.index
+        for segment in prefix:
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def list_prefix(self, prefix: Sequence[str], now: float) -> list[StoreKey]:
+        node = self._find(prefix)
+        if node is None:
+            return []
+        return [
+            store_key for store_key in node.iter_keys()
+            if (expires_at := self.store[store_key][1]) is None or now < expires_at
+        ]
+
+    def delete_prefix(self, prefix: Sequence[str]) -> int:
+        node = self._find(prefix)
+        if node is None:
+            return 0
+
+        removed = 0
+        for store_key in list(node.iter_keys()):
+            del self.store[store_key]
+            if self.limiter is not None:
+                self.limiter.untrack(store_key)
+            removed += 1
+
+        # Detach the whole subtree at once instead of pruning key by key.
+        if prefix:
+            del self._find(prefix[:-1]).children[prefix[-1]]
+            self._prune(prefix[:-1])
+        else:
+            self.index = _IndexNode()
+
+        return removed
+
+    def insert(self, store_key: StoreKey, value: T, expires_at: float | None, now: float) -> None:
+        if self.limiter is not None:
+            # Drop expired entries before evicting live ones.
+            self.purge_expired(now)
+
+            # Stop tracking an overwritten entry first so it is never picked as its own victim.
+            if store_key in self.store:
+                self.limiter.untrack(store_key)
+                del self.store[store_key]
+
+            size = self.limiter.size_of(value)
+            for victim in self.limiter.make_room(len(self.store), size):
+                self.remove(victim)
+                self.evictions += 1
+            self.limiter.track(store_key, size, expires_at)
+
+        self.store[store_key] = (value, expires_at)
+        # Indexed after purging and evicting, which may have dropped a previous entry for this key.
+        self._index_add(store_key)
+        if expires_at is not None:
+            self.track_expiry(store_key, expires_at)
+
+    def lookup(self, store_key: StoreKey, now: float) -> T | None:
+        item = self.store.get(store_key)
+        if item is None:
+            return None
+
+        value, expires_at = item
+        if expires_at is not None and now >= expires_at:
+            self.remove(store_key)
+            self.expirations += 1
+            return None
+
+        if self.limiter is not None:
+            self.limiter.touch(store_key)
+        return value
+
+    def remove(self, store_key: StoreKey) -> bool:
+        if self.store.pop(store_key, None) is None:
+            return False
+        self._index_discard(store_key)
+        if self.limiter is not None:
+            self.limiter.untrack(store_key)
+        return True
+
+    def purge_expired(self, now: float) -> int:
+        removed = 0
+        heap = self.expiry_heap
+
+        while heap and heap[0][0] <= now:
+            expires_at, store_key = heapq.heappop(heap)
+            item = self.store.get(store_key)
+            if item is not None and item[1] == expires_at:
+                self.remove(store_key)
+                removed += 1
+
+        self.expirations += removed
+        return removed
+
 class InMemoryStore(Store[T]):
     """
     An in-memory store for dev/demo purposes.
+
+    Expired entries are removed lazily on read and actively by a background sweeper
+    that walks a per-shard expiry heap, so credentials for abandoned threads don't
+    accumulate in long-running processes.
     """
-    
-    def __init__(self):
-        self._store: Dict[str, tuple[T, float | None]] = {}
-        self._lock = asyncio.Lock()
 
-    def _get_key(self, namespace: Sequence[str], key: str) -> str:
-        return "/".join(namespace) + "/" + key
+    def __init__(
+        self,
+        shards: int = 1,
+        sweep_interval_ms: Optional[int] = 60_000,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        eviction_policy: Union[EvictionPolicyName, Callable[[], EvictionPolicy]] = "ttl"
+    ):
+        """
+        Initialize the InMemoryStore.
+
+        Args:
+            shards (int): Number of independent partitions (each with its own lock and dictionary) the keys are
+                spread across. Operations on keys that live in different shards never contend. Defaults to 1.
+            sweep_interval_ms (int, optional): Milliseconds between background sweeps of expired entries.
+                The sweeper starts with the first write. Pass None to only expire entries lazily. Defaults to 60s.
+            max_entries (int, optional): Maximum number of entries to keep. Defaults to no limit.
+            max_bytes (int, optional): Maximum total size of the stored values, estimated from their JSON encoding.
+                Defaults to no limit.
+            eviction_policy (str | Callable[[], EvictionPolicy]): How to pick the entry to evict when a limit is
+                reached: "ttl" (closest to expiring, default), "lru", "lfu", or a factory returning a custom
+                EvictionPolicy. Limits are split evenly across shards and each shard evicts independently.
+        """
+        if shards < 1:
+            raise ValueError("shards must be a positive integer")
+        if sweep_interval_ms is not None and sweep_interval_ms <= 0:
+            raise ValueError("sweep_interval_ms must be a positive integer")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be a positive integer")
+
+        bounded = max_entries is not None or max_bytes is not None
+        self._shards: list[_Shard[T]] = [
+            _Shard(CapacityLimiter(
+                math.ceil(max_entries / shards) if max_entries is not None else None,
+                math.ceil(max_bytes / shards) if max_bytes is not None else None,
+                eviction_policy
+            ) if bounded else None)
+            for _ in range(shards)
+        ]
+        self._max_bytes = max_bytes
+        self._sweep_interval = sweep_interval_ms / 1000 if sweep_interval_ms is not None else None
+        self._sweep_task: Optional[asyncio.Task] = None
+
+    def _get_key(self, namespace: Sequence[str], key: str) -> StoreKey:
+        return (*namespace, key)
+
+    def _get_shard_index(self, store_key: StoreKey) -> int:
+        if len(self._shards) == 1:
+            return 0
+        return hash(store_key) % len(self._shards)
+
+    def _get_shard(self, store_key: StoreKey) -> _Shard[T]:
+        return self._shards[self._get_shard_index(store_key)]
+
+    def _ensure_sweeper(self) -> None:
+        if self._sweep_interval is None or (self._sweep_task and not self._sweep_task.done()):
+            return
+
+        self._sweep_task = asyncio.get_running_loop().create_task(
+            InMemoryStore._sweep_loop(weakref.ref(self), self._sweep_interval)
+        )
+
+    @staticmethod
+    async def _sweep_loop(store_ref: "weakref.ref[InMemoryStore]", interval: float) -> None:
+        # Only a weak reference is held between sweeps so an unused store can be garbage collected.
+        while True:
+            await asyncio.sleep(interval)
+            store = store_ref()
+            if store is None:
+                return
+            await store.sweep()
+            del store
+
+    async def sweep(self) -> int:
+        """
+        Remove every expired entry.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        removed = 0
+        for shard in self._shards:
+            async with shard.lock:
+                removed += shard.purge_expired(time.time() * 1000)
+        return removed
+
+    async def close(self) -> None:
+        """
+        Stop the background sweeper.
+        """
+        if self._sweep_task:
+            self._sweep_task.cancel()
+            self._sweep_task = None
+
+    def stats(self) -> StoreStats:
+        """
+        Return the store usage counters.
+        """
+        return StoreStats(
+            entries=sum(len(shard.store) for shard in self._shards),
+            bytes=sum(shard.limiter.bytes for shard in self._shards) if self._max_bytes is not None else None,
+            evictions=sum(shard.evictions for shard in self._shards),
+            expirations=sum(shard.expirations for shard in self._shards),
+        )
 
     async def get(self, namespace: Sequence[str], key: str) -> T | None:
         store_key = self._get_key(namespace, key)
+        shard = self._get_shard(store_key)
 
-        async with self._lock:
-            item = self._store.get(store_key)
-            if item is None:
-                return None
+        async with shard.lock:
+            return shard.lookup(store_key, time.time() * 1000)
 
-            value, expires_at = item
-            now = time.time() * 1000  # milliseconds
+    async def get_with_ttl(self, namespace: Sequence[str], key: str) -> tuple[T | None, int | None]:
+        store_key = self._get_key(namespace, key)
+        shard = self._get_shard(store_key)
+        now = time.time() * 1000
 
-            if expires_at is not None and now >= expires_at:
-                del self._store[store_key]
-                return None
+        async with shard.lock:
+            value = shard.lookup(store_key, now)
+            if value is None:
+                return None, None
 
-            return value
+            expires_at = shard.store[store_key][1]
+            return value, int(expires_at - now) if expires_at is not None else None
 
     async def delete(self, namespace: Sequence[str], key: str) -> None:
         store_key = self._get_key(namespace, key)
+        shard = self._get_shard(store_key)
 
-        async with self._lock:
-            self._store.pop(store_key, None)
+        async with shard.lock:
+            shard.remove(store_key)
 
     async def put(
         self,
@@ -48,8 +340,69 @@ class InMemoryStore(Store[T]):
         options: StorePutOptions | None = None
     ) -> None:
         store_key = self._get_key(namespace, key)
+        shard = self._get_shard(store_key)
+        now = time.time() * 1000
         expires_in = options["expires_in"] if options and options.get("expires_in") is not None else None
-        expires_at = time.time() * 1000 + expires_in if expires_in is not None else None
+        expires_at = now + expires_in if expires_in is not None else None
+
+        self._ensure_sweeper()
+
+        async with shard.lock:
+            shard.insert(store_key, value, expires_at, now)
+
+    def _group_by_shard(self, store_keys: Sequence[StoreKey]) -> Dict[int, list[int]]:
+        groups: Dict[int, list[int]] = {}
+        for index, store_key in enumerate(store_keys):
+            groups.setdefault(self._get_shard_index(store_key), []).append(index)
+        return groups
+
+    async def mget(self, entries: Sequence[tuple[Sequence[str], str]]) -> list[T | None]:
+        store_keys = [self._get_key(namespace, key) for namespace, key in entries]
+        values: list[T | None] = [None] * len(store_keys)
+        now = time.time() * 1000
+
+        for shard_index, indexes in self._group_by_shard(store_keys).items():
+            shard = self._shards[shard_index]
+            async with shard.lock:
+                for index in indexes:
+                    values[index] = shard.lookup(store_keys[index], now)
+
+        return values
+
+    async def mput(self, items: Sequence[tuple[Sequence[str], str, T, Optional[StorePutOptions]]]) -> None:
+        store_keys = [self._get_key(namespace, key) for namespace, key, _, _ in items]
+        now = time.time() * 1000
+
+        self._ensure_sweeper()
+
+        for shard_index, indexes in self._group_by_shard(store_keys).items():
+            shard = self._shards[shard_index]
+            async with shard.lock:
+                for index in indexes:
+                    _, _, value, options = items[index]
+                    expires_in = options["expires_in"] if options and options.get("expires_in") is not None else None
+                    shard.insert(store_keys[index], value, now + expires_in if expires_in is not None else None, now)
+
+    async def mdelete(self, entries: Sequence[tuple[Sequence[str], str]]) -> None:
+        store_keys = [self._get_key(namespace, key) for namespace, key in entries]
+
+        for shard_index, indexes in self._group_by_shard(store_keys).items():
+            shard = self._shards[shard_index]
+            async with shard.lock:
+                for index in indexes:
+                    shard.remove(store_keys[index])
+
+    async def list_keys(self, prefix: Sequence[str]) -> list[tuple[Sequence[str], str]]:
+        now = time.time() * 1000
+        entries: list[tuple[Sequence[str], str]] = []
+
+        for shard in self._shards:
+            async with shard.lock:
+                entries.extend((store_key[:-1], store_key[-1]) for store_key in shard.list_prefix(prefix, now))
+
+        return entries
 
-        async with self._lock:
-            self._store[store_key] = (value, expires_at)
+    async def delete_prefix(self, prefix: Sequence[str]) -> None:
+        for shard in self._shards:
+            async with shard.lock:
+                shard.delete_prefix(prefix)
@@ -0,0 +1,158 @@
+import json
+from typing import Any, Generic, Optional, Sequence, TypeVar
+from auth0_ai.stores.store import Store, StorePutOptions
+
+try:
+    from redis.asyncio import Redis
+except ImportError:  # pragma: no cover - optional dependency
+    Redis = None
+
+T = TypeVar("T")
+
+class RedisStore(Store[T], Generic[T]):
+    """
+    A store backed by Redis (or any server speaking the Redis protocol), so credentials and
+    authorization requests can be shared across workers.
+
+    Values are stored JSON-encoded and expire natively using `PX` TTLs. Requires the `redis`
+    package (`pip install "auth0-ai[redis]"`) unless a client is provided.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        client: Optional[Any] = None,
+        key_prefix: str = "auth0_ai",
+        max_connections: int = 10,
+    ):
+        """
+        Initialize the RedisStore.
+
+        Args:
+            url (str, optional): Redis connection URL (e.g. "redis://localhost:6379/0"). Used to create a pooled
+                async client when `client` is not provided.
+            client (redis.asyncio.Redis, optional): An existing async Redis client, e.g. a shared client or a
+                `fakeredis.aioredis.FakeRedis` instance for testing. The store does not close clients it didn't create.
+            key_prefix (str): Prefix prepended to every key. Defaults to "auth0_ai".
+            max_connections (int): Size of the connection pool created from `url`. Defaults to 10.
+        """
+        if client is None:
+            if url is None:
+                raise ValueError("Either url or client must be provided")
+            if Redis is None:
+                raise ImportError("RedisStore requires the redis package. Install it with: pip install \"auth0-ai[redis]\"")
+            client = Redis.from_url(url, max_connections=max_connections)
+            self._owns_client = True
+        else:
+            self._owns_client = False
+
+        self._client = client
+        self._key_prefix = key_prefix
+
+    def _make_key(self, namespace: Sequence[str], key: str) -> str:
+        return "/".join([self._key_prefix, *namespace, key])
+
+    @staticmethod
+    def _expires_in(options: Optional[StorePutOptions]) -> Optional[int]:
+        expires_in = options.get("expires_in") if options else None
+        return max(1, int(expires_in)) if expires_in is not None else None
+
+    @staticmethod
+    def _decode(raw: Optional[bytes]) -> T | None:
+        return json.loads(raw) if raw is not None else None
+
+    async def get(self, namespace: Sequence[str], key: str) -> T | None:
+        return self._decode(await self._client.get(self._make_key(namespace, key)))
+
+    async def get_with_ttl(self, namespace: Sequence[str], key: str) -> tuple[T | None, int | None]:
+        store_key = self._make_key(namespace, key)
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.get(store_key)
+            pipe.pttl(store_key)
+            raw, ttl = await pipe.execute()
+
+        # PTTL is -1 for keys without expiry and -2 for missing keys.
+        return self._decode(raw), ttl if raw is not None and ttl >= 0 else None
+
+    async def delete(self, namespace: Sequence[str], key: str) -> None:
+        await self._client.delete(self._make_key(namespace, key))
+
+    async def put(
+        self,
+        namespace: Sequence[str],
+        key: str,
+        value: T,
+        options: Optional[StorePutOptions] = None
+    ) -> None:
+        await self._client.set(self._make_key(namespace, key), json.dumps(value), px=self._expires_in(options))
+
+    async def mget(self, entries: Sequence[tuple[Sequence[str], str]]) -> list[T | None]:
+        """
+        Get several values in a single round-trip.
+
+        Args:
+            entries (Sequence[tuple[Sequence[str], str]]): The (namespace, key) pairs to get.
+
+        Returns:
+            list[Optional[T]]: The stored values, in the same order as `entries`.
+        """
+        if not entries:
+            return []
+        raw_values = await self._client.mget([self._make_key(namespace, key) for namespace, key in entries])
+        return [self._decode(raw) for raw in raw_values]
+
+    async def mput(self, items: Sequence[tuple[Sequence[str], str, T, Optional[StorePutOptions]]]) -> None:
+        """
+        Put several values in a single pipelined round-trip.
+
+        Args:
+            items (Sequence[tuple[Sequence[str], str, T, Optional[StorePutOptions]]]): The
+                (namespace, key, value, options) tuples to store.
+        """
+        if not items:
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            for namespace, key, value, options in items:
+                pipe.set(self._make_key(namespace, key), json.dumps(value), px=self._expires_in(options))
+            await pipe.execute()
+
+    async def mdelete(self, entries: Sequence[tuple[Sequence[str], str]]) -> None:
+        """
+        Delete several values in a single round-trip.
+
+        Args:
+            entries (Sequence[tuple[Sequence[str], str]]): The (namespace, key) pairs to delete.
+        """
+        if not entries:
+            return
+        await self._client.delete(*[self._make_key(namespace, key) for namespace, key in entries])
+
+    def _match_pattern(self, prefix: Sequence[str]) -> str:
+        key_prefix = "/".join([self._key_prefix, *prefix]) + "/"
+        # Escape glob metacharacters so the prefix is matched literally.
+        return "".join("\\" + c if c in "*?[]\\" else c for c in key_prefix) + "*"
+
+    async def list_keys(self, prefix: Sequence[str]) -> list[tuple[Sequence[str], str]]:
+        entries: list[tuple[Sequence[str], str]] = []
+        async for raw_key in self._client.scan_iter(match=self._match_pattern(prefix), count=500):
+            parts = (raw_key.decode() if isinstance(raw_key, bytes) else raw_key).split("/")[self._key_prefix.count("/") + 1:]
+            entries.append((parts[:-1], parts[-1]))
+        return entries
+
+    async def delete_prefix(self, prefix: Sequence[str]) -> None:
+        batch: list = []
+        async for raw_key in self._client.scan_iter(match=self._match_pattern(prefix), count=500):
+            batch.append(raw_key)
+            if len(batch) >= 500:
+                await self._client.unlink(*batch)
+                batch = []
+        if batch:
+            await self._client.unlink(*batch)
+
+    async def close(self) -> None:
+        """
+        Close the connection pool if it was created by this store.
+        """
+        if self._owns_client:
+            close = getattr(self._client, "aclose", None) or self._client.close
+            await close()
@@ -0,0 +1,279 @@
+import asyncio
+import json
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Generic, Optional, Sequence, TypeVar
+from auth0_ai.stores.store import Store, StorePutOptions
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at) WHERE expires_at IS NOT NULL;
+"""
+
+_UPSERT = "INSERT OR REPLACE INTO entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)"
+_DELETE = "DELETE FROM entries WHERE namespace = ? AND key = ?"
+_DELETE_EXPIRED = "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?"
+_SELECT = "SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ?"
+
+# Sentinel used to stop the writer thread.
+_CLOSE = object()
+
+class SQLiteStore(Store[T], Generic[T]):
+    """
+    A durable store backed by a SQLite database in WAL mode.
+
+    Each write costs a single row upsert or delete instead of rewriting the whole dataset.
+    Writes are funneled through one writer thread that commits whatever is queued in a
+    single transaction, and resolve once committed. Expired rows are removed by a periodic
+    `DELETE ... WHERE expires_at <= now` over an indexed column.
+    """
+
+    def __init__(self, filepath: str, sweep_interval_ms: Optional[int] = 60_000, max_batch_size: int = 512):
+        """
+        Initialize the SQLiteStore.
+
+        Args:
+            filepath (str): Path to the SQLite database file. It is created if it doesn't exist.
+            sweep_interval_ms (int, optional): Milliseconds between deletions of expired rows. Pass None to only
+                expire rows lazily on read. Defaults to 60s.
+            max_batch_size (int): Maximum number of writes grouped in a single commit. Defaults to 512.
+        """
+        self._filepath = Path(filepath).resolve()
+        self._filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._sweep_interval = sweep_interval_ms / 1000 if sweep_interval_ms is not None else None
+        self._max_batch_size = max_batch_size
+
+        writer = self._connect()
+        writer.executescript(_SCHEMA)
+
+        self._reader = self._connect()
+        self._reader_lock = threading.Lock()
+        self._closed = False
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop, args=(writer,), name="SQLiteStore-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._filepath, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _make_namespace(self, namespace: Sequence[str]) -> str:
+        return "".join(part + "/" for part in namespace)
+
+    def _write_loop(self, conn: sqlite3.Connection) -> None:
+        next_sweep = time.monotonic() + self._sweep_interval if self._sweep_interval is not None else None
+
+        while True:
+            timeout = max(0.0, next_sweep - time.monotonic()) if next_sweep is not None else None
+            try:
+                first = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                first = None
+
+            batch = [] if first is None else [first]
+            while len(batch) < self._max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            closing = any(op is _CLOSE for op in batch)
+            writes = [op for op in batch if op is not _CLOSE]
+
+            sweep = next_sweep is not None and time.monotonic() >= next_sweep
+            if writes or sweep:
+                self._commit(conn, writes, sweep)
+            if sweep:
+                next_sweep = time.monotonic() + self._sweep_interval
+
+            if closing:
+                conn.close()
+                self._fail_queued()
+                return
+
+    def _execute(self, conn: sqlite3.Connection, writes: list, sweep: bool) -> Optional[BaseException]:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for statements, _, _ in writes:
+                for sql, params in statements:
+                    conn.execute(sql, params)
+            if sweep:
+                conn.execute(_DELETE_EXPIRED, (time.time() * 1000,))
+            conn.execute("COMMIT")
+        except Exception as e:
+            # Anything raised here (not only sqlite3.Error, e.g. an int too large to bind) must
+            # fail the write rather than kill the writer thread with futures left pending.
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            return e
+        return None
+
+    def _commit(self, conn: sqlite3.Connection, writes: list, sweep: bool) -> None:
+        error = self._execute(conn, writes, sweep)
+        if error is not None and len(writes) > 1:
+            # Retry one by one so a single bad write doesn't fail the writes grouped with it.
+            for write in writes:
+                self._notify(write, self._execute(conn, [write], False))
+            return
+
+        for write in writes:
+            self._notify(write, error)
+
+    def _notify(self, write: tuple, error: Optional[BaseException]) -> None:
+        _, loop, future = write
+        try:
+            loop.call_soon_threadsafe(self._resolve, future, error)
+        except RuntimeError:
+            # The writer's event loop is closed; nobody is waiting anymore.
+            pass
+
+    def _fail_queued(self) -> None:
+        error = RuntimeError("The SQLiteStore is closed.")
+        while True:
+            try:
+                op = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if op is not _CLOSE:
+                self._notify(op, error)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
+
+    async def _write(self, statements: list[tuple[str, tuple[Any, ...]]]) -> None:
+        if self._closed or not self._writer.is_alive():
+            raise RuntimeError("The SQLiteStore is closed.")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put((statements, loop, future))
+        await future
+
+    def _read(self, sql: str, params: tuple[Any, ...]) -> list[tuple[Any, ...]]:
+        with self._reader_lock:
+            return self._reader.execute(sql, params).fetchall()
+
+    async def get(self, namespace: Sequence[str], key: str) -> T | None:
+        ns = self._make_namespace(namespace)
+        rows = await asyncio.to_thread(self._read, _SELECT, (ns, key))
+        if not rows:
+            return None
+
+        value, expires_at = rows[0]
+        if expires_at is not None and time.time() * 1000 >= expires_at:
+            return None
+
+        return json.loads(value)
+
+    async def get_with_ttl(self, namespace: Sequence[str], key: str) -> tuple[T | None, int | None]:
+        rows = await asyncio.to_thread(self._read, _SELECT, (self._make_namespace(namespace), key))
+        if not rows:
+            return None, None
+
+        value, expires_at = rows[0]
+        now = time.time() * 1000
+        if expires_at is not None and now >= expires_at:
+            return None, None
+
+        return json.loads(value), int(expires_at - now) if expires_at is not None else None
+
+    async def delete(self, namespace: Sequence[str], key: str) -> None:
+        await self._write([(_DELETE, (self._make_namespace(namespace), key))])
+
+    async def put(
+        self,
+        namespace: Sequence[str],
+        key: str,
+        value: T,
+        options: Optional[StorePutOptions] = None
+    ) -> None:
+        expires_in = options.get("expires_in") if options else None
+        expires_at = time.time() * 1000 + expires_in if expires_in is not None else None
+        await self._write([(_UPSERT, (self._make_namespace(namespace), key, json.dumps(value), expires_at))])
+
+    async def mget(self, entries: Sequence[tuple[Sequence[str], str]]) -> list[T | None]:
+        if not entries:
+            return []
+
+        pairs = [(self._make_namespace(namespace), key) for namespace, key in entries]
+        rows: list[tuple[Any, ...]] = []
+        # Stay well below SQLite's limit on bound parameters per statement.
+        for start in range(0, len(pairs), 400):
+            chunk = pairs[start:start + 400]
+            sql = (
+                "SELECT namespace, key, value, expires_at FROM entries WHERE (namespace, key) IN (VALUES "
+                + ", ".join(["(?, ?)"] * len(chunk)) + ")"
+            )
+            rows += await asyncio.to_thread(self._read, sql, tuple(p for pair in chunk for p in pair))
+
+        now = time.time() * 1000
+        found = {
+            (ns, key): json.loads(value)
+            for ns, key, value, expires_at in rows
+            if expires_at is None or now < expires_at
+        }
+        return [found.get(pair) for pair in pairs]
+
+    async def mput(self, items: Sequence[tuple[Sequence[str], str, T, Optional[StorePutOptions]]]) -> None:
+        if not items:
+            return
+
+        now = time.time() * 1000
+        statements = []
+        for namespace, key, value, options in items:
+            expires_in = options.get("expires_in") if options else None
+            expires_at = now + expires_in if expires_in is not None else None
+            statements.append((_UPSERT, (self._make_namespace(namespace), key, json.dumps(value), expires_at)))
+        await self._write(statements)
+
+    async def mdelete(self, entries: Sequence[tuple[Sequence[str], str]]) -> None:
+        if not entries:
+            return
+        await self._write([(_DELETE, (self._make_namespace(namespace), key)) for namespace, key in entries])
+
+    def _prefix_range(self, prefix: Sequence[str]) -> tuple[str, str]:
+        # Namespaces are stored as "a/b/", so every namespace under "a/" sorts in ["a/", "a0").
+        low = self._make_namespace(prefix)
+        high = low[:-1] + chr(ord("/") + 1) if low else "\U0010ffff"
+        return low, high
+
+    async def list_keys(self, prefix: Sequence[str]) -> list[tuple[Sequence[str], str]]:
+        rows = await asyncio.to_thread(
+            self._read,
+            "SELECT namespace, key FROM entries WHERE namespace >= ? AND namespace < ? AND (expires_at IS NULL OR expires_at > ?)",
+            (*self._prefix_range(prefix), time.time() * 1000)
+        )
+        return [(namespace.split("/")[:-1], key) for namespace, key in rows]
+
+    async def delete_prefix(self, prefix: Sequence[str]) -> None:
+        await self._write([("DELETE FROM entries WHERE namespace >= ? AND namespace < ?", self._prefix_range(prefix))])
+
+    async def close(self) -> None:
+        """
+        Flush pending writes and close the database.
+        """
+        self._closed = True
+        if self._writer.is_alive():
+            self._queue.put(_CLOSE)
+            await asyncio.to_thread(self._writer.join)
+        self._fail_queued()
+        with self._reader_lock:
+            self._reader.close()
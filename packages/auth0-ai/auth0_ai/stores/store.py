@@ -65,3 +65,85 @@ class Store(ABC, Generic[T]):
                 - expires_in (int, optional): Time in milliseconds before the value expires. If None, it doesn't expire.
         """
         pass
+
+    async def get_with_ttl(self, namespace: Sequence[str], key: str) -> tuple[T | None, int | None]:
+        """
+        Get a value from the store along with its remaining lifetime.
+
+        The default implementation calls `get` and reports the lifetime as unknown. Stores that track
+        expirations should override it so callers such as caches can bound how long they keep a copy.
+
+        Args:
+            namespace (Sequence[str]): The namespace of the key.
+            key (str): The key.
+
+        Returns:
+            tuple[Optional[T], Optional[int]]: The stored value (None if not found) and the milliseconds left
+            before it expires (None if it doesn't expire or the store can't tell).
+        """
+        return await self.get(namespace, key), None
+
+    async def mget(self, entries: Sequence[tuple[Sequence[str], str]]) -> list[T | None]:
+        """
+        Get several values from the store.
+
+        The default implementation calls `get` for each entry. Stores that can fetch several
+        keys at once (with a single lock acquisition or network round-trip) should override it.
+
+        Args:
+            entries (Sequence[tuple[Sequence[str], str]]): The (namespace, key) pairs to get.
+
+        Returns:
+            list[Optional[T]]: The stored values (None if not found), in the same order as `entries`.
+        """
+        return [await self.get(namespace, key) for namespace, key in entries]
+
+    async def mput(self, items: Sequence[tuple[Sequence[str], str, T, Optional[StorePutOptions]]]) -> None:
+        """
+        Put several values in the store.
+
+        The default implementation calls `put` for each item.
+
+        Args:
+            items (Sequence[tuple[Sequence[str], str, T, Optional[StorePutOptions]]]): The
+                (namespace, key, value, options) tuples to store.
+        """
+        for namespace, key, value, options in items:
+            await self.put(namespace, key, value, options)
+
+    async def mdelete(self, entries: Sequence[tuple[Sequence[str], str]]) -> None:
+        """
+        Delete several values from the store.
+
+        The default implementation calls `delete` for each entry.
+
+        Args:
+            entries (Sequence[tuple[Sequence[str], str]]): The (namespace, key) pairs to delete.
+        """
+        for namespace, key in entries:
+            await self.delete(namespace, key)
+
+    async def list_keys(self, prefix: Sequence[str]) -> list[tuple[Sequence[str], str]]:
+        """
+        List the keys stored under a namespace prefix.
+
+        Args:
+            prefix (Sequence[str]): The namespace prefix. Keys in the prefix namespace itself and in any
+                nested namespace are included. An empty prefix lists every key.
+
+        Returns:
+            list[tuple[Sequence[str], str]]: The (namespace, key) pairs of the unexpired entries, in no particular order.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support listing keys.")
+
+    async def delete_prefix(self, prefix: Sequence[str]) -> None:
+        """
+        Delete every value stored under a namespace prefix, e.g. all the credentials of a thread.
+
+        The default implementation lists the keys with `list_keys` and deletes them with `mdelete`.
+
+        Args:
+            prefix (Sequence[str]): The namespace prefix. Keys in the prefix namespace itself and in any
+                nested namespace are deleted.
+        """
+        await self.mdelete(await self.list_keys(prefix))
@@ -1,3 +1,4 @@
+import sys
 from typing import Any, Callable, Generic, Optional, Sequence, TypeVar, TypedDict, Union
 from auth0_ai.stores.store import Store, StorePutOptions
 
@@ -11,25 +12,63 @@ class SubStoreParams(TypedDict, total=False):
 class SubStore(Generic[T], Store[T]):
     """
     A store that wraps a parent store, optionally prefixing namespaces and deriving TTL values from a user-defined function.
+
+    The base namespace is interned once as a tuple. When the parent is itself a plain SubStore, the
+    chain is collapsed: this store talks to the root store directly with the concatenated prefix and
+    falls back to the parent's TTL functions, so nested sub-stores add no per-call hops.
     """
 
     def __init__(self, parent: Store[Any], options: Optional[SubStoreParams[T]] = None):
         if parent is None:
             raise ValueError("Parent store is required")
 
-        self._parent = parent
-        self._base_namespace = options["base_namespace"] if options and "base_namespace" in options else []
-        self._get_ttl = options["get_ttl"] if options and "get_ttl" in options else None
+        base_namespace = tuple(sys.intern(part) for part in (options or {}).get("base_namespace") or ())
+        get_ttl = options["get_ttl"] if options and "get_ttl" in options else None
+
+        # Whether _get_ttls starts with this store's own TTL function, which an explicit expires_in overrides.
+        self._has_own_ttl = get_ttl is not None
 
-    def _full_namespace(self, namespace: Sequence[str]) -> list[str]:
-        return list(self._base_namespace) + list(namespace)
+        if type(parent) is SubStore:
+            self._parent = parent._parent
+            self._base_namespace = parent._base_namespace + base_namespace
+            self._get_ttls = ((get_ttl,) if get_ttl else ()) + parent._get_ttls
+        else:
+            self._parent = parent
+            self._base_namespace = base_namespace
+            self._get_ttls = (get_ttl,) if get_ttl else ()
+
+    def _full_namespace(self, namespace: Sequence[str]) -> tuple[str, ...]:
+        if type(namespace) is not tuple:
+            namespace = tuple(namespace)
+        return self._base_namespace + namespace if self._base_namespace else namespace
 
     async def get(self, namespace: Sequence[str], key: str) -> T | None:
         return await self._parent.get(self._full_namespace(namespace), key)
 
+    async def get_with_ttl(self, namespace: Sequence[str], key: str) -> tuple[T | None, int | None]:
+        return await self._parent.get_with_ttl(self._full_namespace(namespace), key)
+
     async def delete(self, namespace: Sequence[str], key: str) -> None:
         await self._parent.delete(self._full_namespace(namespace), key)
 
+    def _put_options(self, value: T, options: Optional[StorePutOptions]) -> Optional[StorePutOptions]:
+        get_ttls = self._get_ttls
+        expires_in = None
+        if options and "expires_in" in options:
+            expires_in = options["expires_in"]
+            # An explicit None only overrides this store's TTL function: the parents' still apply, as they
+            # would through a chain of sub-stores, since nothing is passed on to them.
+            get_ttls = get_ttls[1:] if self._has_own_ttl else get_ttls
+
+        if expires_in is None:
+            # The closest TTL function that yields a value wins.
+            for get_ttl in get_ttls:
+                expires_in = get_ttl(value)
+                if expires_in is not None:
+                    break
+
+        return {"expires_in": expires_in} if expires_in is not None else None
+
     async def put(
         self,
         namespace: Sequence[str],
@@ -37,20 +76,35 @@ class SubStore(Generic[T], Store[T]):
         value: T,
         options: Optional[StorePutOptions] = None
     ) -> None:
-        expires_in = (
-            options["expires_in"] if options and "expires_in" in options else
-            self._get_ttl(value) if self._get_ttl else None
-        )
-
-        put_options = {"expires_in": expires_in} if expires_in is not None else None
-
         await self._parent.put(
             self._full_namespace(namespace),
             key,
             value,
-            put_options
+            self._put_options(value, options)
         )
 
+    async def mget(self, entries: Sequence[tuple[Sequence[str], str]]) -> list[T | None]:
+        return await self._parent.mget([(self._full_namespace(namespace), key) for namespace, key in entries])
+
+    async def mput(self, items: Sequence[tuple[Sequence[str], str, T, Optional[StorePutOptions]]]) -> None:
+        await self._parent.mput([
+            (self._full_namespace(namespace), key, value, self._put_options(value, options))
+            for namespace, key, value, options in items
+        ])
+
+    async def mdelete(self, entries: Sequence[tuple[Sequence[str], str]]) -> None:
+        await self._parent.mdelete([(self._full_namespace(namespace), key) for namespace, key in entries])
+
+    async def list_keys(self, prefix: Sequence[str]) -> list[tuple[Sequence[str], str]]:
+        base_length = len(self._base_namespace)
+        return [
+            (namespace[base_length:], key)
+            for namespace, key in await self._parent.list_keys(self._full_namespace(prefix))
+        ]
+
+    async def delete_prefix(self, prefix: Sequence[str]) -> None:
+        await self._parent.delete_prefix(self._full_namespace(prefix))
+
     def create_sub_store(
         self,
         options: Union[
@@ -64,7 +118,7 @@ class SubStore(Generic[T], Store[T]):
 
         if isinstance(options, str):
             base_namespace = [options]
-        elif isinstance(options, list):
+        elif isinstance(options, (list, tuple)):
             base_namespace = options
         elif isinstance(options, dict):
             base_namespace = options.get("base_namespace")
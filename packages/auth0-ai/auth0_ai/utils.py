@@ -1,4 +1,5 @@
-from typing import Dict, Iterable, TypeVar, Union, Any
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Iterable, Optional, TypeVar, Union, Any
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -18,3 +19,76 @@ def omit(obj: Union[Dict[K, V], Any], keys: Iterable[K]) -> Dict[K, V]:
         return {k: v for k, v in vars(obj).items() if k not in keys_set}
 
     raise TypeError("omit() expects a dict or an object with a __dict__ attribute.")
+
+def call_soon_in_loop(loop: Optional[asyncio.AbstractEventLoop], callback: Callable[..., Any], *args: Any) -> bool:
+    """Runs `callback(*args)` on `loop` from any thread.
+
+    The callback runs right away when called from the loop's own thread, and is scheduled
+    with `call_soon_threadsafe` otherwise.
+
+    Returns False, without running the callback, if there is no loop or it is closed.
+    """
+    if loop is None or loop.is_closed():
+        return False
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if running is loop:
+        callback(*args)
+        return True
+
+    try:
+        loop.call_soon_threadsafe(callback, *args)
+    except RuntimeError:
+        # Closed meanwhile.
+        return False
+    return True
+
+class SingleFlight(Generic[V]):
+    """Coalesces concurrent calls that share a key into a single in-flight call.
+
+    The first caller for a key starts the call; callers arriving while it is still running
+    await the same result (or exception) instead of starting their own. Cancelling a waiter
+    doesn't cancel the shared call, unless `cancel_abandoned` is set and it was the last one.
+    """
+
+    def __init__(self, cancel_abandoned: bool = False):
+        """
+        Args:
+            cancel_abandoned (bool): Cancel the shared call once every caller waiting for it has been
+                cancelled, instead of letting it run to completion. Defaults to False.
+        """
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}
+        self._cancel_abandoned = cancel_abandoned
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[V]]) -> V:
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(fn())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda f: self._done(key, f))
+
+        if not self._cancel_abandoned:
+            return await asyncio.shield(flight)
+
+        self._waiters[flight] = self._waiters.get(flight, 0) + 1
+        try:
+            return await asyncio.shield(flight)
+        finally:
+            self._waiters[flight] -= 1
+            if not self._waiters[flight]:
+                del self._waiters[flight]
+                # Only a cancelled waiter leaves before the call is done.
+                if not flight.done():
+                    flight.cancel()
+
+    def _done(self, key: Hashable, flight: asyncio.Future) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the exception as retrieved in case every waiter was cancelled.
+        if not flight.cancelled():
+            flight.exception()
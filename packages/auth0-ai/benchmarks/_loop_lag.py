@@ -0,0 +1,101 @@
+"""
+Shared harness of the event-loop lag benchmarks: a local mock Auth0 endpoint, a
+probe measuring how late the event loop wakes it up, and the results table.
+
+Each benchmark provides the JSON body the mock answers with and a factory
+returning, for a mode ("blocking", "async" or "pooled"), the call made by each
+of the concurrent tool calls.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Awaitable, Callable, Optional
+
+from auth0_ai.http_pool import HttpPool
+
+Call = Callable[[int], Awaitable]
+CallFactory = Callable[[str, dict, Optional[HttpPool]], Call]
+
+MODES = ("blocking", "async", "pooled", "pooled")
+
+
+def start_mock_auth0(latency: float, response: dict) -> ThreadingHTTPServer:
+    body = json.dumps(response).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _probe(lags: list[float], stop: asyncio.Event, interval: float = 0.005) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def _run(call: Call, concurrency: int) -> tuple[float, list[float]]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[call(i) for i in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    return elapsed, lags
+
+
+async def main(description: str, response: dict, make_call: CallFactory, concurrency: int) -> None:
+    parser = argparse.ArgumentParser(description=description, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=concurrency)
+    parser.add_argument("--latency-ms", type=int, default=50)
+    args = parser.parse_args()
+
+    server = start_mock_auth0(args.latency_ms / 1000, response)
+    host, port = server.server_address
+    auth0 = {"domain": f"{host}:{port}", "client_id": "client", "client_secret": "secret", "protocol": "http"}
+
+    print(f"{'mode':>9} {'total ms':>9} {'lag p50 ms':>11} {'lag p99 ms':>11} {'lag max ms':>11}")
+    http_pool = HttpPool(limit_per_host=args.concurrency)
+    for mode in MODES:
+        call = make_call(mode, auth0, http_pool if mode == "pooled" else None)
+        elapsed, lags = await _run(call, args.concurrency)
+        lags.sort()
+        p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+        print(
+            f"{mode:>9} {elapsed * 1000:>9.0f} {statistics.median(lags) * 1000:>11.1f} "
+            f"{p99 * 1000:>11.1f} {lags[-1] * 1000:>11.1f}"
+        )
+
+    for domain, stats in http_pool.stats().items():
+        print(f"pool {domain}: {stats}")
+
+    await http_pool.close()
+    server.shutdown()
@@ -0,0 +1,48 @@
+"""
+Event-loop lag while async authorization (CIBA) requests are being started.
+
+A local mock /bc-authorize endpoint answers each request after `--latency-ms`.
+While `--concurrency` tool calls start an authorization request at once, a
+probe task measures how late the event loop wakes it up. "blocking" calls the
+synchronous BackChannelLogin client from the coroutine, as the authorizer used
+to; "async" goes through AsyncAuthorizerBase._start, and "pooled" does the same
+with an HttpPool (run twice, the second time over the connections kept alive
+by the first).
+
+Usage:
+    PYTHONPATH=. python benchmarks/backchannel_start.py [--concurrency 100] [--latency-ms 50]
+"""
+import asyncio
+from typing import Optional
+
+from auth0.authentication.back_channel_login import BackChannelLogin
+
+from auth0_ai.http_pool import HttpPool
+from auth0_ai.authorizers.async_authorization import AsyncAuthorizerBase
+
+from _loop_lag import Call, main
+
+
+def _make_call(mode: str, auth0: dict, http_pool: Optional[HttpPool]) -> Call:
+    authorizer = AsyncAuthorizerBase(
+        {"scopes": ["read"], "user_id": lambda i: f"user-{i}", "binding_message": "Approve the request"},
+        auth0,
+        http_pool,
+    )
+
+    if mode == "blocking":
+        client = BackChannelLogin(**auth0)
+
+        async def call(i: int):
+            authorize_params = await authorizer._get_authorize_params(i)
+            return client.back_channel_login(**authorize_params)
+    else:
+        async def call(i: int):
+            authorize_params = await authorizer._get_authorize_params(i)
+            return await authorizer._start(authorize_params)
+
+    return call
+
+
+if __name__ == "__main__":
+    asyncio.run(main(__doc__, {"auth_req_id": "auth-req-id", "expires_in": 300, "interval": 5}, _make_call, 100))
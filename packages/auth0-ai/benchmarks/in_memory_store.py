@@ -0,0 +1,46 @@
+"""
+Throughput of InMemoryStore versus concurrency, single lock vs. sharded.
+
+Each worker simulates a tool call on its own thread namespace: a credential
+lookup followed by a put on miss, repeated `--ops` times.
+
+Usage:
+    PYTHONPATH=. python benchmarks/in_memory_store.py [--ops 2000] [--shards 16]
+"""
+import argparse
+import asyncio
+import time
+
+from auth0_ai.stores import InMemoryStore
+
+
+async def _worker(store: InMemoryStore, thread_id: int, ops: int) -> None:
+    namespace = ["AUTH0_AI_TOKEN_VAULT", "instance", "credentials", "threads", str(thread_id)]
+    for i in range(ops):
+        key = f"credential-{i % 8}"
+        if await store.get(namespace, key) is None:
+            await store.put(namespace, key, {"access_token": "token", "expires_in": 3600}, {"expires_in": 3_600_000})
+
+
+async def _run(shards: int, concurrency: int, ops: int) -> float:
+    store = InMemoryStore(shards=shards)
+    start = time.perf_counter()
+    await asyncio.gather(*[_worker(store, t, ops) for t in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    return concurrency * ops / elapsed
+
+
+async def main(ops: int, shards: int) -> None:
+    print(f"{'concurrency':>12} {'1 shard (ops/s)':>18} {f'{shards} shards (ops/s)':>20}")
+    for concurrency in (1, 10, 100, 500, 1000):
+        single = await _run(1, concurrency, ops)
+        sharded = await _run(shards, concurrency, ops)
+        print(f"{concurrency:>12} {single:>18,.0f} {sharded:>20,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ops", type=int, default=2000, help="operations per worker")
+    parser.add_argument("--shards", type=int, default=16, help="shards for the sharded store")
+    args = parser.parse_args()
+    asyncio.run(main(args.ops, args.shards))
@@ -0,0 +1,64 @@
+"""
+Overhead of a Token Vault protected tool call when the credentials are already
+cached, compared with calling the unwrapped tool.
+
+Usage:
+    PYTHONPATH=. python benchmarks/protect_overhead.py [--calls 50000]
+"""
+import argparse
+import asyncio
+import time
+
+from auth0_ai.authorizers.token_vault_authorizer import (
+    TokenVaultAuthorizerBase,
+    TokenVaultAuthorizerParams,
+    get_access_token_from_token_vault,
+)
+
+CONTEXT = {"thread_id": "thread", "tool_name": "tool", "tool_call_id": "call"}
+
+
+async def _tool() -> str:
+    return "done"
+
+
+async def _protected_tool() -> str:
+    get_access_token_from_token_vault()
+    return "done"
+
+
+async def _time(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        await fn()
+    return (time.perf_counter() - start) / calls
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50_000)
+    args = parser.parse_args()
+
+    authorizer = TokenVaultAuthorizerBase(
+        TokenVaultAuthorizerParams(scopes=["read"], connection="google-oauth2", refresh_token="refresh-token"),
+        {"domain": "example.auth0.com", "client_id": "client", "client_secret": "secret"},
+    )
+    await authorizer.credentials_store.put(
+        ["threads", "thread"],
+        "credential",
+        {"access_token": "token", "expires_in": 3600, "scope": ["read"], "token_type": "Bearer"},
+    )
+    protected = authorizer.protect(lambda: CONTEXT, _protected_tool)
+
+    # Warm up both paths before measuring.
+    await _time(_tool, 1000)
+    await _time(protected, 1000)
+
+    unwrapped = await _time(_tool, args.calls)
+    wrapped = await _time(protected, args.calls)
+    print(f"unwrapped: {unwrapped * 1e6:.2f} us/call")
+    print(f"protected: {wrapped * 1e6:.2f} us/call (+{(wrapped - unwrapped) * 1e6:.2f} us)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
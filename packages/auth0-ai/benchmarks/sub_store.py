@@ -0,0 +1,48 @@
+"""
+Per-call overhead of a three-level SubStore chain in front of an InMemoryStore,
+mirroring how the Token Vault authorizer nests its credentials store.
+
+Usage:
+    PYTHONPATH=. python benchmarks/sub_store.py [--ops 200000]
+"""
+import argparse
+import asyncio
+import time
+
+from auth0_ai.stores import InMemoryStore, SubStore
+
+
+async def _measure(label: str, store, namespace, ops: int, baseline: float | None = None) -> float:
+    await store.put(namespace, "credential", {"access_token": "token"})
+
+    start = time.perf_counter()
+    for _ in range(ops):
+        await store.get(namespace, "credential")
+    elapsed = time.perf_counter() - start
+
+    per_call = elapsed / ops * 1e9
+    overhead = f" (+{per_call - baseline:,.0f} ns)" if baseline is not None else ""
+    print(f"{label:<28} {per_call:>8,.0f} ns/get{overhead}")
+    return per_call
+
+
+async def main(ops: int) -> None:
+    root = InMemoryStore()
+    level_1 = SubStore(root).create_sub_store("AUTH0_AI_TOKEN_VAULT")
+    level_2 = SubStore(level_1, {"base_namespace": ["0123456789abcdef0123456789abcdef", "credentials"]})
+    level_3 = level_2.create_sub_store(["threads", "thread-1"])
+
+    namespace = ["tools", "my_tool"]
+    full_namespace = [
+        "AUTH0_AI_TOKEN_VAULT", "0123456789abcdef0123456789abcdef", "credentials", "threads", "thread-1", *namespace
+    ]
+
+    baseline = await _measure("InMemoryStore (direct)", root, full_namespace, ops)
+    await _measure("3-level SubStore chain", level_3, namespace, ops, baseline)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ops", type=int, default=200_000, help="number of get calls")
+    args = parser.parse_args()
+    asyncio.run(main(args.ops))
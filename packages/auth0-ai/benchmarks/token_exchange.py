@@ -0,0 +1,57 @@
+"""
+Event-loop lag while Token Vault exchanges are in flight.
+
+A local mock token endpoint answers each exchange after `--latency-ms`. While
+`--concurrency` tool calls (each on its own thread, so each one exchanges) run,
+a probe task measures how late the event loop wakes it up. "blocking" calls the
+synchronous GetToken client from the coroutine, as the authorizer used to;
+"async" goes through TokenVaultAuthorizerBase.protect, and "pooled" does the
+same with authorizers sharing an HttpPool (run twice, the second time over
+the connections kept alive by the first).
+
+Usage:
+    PYTHONPATH=. python benchmarks/token_exchange.py [--concurrency 50] [--latency-ms 50]
+"""
+import asyncio
+from typing import Optional
+
+from auth0.authentication.get_token import GetToken
+
+from auth0_ai.http_pool import HttpPool
+from auth0_ai.authorizers.token_vault_authorizer import (
+    REQUESTED_TOKEN_TYPE_TOKEN_VAULT_ACCESS_TOKEN,
+    SUBJECT_TYPE_REFRESH_TOKEN,
+    TokenVaultAuthorizerBase,
+    TokenVaultAuthorizerParams,
+)
+
+from _loop_lag import Call, main
+
+
+def _make_call(mode: str, auth0: dict, http_pool: Optional[HttpPool]) -> Call:
+    if mode == "blocking":
+        client = GetToken(**auth0)
+
+        async def call(i: int):
+            return client.access_token_for_connection(
+                subject_token_type=SUBJECT_TYPE_REFRESH_TOKEN,
+                subject_token="refresh-token",
+                requested_token_type=REQUESTED_TOKEN_TYPE_TOKEN_VAULT_ACCESS_TOKEN,
+                connection="google-oauth2",
+            )
+
+        return call
+
+    authorizer = TokenVaultAuthorizerBase(
+        TokenVaultAuthorizerParams(scopes=["read"], connection="google-oauth2", refresh_token="refresh-token"),
+        auth0,
+        http_pool,
+    )
+    return authorizer.protect(
+        lambda i: {"thread_id": str(i), "tool_name": "tool", "tool_call_id": str(i)},
+        lambda i: None,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(__doc__, {"access_token": "token", "expires_in": 3600, "scope": "read"}, _make_call, 50))
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from auth0 import Auth0Error
+from auth0_ai.authorizers.async_authorization.async_authorizer_base import (
+    AsyncAuthorizerBase,
+    get_async_authorization_credentials,
+)
+from auth0_ai.authorizers.async_authorization.ciba_notifications import CIBANotificationReceiver
+from auth0_ai.authorizers.async_authorization.ciba_poller import CIBAPoller
+
+AUTH0 = {"domain": "tenant.auth0.com", "client_id": "client", "client_secret": "secret"}
+
+
+class FakeCIBA:
+    def __init__(self):
+        self.starts: list[dict] = []
+        self.polls = 0
+        self.approved = False
+
+    async def back_channel_login_async(self, **params):
+        self.starts.append(params)
+        await asyncio.sleep(0.01)
+        return {"auth_req_id": f"req-{len(self.starts)}", "expires_in": 60, "interval": 0.02}
+
+    async def backchannel_login_async(self, auth_req_id: str):
+        self.polls += 1
+        if not self.approved:
+            raise Auth0Error(400, "authorization_pending", "The end-user authorization is pending")
+        return {"access_token": f"token-for-{auth_req_id}", "expires_in": 3600, "scope": "openid stock:trade"}
+
+
+def make_tool(ciba: FakeCIBA, poller: CIBAPoller = None):
+    authorizer = AsyncAuthorizerBase(
+        {
+            "scopes": ["stock:trade"],
+            "user_id": "user",
+            "binding_message": "Buy 10 shares",
+            "on_authorization_request": "block",
+            "credentials_context": "thread",
+        },
+        AUTH0,
+        poller=poller,
+    )
+    authorizer.back_channel_login.back_channel_login_async = ciba.back_channel_login_async
+    authorizer.get_token.backchannel_login_async = ciba.backchannel_login_async
+
+    async def execute():
+        return get_async_authorization_credentials()["access_token"]
+
+    context = {"thread_id": "thread", "tool_name": "trade", "tool_call_id": "call"}
+    return authorizer, authorizer.protect(lambda *args, **kwargs: context, execute)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_authorization_request():
+    ciba = FakeCIBA()
+    _, tool = make_tool(ciba)
+
+    calls = [asyncio.ensure_future(tool()) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    ciba.approved = True
+
+    assert await asyncio.gather(*calls) == ["token-for-req-1"] * 3
+    assert len(ciba.starts) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_tool_call_stops_polling():
+    ciba = FakeCIBA()
+    poller = CIBAPoller()
+    _, tool = make_tool(ciba, poller)
+
+    call = asyncio.ensure_future(tool())
+    await asyncio.sleep(0.05)
+    assert poller.pending() == 1
+
+    call.cancel()
+    await asyncio.sleep(0.05)
+    polls = ciba.polls
+    await asyncio.sleep(0.1)
+
+    assert poller.pending() == 0
+    assert ciba.polls == polls
+
+
+@pytest.mark.asyncio
+async def test_sends_the_client_notification_token_in_ping_mode():
+    ciba = FakeCIBA()
+    ciba.approved = True
+    notifications = CIBANotificationReceiver(client_notification_token="secret")
+    _, tool = make_tool(ciba, CIBAPoller(notifications=notifications))
+
+    await asyncio.wait_for(tool(), 1)
+    assert ciba.starts[0]["client_notification_token"] == "secret"
+
+    ciba = FakeCIBA()
+    ciba.approved = True
+    _, tool = make_tool(ciba)
+    await asyncio.wait_for(tool(), 1)
+    assert "client_notification_token" not in ciba.starts[0]
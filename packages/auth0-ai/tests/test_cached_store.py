@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from auth0_ai.stores import CachedStore, InMemoryStore
+
+
+@pytest.fixture
+def parent():
+    return InMemoryStore(sweep_interval_ms=None)
+
+
+@pytest.mark.asyncio
+async def test_reads_through_and_counts_hits(parent):
+    await parent.put(["ns"], "key", 1)
+    store = CachedStore(parent)
+
+    assert await store.get(["ns"], "key") == 1
+    await parent.delete(["ns"], "key")
+    assert await store.get(["ns"], "key") == 1
+
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_hits_report_the_parent_entry_lifetime(parent):
+    store = CachedStore(parent, ttl_ms=1_000)
+    await parent.put(["ns"], "key", 1, {"expires_in": 3_600_000})
+
+    _, miss_ttl = await store.get_with_ttl(["ns"], "key")
+    value, hit_ttl = await store.get_with_ttl(["ns"], "key")
+
+    assert value == 1
+    assert store.stats()["hits"] == 1
+    assert 3_590_000 < hit_ttl <= miss_ttl <= 3_600_000
+
+
+@pytest.mark.asyncio
+async def test_cached_copies_never_outlive_the_entry(parent):
+    store = CachedStore(parent, ttl_ms=60_000)
+    await store.put(["ns"], "key", 1, {"expires_in": 20})
+
+    assert await store.get(["ns"], "key") == 1
+    await asyncio.sleep(0.05)
+    assert await store.get(["ns"], "key") is None
+
+
+@pytest.mark.asyncio
+async def test_local_copies_expire_after_ttl_ms(parent):
+    store = CachedStore(parent, ttl_ms=20)
+    await store.put(["ns"], "key", 1)
+    await parent.put(["ns"], "key", 2)
+
+    assert await store.get(["ns"], "key") == 1
+    await asyncio.sleep(0.05)
+    assert await store.get(["ns"], "key") == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_go_through_and_deletes_invalidate(parent):
+    store = CachedStore(parent)
+    await store.mput([(["ns"], "a", 1, None), (["ns"], "b", 2, {"expires_in": 60_000})])
+    assert await parent.mget([(["ns"], "a"), (["ns"], "b")]) == [1, 2]
+
+    await store.delete(["ns"], "a")
+    await store.mdelete([(["ns"], "b")])
+    assert await store.mget([(["ns"], "a"), (["ns"], "b")]) == [None, None]
+    assert await parent.mget([(["ns"], "a"), (["ns"], "b")]) == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_mget_serves_cached_values_without_caching_parent_reads(parent):
+    store = CachedStore(parent)
+    await store.put(["ns"], "cached", 1)
+    await parent.put(["ns"], "remote", 2)
+
+    assert await store.mget([(["ns"], "cached"), (["ns"], "remote")]) == [1, 2]
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_prefix_operations(parent):
+    store = CachedStore(parent)
+    await store.put(["t1", "credentials"], "a", 1)
+    await store.put(["t2", "credentials"], "b", 2)
+
+    assert await store.list_keys(["t1"]) == [(("t1", "credentials"), "a")]
+
+    await store.delete_prefix(["t1"])
+    assert await store.get(["t1", "credentials"], "a") is None
+    assert await store.get(["t2", "credentials"], "b") == 2
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from auth0_ai.authorizers.async_authorization import CIBANotificationReceiver, CIBAPoller
+from auth0_ai.interrupts.async_authorization_interrupts import AuthorizationPendingInterrupt
+
+
+def test_handle_checks_the_bearer_token():
+    receiver = CIBANotificationReceiver(client_notification_token="secret")
+    received: list[str] = []
+    receiver.subscribe(received.append)
+
+    assert not receiver.handle({"auth_req_id": "req"})
+    assert not receiver.handle({"auth_req_id": "req"}, "Bearer wrong")
+    assert not receiver.handle({}, "Bearer secret")
+    assert receiver.handle({"auth_req_id": "req"}, "Bearer secret")
+    assert received == ["req"]
+
+
+def test_unsubscribe_stops_notifications():
+    receiver = CIBANotificationReceiver()
+    received: list[str] = []
+    unsubscribe = receiver.subscribe(received.append)
+
+    receiver.notify("first")
+    unsubscribe()
+    receiver.notify("second")
+
+    assert received == ["first"]
+
+
+class PendingUntilNotified:
+    def __init__(self):
+        self.approved = False
+        self.polls = 0
+
+    async def __call__(self, auth_request):
+        self.polls += 1
+        if not self.approved:
+            raise AuthorizationPendingInterrupt("authorization_pending", auth_request)
+        return {"access_token": "token", "expires_in": 3600}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("from_thread", [False, True], ids=["same-loop", "other-thread"])
+async def test_notification_polls_right_away(from_thread):
+    receiver = CIBANotificationReceiver()
+    poller = CIBAPoller(notifications=receiver, fallback_interval=60)
+    fetch = PendingUntilNotified()
+    request = {"id": "req", "requested_at": time.time(), "expires_in": 60, "interval": 0.01}
+
+    future = poller.poll(request, fetch)
+    await asyncio.sleep(0.05)
+    assert fetch.polls == 1
+
+    fetch.approved = True
+    if from_thread:
+        thread = threading.Thread(target=receiver.notify, args=("req",))
+        thread.start()
+        thread.join()
+    else:
+        receiver.notify("req")
+
+    assert (await asyncio.wait_for(future, 1))["access_token"] == "token"
+    assert fetch.polls == 2
+
+
+@pytest.mark.asyncio
+async def test_notification_during_a_poll_polls_again_once_it_returns():
+    receiver = CIBANotificationReceiver()
+    poller = CIBAPoller(notifications=receiver, fallback_interval=60)
+    release = asyncio.Event()
+    polls = 0
+
+    async def fetch(auth_request):
+        nonlocal polls
+        polls += 1
+        if polls == 1:
+            await release.wait()
+            raise AuthorizationPendingInterrupt("authorization_pending", auth_request)
+        return {"access_token": "token", "expires_in": 3600}
+
+    future = poller.poll({"id": "req", "requested_at": time.time(), "expires_in": 60, "interval": 0.01}, fetch)
+    await asyncio.sleep(0.01)
+    receiver.notify("req")
+    release.set()
+
+    assert (await asyncio.wait_for(future, 1))["access_token"] == "token"
+
+
+def test_notifications_before_any_poll_are_ignored():
+    receiver = CIBANotificationReceiver()
+    CIBAPoller(notifications=receiver)
+    receiver.notify("req")
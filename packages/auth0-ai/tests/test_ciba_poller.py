@@ -0,0 +1,197 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from auth0_ai.authorizers.async_authorization.ciba_poller import CIBAPoller
+from auth0_ai.interrupts.async_authorization_interrupts import (
+    AccessDeniedInterrupt,
+    AuthorizationPendingInterrupt,
+    AuthorizationPollingInterrupt,
+)
+
+
+def make_request(id: str, interval: float = 0.02):
+    return {"id": id, "requested_at": time.time(), "expires_in": 60, "interval": interval}
+
+
+class FakeFetcher:
+    def __init__(self, pending_polls: int = 2, slow_down: bool = False):
+        self.pending_polls = pending_polls
+        self.slow_down = slow_down
+        self.polls: dict[str, list[float]] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, auth_request):
+        polls = self.polls.setdefault(auth_request["id"], [])
+        polls.append(time.monotonic())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.005)
+        finally:
+            self.in_flight -= 1
+
+        if len(polls) <= self.pending_polls:
+            if self.slow_down:
+                raise AuthorizationPollingInterrupt("slow_down", auth_request)
+            raise AuthorizationPendingInterrupt("authorization_pending", auth_request)
+        return {"access_token": f"token-for-{auth_request['id']}", "expires_in": 3600}
+
+
+@pytest.mark.asyncio
+async def test_resolves_every_request_with_bounded_concurrency():
+    poller = CIBAPoller(max_concurrency=3, jitter=0)
+    fetch = FakeFetcher()
+
+    futures = [poller.poll(make_request(f"req-{i}"), fetch) for i in range(10)]
+    assert poller.pending() == 10
+
+    results = await asyncio.wait_for(asyncio.gather(*futures), 2)
+
+    assert [result["access_token"] for result in results] == [f"token-for-req-{i}" for i in range(10)]
+    assert all(len(polls) == 3 for polls in fetch.polls.values())
+    assert fetch.max_in_flight <= 3
+    assert poller.pending() == 0
+
+
+@pytest.mark.asyncio
+async def test_polls_no_sooner_than_the_request_interval():
+    poller = CIBAPoller(jitter=0)
+    fetch = FakeFetcher()
+
+    await asyncio.wait_for(poller.poll(make_request("req", interval=0.05), fetch), 2)
+
+    polls = fetch.polls["req"]
+    assert all(later - earlier >= 0.05 for earlier, later in zip(polls, polls[1:]))
+
+
+@pytest.mark.asyncio
+async def test_other_errors_end_the_request():
+    poller = CIBAPoller()
+
+    async def deny(auth_request):
+        raise AccessDeniedInterrupt("The user denied the request", auth_request)
+
+    with pytest.raises(AccessDeniedInterrupt):
+        await asyncio.wait_for(poller.poll(make_request("req"), deny), 1)
+    assert poller.pending() == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_future_stops_polling():
+    poller = CIBAPoller()
+    fetch = FakeFetcher(pending_polls=1000)
+
+    future = poller.poll(make_request("req"), fetch)
+    await asyncio.sleep(0.05)
+    future.cancel()
+    await asyncio.sleep(0.01)
+    polls = len(fetch.polls["req"])
+    await asyncio.sleep(0.1)
+
+    assert len(fetch.polls["req"]) == polls
+    assert poller.pending() == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_down_backs_off_every_request_of_the_domain():
+    poller = CIBAPoller(jitter=0, max_backoff=4, slow_down_increase=0)
+    fetch = FakeFetcher(slow_down=True)
+
+    slowed = poller.poll(make_request("slowed", interval=0.01), fetch, "tenant.auth0.com")
+    await asyncio.sleep(0.02)
+    stats = poller.stats()["tenant.auth0.com"]
+    assert stats["backoff"] > 1
+    assert stats["slow_down_ratio"] > 0
+
+    await asyncio.wait_for(slowed, 2)
+    polls = fetch.polls["slowed"]
+    # Doubled on each slow_down: 0.01 * 2, then 0.01 * 4.
+    assert polls[1] - polls[0] >= 0.02
+    assert polls[2] - polls[1] >= 0.04
+
+    # Another request against the same domain starts backed off too.
+    other = FakeFetcher(pending_polls=1)
+    await asyncio.wait_for(poller.poll(make_request("other", interval=0.01), other, "tenant.auth0.com"), 2)
+    assert other.polls["other"][1] - other.polls["other"][0] >= 0.02
+
+    assert "other.auth0.com" not in poller.stats()
+
+
+@pytest.mark.asyncio
+async def test_honors_retry_after():
+    poller = CIBAPoller(jitter=0, slow_down_increase=0.01)
+    polls: list[float] = []
+
+    async def fetch(auth_request):
+        polls.append(time.monotonic())
+        if len(polls) == 1:
+            raise AuthorizationPollingInterrupt("slow_down", auth_request, retry_after=0.1)
+        return {"access_token": "token", "expires_in": 3600}
+
+    await asyncio.wait_for(poller.poll(make_request("req", interval=0.01), fetch), 2)
+    assert polls[1] - polls[0] >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_backoff_recovers_once_slow_down_stops():
+    poller = CIBAPoller(jitter=0, slow_down_increase=0)
+    fetch = FakeFetcher(pending_polls=1, slow_down=True)
+    await asyncio.wait_for(poller.poll(make_request("req", interval=0.01), fetch), 2)
+    backoff = poller.stats()[None]["backoff"]
+
+    fetch = FakeFetcher(pending_polls=5)
+    await asyncio.wait_for(poller.poll(make_request("next", interval=0.01), fetch), 2)
+
+    assert 1 <= poller.stats()[None]["backoff"] < backoff
+
+
+@pytest.mark.asyncio
+async def test_slow_down_increases_the_request_interval_for_good():
+    poller = CIBAPoller(jitter=0, max_backoff=1, slow_down_increase=0.05)
+    polls: list[float] = []
+
+    async def fetch(auth_request):
+        polls.append(time.monotonic())
+        if len(polls) == 1:
+            raise AuthorizationPollingInterrupt("slow_down", auth_request)
+        if len(polls) < 4:
+            raise AuthorizationPendingInterrupt("authorization_pending", auth_request)
+        return {"access_token": "token", "expires_in": 3600}
+
+    await asyncio.wait_for(poller.poll(make_request("req", interval=0.01), fetch), 2)
+
+    # Every poll after the slow_down waits the original interval plus the increase.
+    assert all(later - earlier >= 0.06 for earlier, later in zip(polls, polls[1:]))
+
+
+def test_polls_from_several_event_loops_at_once():
+    poller = CIBAPoller(jitter=0)
+    approved = threading.Event()
+    results: dict[str, str] = {}
+
+    async def fetch(auth_request):
+        if not approved.is_set():
+            raise AuthorizationPendingInterrupt("authorization_pending", auth_request)
+        return {"access_token": f"token-for-{auth_request['id']}", "expires_in": 3600}
+
+    def run(id):
+        async def wait():
+            return await asyncio.wait_for(poller.poll(make_request(id), fetch), 2)
+
+        results[id] = asyncio.run(wait())["access_token"]
+
+    threads = [threading.Thread(target=run, args=(f"req-{i}",)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    assert poller.pending() == 2
+
+    approved.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == {"req-0": "token-for-req-0", "req-1": "token-for-req-1"}
+    assert poller.pending() == 0
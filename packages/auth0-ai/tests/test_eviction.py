@@ -0,0 +1,135 @@
+import random
+
+import pytest
+from auth0_ai.stores import InMemoryStore
+from auth0_ai.stores.eviction import CapacityLimiter, LFUEvictionPolicy, LRUEvictionPolicy, TTLEvictionPolicy
+
+
+def test_lru_evicts_least_recently_used():
+    policy = LRUEvictionPolicy()
+    for key in ("a", "b", "c"):
+        policy.on_insert(key, None)
+    policy.on_access("a")
+
+    assert policy.select_victim() == "b"
+    policy.on_remove("b")
+    assert policy.select_victim() == "c"
+
+
+def test_lfu_evicts_least_frequently_used_then_least_recent():
+    policy = LFUEvictionPolicy()
+    for key in ("a", "b", "c"):
+        policy.on_insert(key, None)
+    policy.on_access("a")
+    policy.on_access("a")
+    policy.on_access("c")
+
+    assert policy.select_victim() == "b"
+    policy.on_remove("b")
+    assert policy.select_victim() == "c"
+    policy.on_remove("c")
+    assert policy.select_victim() == "a"
+    policy.on_remove("a")
+    assert policy.select_victim() is None
+
+
+def test_lfu_min_frequency_moves_up_when_bucket_empties():
+    policy = LFUEvictionPolicy()
+    policy.on_insert("a", None)
+    policy.on_insert("b", None)
+    policy.on_access("b")
+    policy.on_access("b")
+    policy.on_remove("a")
+
+    assert policy.select_victim() == "b"
+    policy.on_insert("c", None)
+    assert policy.select_victim() == "c"
+
+
+def test_ttl_evicts_closest_to_expiring_then_entries_without_ttl():
+    policy = TTLEvictionPolicy()
+    policy.on_insert("forever", None)
+    policy.on_insert("late", 2000)
+    policy.on_insert("soon", 1000)
+
+    assert policy.select_victim() == "soon"
+    policy.on_insert("soon", 3000)
+    assert policy.select_victim() == "late"
+    policy.on_remove("late")
+    policy.on_remove("soon")
+    assert policy.select_victim() == "forever"
+
+
+def test_capacity_limiter_makes_room_by_bytes():
+    limiter = CapacityLimiter(None, 10, "lru")
+    limiter.track("a", 4, None)
+    limiter.track("b", 4, None)
+
+    victims = []
+    for victim in limiter.make_room(2, 4):
+        victims.append(victim)
+        limiter.untrack(victim)
+
+    assert victims == ["a"]
+    assert limiter.bytes == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy", ["lru", "lfu", "ttl"])
+async def test_in_memory_store_respects_max_entries(policy):
+    store = InMemoryStore(max_entries=3, eviction_policy=policy, sweep_interval_ms=None)
+    for i in range(10):
+        await store.put(["ns"], str(i), i, {"expires_in": 60_000 + i})
+
+    stats = store.stats()
+    assert stats["entries"] == 3
+    assert stats["evictions"] == 7
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_lru_keeps_recently_read_entries():
+    store = InMemoryStore(max_entries=2, eviction_policy="lru", sweep_interval_ms=None)
+    await store.put(["ns"], "a", 1)
+    await store.put(["ns"], "b", 2)
+    await store.get(["ns"], "a")
+    await store.put(["ns"], "c", 3)
+
+    assert await store.mget([(["ns"], "a"), (["ns"], "b"), (["ns"], "c")]) == [1, None, 3]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_respects_max_bytes():
+    store = InMemoryStore(max_bytes=20, eviction_policy="lru", sweep_interval_ms=None)
+    for i in range(5):
+        await store.put(["ns"], str(i), "x" * 6)
+
+    stats = store.stats()
+    assert stats["bytes"] <= 20
+    assert stats["evictions"] == 3
+
+
+def test_lfu_matches_a_reference_model():
+    policy = LFUEvictionPolicy()
+    freqs: dict[str, int] = {}
+    recency: dict[str, int] = {}
+    rng = random.Random(0)
+
+    for step in range(2000):
+        key = f"k{rng.randrange(20)}"
+        action = rng.random()
+        if action < 0.4:
+            policy.on_insert(key, None)
+            freqs[key] = freqs.get(key, 0) + 1
+            recency[key] = step
+        elif action < 0.8:
+            policy.on_access(key)
+            if key in freqs:
+                freqs[key] += 1
+                recency[key] = step
+        else:
+            policy.on_remove(key)
+            freqs.pop(key, None)
+            recency.pop(key, None)
+
+        expected = min(freqs, key=lambda k: (freqs[k], recency[k])) if freqs else None
+        assert policy.select_victim() == expected
@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+import pytest
+from auth0_ai.stores import FSStore
+
+
+async def _flush():
+    await asyncio.sleep(0.05)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("journal", [False, True], ids=["document", "journal"])
+async def test_round_trip_and_reload(tmp_path, journal):
+    path = str(tmp_path / "store.json")
+    store = FSStore(path, debounce_ms=1, journal=journal)
+    await store.put(["a", "b"], "key", {"value": 1})
+    await store.put(["a", "b"], "gone", 2)
+    await store.delete(["a", "b"], "gone")
+
+    assert await store.get(["a", "b"], "key") == {"value": 1}
+    assert await store.get(["a", "b"], "gone") is None
+    await _flush()
+
+    reloaded = FSStore(path, journal=journal)
+    assert await reloaded.get(["a", "b"], "key") == {"value": 1}
+    assert await reloaded.get(["a", "b"], "gone") is None
+
+
+@pytest.mark.asyncio
+async def test_ttl(tmp_path):
+    store = FSStore(str(tmp_path / "store.json"), debounce_ms=1)
+    await store.put(["ns"], "short", 1, {"expires_in": 20})
+    await store.put(["ns"], "long", 2, {"expires_in": 60_000})
+
+    value, ttl = await store.get_with_ttl(["ns"], "long")
+    assert value == 2
+    assert 59_000 < ttl <= 60_000
+
+    await asyncio.sleep(0.05)
+    assert await store.get(["ns"], "short") is None
+
+
+@pytest.mark.asyncio
+async def test_list_keys_and_delete_prefix(tmp_path):
+    store = FSStore(str(tmp_path / "store.json"), debounce_ms=1, journal=True)
+    await store.put(["t1", "credentials"], "a", 1)
+    await store.put(["t1", "credentials", "tool"], "b", 2)
+    await store.put(["t10", "credentials"], "c", 3)
+
+    assert sorted((tuple(ns), key) for ns, key in await store.list_keys(["t1"])) == [
+        (("t1", "credentials"), "a"),
+        (("t1", "credentials", "tool"), "b"),
+    ]
+
+    await store.delete_prefix(["t1"])
+    assert await store.mget([(["t1", "credentials"], "a"), (["t10", "credentials"], "c")]) == [None, 3]
+
+
+@pytest.mark.asyncio
+async def test_journal_appends_records(tmp_path):
+    path = tmp_path / "store.jsonl"
+    store = FSStore(str(path), debounce_ms=1, journal=True)
+    await store.put(["ns"], "key", 1)
+    await _flush()
+    await store.put(["ns"], "key", 2)
+    await _flush()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["value"] for record in records] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_journal_keeps_records_when_a_write_fails(tmp_path, capsys):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    path = blocker / "store.jsonl"
+
+    store = FSStore(str(path), debounce_ms=1, journal=True)
+    await store.put(["ns"], "a", 1)
+    await _flush()
+    assert "Failed to persist" in capsys.readouterr().out
+
+    blocker.unlink()
+    await store.put(["ns"], "b", 2)
+    await _flush()
+
+    reloaded = FSStore(str(path), journal=True)
+    assert await reloaded.mget([(["ns"], "a"), (["ns"], "b")]) == [1, 2]
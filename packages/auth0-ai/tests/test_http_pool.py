@@ -0,0 +1,154 @@
+import asyncio
+import threading
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from auth0_ai.authorizers.async_authorization import AsyncAuthorizerBase
+from auth0_ai.http_pool import HttpPool
+
+AUTH0 = {"domain": "tenant.auth0.com", "client_id": "client", "client_secret": "secret"}
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_shared_per_domain():
+    pool = HttpPool()
+    try:
+        assert pool.session("a.auth0.com") is pool.session("a.auth0.com")
+        assert pool.session("a.auth0.com") is not pool.session("b.auth0.com")
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused():
+    async def handler(request):
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    pool = HttpPool()
+    try:
+        session = pool.session("local")
+        for _ in range(3):
+            async with session.get(f"http://127.0.0.1:{port}/") as response:
+                await response.json()
+
+        assert pool.stats()["local"] == {"requests": 3, "connections_created": 1, "connections_reused": 2}
+    finally:
+        await pool.close()
+        await runner.cleanup()
+
+
+@pytest_asyncio.fixture
+async def auth0_server():
+    async def bc_authorize(request):
+        return web.json_response({"auth_req_id": "id", "expires_in": 300, "interval": 5})
+
+    app = web.Application()
+    app.router.add_post("/bc-authorize", bc_authorize)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    yield f"127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_async_authorizer_sends_requests_over_the_pool(auth0_server):
+    pool = HttpPool()
+    auth0 = {"domain": auth0_server, "client_id": "client", "client_secret": "secret", "protocol": "http"}
+    authorizer = AsyncAuthorizerBase({"scopes": ["read"], "user_id": "user", "binding_message": "ok"}, auth0, pool)
+    params = {"scope": "openid read", "binding_message": "ok", "login_hint": "{}"}
+    try:
+        for _ in range(3):
+            assert (await authorizer._start(params))["id"] == "id"
+
+        assert pool.stats()[auth0_server] == {"requests": 3, "connections_created": 1, "connections_reused": 2}
+    finally:
+        await pool.close()
+
+
+def test_each_event_loop_gets_its_own_session_closed_with_the_loop():
+    pool = HttpPool()
+    sessions = []
+
+    def run():
+        async def use():
+            session = pool.session("a.auth0.com")
+            assert pool.session("a.auth0.com") is session
+            sessions.append(session)
+
+        asyncio.run(use())
+
+    threads = [threading.Thread(target=run) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(sessions) == 2 and sessions[0] is not sessions[1]
+    assert all(session.closed for session in sessions)
+
+
+def test_a_client_shared_by_several_loops_uses_the_session_of_each_loop():
+    server_loop = asyncio.new_event_loop()
+    started = threading.Event()
+    address = {}
+
+    async def serve():
+        async def bc_authorize(request):
+            await asyncio.sleep(0.005)
+            return web.json_response({"auth_req_id": "id", "expires_in": 300, "interval": 5})
+
+        app = web.Application()
+        app.router.add_post("/bc-authorize", bc_authorize)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        address["domain"] = f"127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        address["runner"] = runner
+        started.set()
+
+    server = threading.Thread(target=lambda: (server_loop.run_until_complete(serve()), server_loop.run_forever()))
+    server.start()
+    started.wait()
+
+    pool = HttpPool()
+    auth0 = {"domain": address["domain"], "client_id": "client", "client_secret": "secret", "protocol": "http"}
+    authorizer = AsyncAuthorizerBase({"scopes": ["read"], "user_id": "user", "binding_message": "ok"}, auth0, pool)
+    params = {"scope": "openid read", "binding_message": "ok", "login_hint": "{}"}
+    errors = []
+
+    def run():
+        async def start_several():
+            for _ in range(5):
+                await authorizer._start(params)
+
+        try:
+            asyncio.run(start_several())
+        except Exception as e:
+            errors.append(e)
+
+    try:
+        threads = [threading.Thread(target=run) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        asyncio.run_coroutine_threadsafe(address["runner"].cleanup(), server_loop).result()
+        server_loop.call_soon_threadsafe(server_loop.stop)
+        server.join()
+        server_loop.close()
+
+    assert errors == []
+    assert pool.stats()[address["domain"]]["requests"] == 15
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+from auth0_ai.stores import InMemoryStore
+
+
+@pytest.fixture(params=[1, 4], ids=["single", "sharded"])
+def store(request):
+    return InMemoryStore(shards=request.param, sweep_interval_ms=None)
+
+
+@pytest.mark.asyncio
+async def test_put_get_delete(store):
+    await store.put(["a", "b"], "key", {"value": 1})
+
+    assert await store.get(["a", "b"], "key") == {"value": 1}
+    assert await store.get(["a"], "key") is None
+
+    await store.delete(["a", "b"], "key")
+    assert await store.get(["a", "b"], "key") is None
+
+
+@pytest.mark.asyncio
+async def test_batch_operations(store):
+    await store.mput([(["ns"], str(i), i, None) for i in range(20)])
+
+    assert await store.mget([(["ns"], str(i)) for i in range(20)]) == list(range(20))
+
+    await store.mdelete([(["ns"], str(i)) for i in range(0, 20, 2)])
+    assert await store.mget([(["ns"], "0"), (["ns"], "1")]) == [None, 1]
+
+
+@pytest.mark.asyncio
+async def test_sharded_store_serves_concurrent_writers():
+    store = InMemoryStore(shards=8, sweep_interval_ms=None)
+
+    await asyncio.gather(*[store.put(["ns", str(i % 5)], str(i), i) for i in range(200)])
+
+    assert store.stats()["entries"] == 200
+    assert await store.get(["ns", "3"], "13") == 13
+
+
+def test_rejects_invalid_shard_count():
+    with pytest.raises(ValueError):
+        InMemoryStore(shards=0)
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl(store):
+    await store.put(["ns"], "short", 1, {"expires_in": 20})
+    await store.put(["ns"], "long", 2, {"expires_in": 60_000})
+
+    value, ttl = await store.get_with_ttl(["ns"], "long")
+    assert value == 2
+    assert 59_000 < ttl <= 60_000
+
+    await asyncio.sleep(0.05)
+    assert await store.get(["ns"], "short") is None
+    assert await store.get(["ns"], "long") == 2
+
+
+@pytest.mark.asyncio
+async def test_sweep_removes_expired_entries_without_reads(store):
+    for i in range(50):
+        await store.put(["ns"], str(i), i, {"expires_in": 10})
+    await store.put(["ns"], "kept", 1)
+
+    await asyncio.sleep(0.03)
+
+    assert await store.sweep() == 50
+    stats = store.stats()
+    assert stats["entries"] == 1
+    assert stats["expirations"] == 50
+
+
+@pytest.mark.asyncio
+async def test_background_sweeper_runs_until_closed():
+    store = InMemoryStore(sweep_interval_ms=10)
+    await store.put(["ns"], "key", 1, {"expires_in": 5})
+
+    await asyncio.sleep(0.05)
+    assert store.stats()["entries"] == 0
+
+    await store.close()
+    assert store._sweep_task is None
+
+
+@pytest.mark.asyncio
+async def test_list_keys_and_delete_prefix(store):
+    await store.put(["t1", "credentials"], "a", 1)
+    await store.put(["t1", "credentials", "tool"], "b", 2)
+    await store.put(["t2", "credentials"], "c", 3)
+    await store.put(["t1", "expired"], "d", 4, {"expires_in": 1})
+    await asyncio.sleep(0.01)
+
+    assert sorted((tuple(ns), key) for ns, key in await store.list_keys(["t1"])) == [
+        (("t1", "credentials"), "a"),
+        (("t1", "credentials", "tool"), "b"),
+    ]
+
+    await store.delete_prefix(["t1", "credentials"])
+    assert await store.get(["t1", "credentials"], "a") is None
+    assert await store.get(["t1", "credentials", "tool"], "b") is None
+    assert await store.get(["t2", "credentials"], "c") == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy", ["lru", "lfu", "ttl"])
+async def test_overwriting_expired_key_keeps_it_indexed(policy):
+    store = InMemoryStore(max_entries=10, eviction_policy=policy, sweep_interval_ms=None)
+    await store.put(["t1", "credentials"], "key", 1, {"expires_in": 10})
+    await asyncio.sleep(0.03)
+    await store.put(["t1", "credentials"], "key", 2)
+
+    assert await store.get(["t1", "credentials"], "key") == 2
+    assert await store.list_keys(["t1"]) == [(("t1", "credentials"), "key")]
+
+    await store.delete_prefix(["t1"])
+    assert await store.get(["t1", "credentials"], "key") is None
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+from auth0_ai.stores import RedisStore
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def store():
+    return RedisStore(client=fakeredis.aioredis.FakeRedis())
+
+
+@pytest.mark.asyncio
+async def test_put_get_delete(store):
+    await store.put(["a", "b"], "key", {"value": 1})
+
+    assert await store.get(["a", "b"], "key") == {"value": 1}
+    assert await store.get(["a"], "key") is None
+
+    await store.delete(["a", "b"], "key")
+    assert await store.get(["a", "b"], "key") is None
+
+
+@pytest.mark.asyncio
+async def test_ttl(store):
+    await store.put(["ns"], "short", 1, {"expires_in": 20})
+    await store.put(["ns"], "long", 2, {"expires_in": 60_000})
+    await store.put(["ns"], "forever", 3)
+
+    value, ttl = await store.get_with_ttl(["ns"], "long")
+    assert value == 2
+    assert 59_000 < ttl <= 60_000
+    assert await store.get_with_ttl(["ns"], "forever") == (3, None)
+    assert await store.get_with_ttl(["ns"], "missing") == (None, None)
+
+    await asyncio.sleep(0.05)
+    assert await store.get(["ns"], "short") is None
+
+
+@pytest.mark.asyncio
+async def test_batch_operations(store):
+    await store.mput([(["ns"], str(i), i, {"expires_in": 60_000}) for i in range(10)])
+
+    assert await store.mget([(["ns"], str(i)) for i in range(10)]) == list(range(10))
+
+    await store.mdelete([(["ns"], "0"), (["ns"], "1")])
+    assert await store.mget([(["ns"], "0"), (["ns"], "2")]) == [None, 2]
+    assert await store.mget([]) == []
+
+
+@pytest.mark.asyncio
+async def test_list_keys_and_delete_prefix(store):
+    await store.put(["t1", "credentials"], "a", 1)
+    await store.put(["t1", "credentials", "tool"], "b", 2)
+    await store.put(["t1*", "credentials"], "c", 3)
+    await store.put(["t2", "credentials"], "d", 4)
+
+    assert sorted((tuple(ns), key) for ns, key in await store.list_keys(["t1"])) == [
+        (("t1", "credentials"), "a"),
+        (("t1", "credentials", "tool"), "b"),
+    ]
+
+    await store.delete_prefix(["t1"])
+    assert await store.mget([
+        (["t1", "credentials"], "a"),
+        (["t1*", "credentials"], "c"),
+        (["t2", "credentials"], "d"),
+    ]) == [None, 3, 4]
+
+
+def test_requires_url_or_client():
+    with pytest.raises(ValueError):
+        RedisStore()
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from auth0_ai.stores import SQLiteStore
+
+
+@pytest_asyncio.fixture
+async def store(tmp_path):
+    store = SQLiteStore(str(tmp_path / "store.db"), sweep_interval_ms=None)
+    yield store
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_put_get_delete(store):
+    await store.put(["a", "b"], "key", {"value": 1})
+
+    assert await store.get(["a", "b"], "key") == {"value": 1}
+    assert await store.get(["a"], "key") is None
+
+    await store.delete(["a", "b"], "key")
+    assert await store.get(["a", "b"], "key") is None
+
+
+@pytest.mark.asyncio
+async def test_ttl(store):
+    await store.put(["ns"], "short", 1, {"expires_in": 20})
+    await store.put(["ns"], "long", 2, {"expires_in": 60_000})
+
+    value, ttl = await store.get_with_ttl(["ns"], "long")
+    assert value == 2
+    assert 59_000 < ttl <= 60_000
+
+    await asyncio.sleep(0.05)
+    assert await store.get(["ns"], "short") is None
+    assert await store.get_with_ttl(["ns"], "short") == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_are_group_committed(store):
+    await asyncio.gather(*[store.put(["ns"], str(i), i) for i in range(200)])
+
+    assert await store.mget([(["ns"], str(i)) for i in range(200)]) == list(range(200))
+
+
+@pytest.mark.asyncio
+async def test_list_keys_and_delete_prefix(store):
+    await store.put(["t1", "credentials"], "a", 1)
+    await store.put(["t1", "credentials", "tool"], "b", 2)
+    await store.put(["t10", "credentials"], "c", 3)
+    await store.put(["t1", "expired"], "d", 4, {"expires_in": 1})
+    await asyncio.sleep(0.01)
+
+    assert sorted((tuple(ns), key) for ns, key in await store.list_keys(["t1"])) == [
+        (("t1", "credentials"), "a"),
+        (("t1", "credentials", "tool"), "b"),
+    ]
+
+    await store.delete_prefix(["t1"])
+    assert await store.mget([(["t1", "credentials"], "a"), (["t10", "credentials"], "c")]) == [None, 3]
+
+
+@pytest.mark.asyncio
+async def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / "store.db")
+    store = SQLiteStore(path, sweep_interval_ms=None)
+    await store.put(["ns"], "key", "value")
+    await store.close()
+
+    reopened = SQLiteStore(path, sweep_interval_ms=None)
+    try:
+        assert await reopened.get(["ns"], "key") == "value"
+    finally:
+        await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_write_does_not_stop_the_writer(store):
+    results = await asyncio.gather(
+        store.put(["ns"], 2 ** 70, "unbindable"),
+        store.put(["ns"], "ok", 1),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], OverflowError)
+    assert results[1] is None
+    await store.put(["ns"], "after", 2)
+    assert await store.mget([(["ns"], "ok"), (["ns"], "after")]) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_writes_fail_once_closed(tmp_path):
+    store = SQLiteStore(str(tmp_path / "store.db"), sweep_interval_ms=None)
+    await store.close()
+
+    with pytest.raises(RuntimeError):
+        await store.put(["ns"], "key", 1)
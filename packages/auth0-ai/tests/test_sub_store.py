@@ -0,0 +1,54 @@
+import pytest
+from auth0_ai.stores import InMemoryStore, SubStore
+
+
+def ttl_of(ms):
+    return lambda value: ms
+
+
+@pytest.mark.asyncio
+async def test_nested_sub_stores_prefix_namespaces_in_order():
+    root = InMemoryStore()
+    child = SubStore(root).create_sub_store("a").create_sub_store(["b", "c"]).create_sub_store({"base_namespace": ["d"]})
+
+    await child.put(["ns"], "key", "value")
+
+    assert await root.get(["a", "b", "c", "d", "ns"], "key") == "value"
+    assert await child.get(("ns",), "key") == "value"
+    assert [(list(namespace), key) for namespace, key in await child.list_keys([])] == [(["ns"], "key")]
+
+    await child.delete_prefix(["ns"])
+    assert await root.get(["a", "b", "c", "d", "ns"], "key") is None
+
+
+@pytest.mark.asyncio
+async def test_ttl_precedence_through_a_chain():
+    root = InMemoryStore()
+    parent = SubStore(root, {"base_namespace": ["p"], "get_ttl": ttl_of(1_000)})
+    with_ttl = parent.create_sub_store({"base_namespace": ["c"], "get_ttl": ttl_of(5_000)})
+    without_ttl = parent.create_sub_store({"base_namespace": ["c"], "get_ttl": ttl_of(None)})
+    plain = parent.create_sub_store("c")
+
+    async def ttl(key):
+        return (await root.get_with_ttl(["p", "c"], key))[1]
+
+    await with_ttl.put([], "own", "value")
+    await without_ttl.put([], "falls-back", "value")
+    await plain.put([], "inherited", "value")
+    await with_ttl.put([], "explicit", "value", {"expires_in": 10_000})
+    await with_ttl.put([], "explicit-none", "value", {"expires_in": None})
+
+    assert 4_000 < await ttl("own") <= 5_000
+    assert 0 < await ttl("falls-back") <= 1_000
+    assert 0 < await ttl("inherited") <= 1_000
+    assert 9_000 < await ttl("explicit") <= 10_000
+    # Like a chain of sub-stores: an explicit None overrides the child's TTL function, not the parent's.
+    assert 0 < await ttl("explicit-none") <= 1_000
+
+
+@pytest.mark.asyncio
+async def test_explicit_none_without_any_ttl_function_never_expires():
+    root = InMemoryStore()
+    await SubStore(root, {"base_namespace": ["p"]}).create_sub_store("c").put([], "key", "value", {"expires_in": None})
+
+    assert await root.get_with_ttl(["p", "c"], "key") == ("value", None)
@@ -0,0 +1,231 @@
+import asyncio
+from typing import Optional, Sequence
+
+import pytest
+from auth0 import Auth0Error
+from auth0_ai.authorizers.token_vault_authorizer import (
+    TokenVaultAuthorizerBase,
+    TokenVaultAuthorizerParams,
+    get_access_token_from_token_vault,
+    prewarm,
+)
+from auth0_ai.interrupts.token_vault_interrupt import TokenVaultError, TokenVaultInterrupt
+from auth0_ai.stores import InMemoryStore, Store, StorePutOptions
+
+AUTH0 = {"domain": "tenant.auth0.com", "client_id": "client", "client_secret": "secret"}
+CONTEXT = {"thread_id": "thread", "tool_name": "tool", "tool_call_id": "call"}
+
+
+class FakeTokenEndpoint:
+    def __init__(self, scope: str = "read", expires_in: int = 3600):
+        self.scope = scope
+        self.expires_in = expires_in
+        self.error: Optional[Auth0Error] = None
+        self.calls = 0
+
+    async def __call__(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.error is not None:
+            raise self.error
+        return {"access_token": f"token-{self.calls}", "expires_in": self.expires_in, "scope": self.scope}
+
+
+class BasicStore(Store):
+    """A store implementing only the required operations."""
+
+    def __init__(self):
+        self._store = InMemoryStore(sweep_interval_ms=None)
+
+    async def get(self, namespace: Sequence[str], key: str):
+        return await self._store.get(namespace, key)
+
+    async def delete(self, namespace: Sequence[str], key: str) -> None:
+        await self._store.delete(namespace, key)
+
+    async def put(self, namespace: Sequence[str], key: str, value, options: Optional[StorePutOptions] = None) -> None:
+        await self._store.put(namespace, key, value, options)
+
+
+def make_tool(endpoint: FakeTokenEndpoint, scopes=("read",), **params):
+    params.setdefault("store", InMemoryStore())
+    authorizer = TokenVaultAuthorizerBase(
+        TokenVaultAuthorizerParams(scopes=list(scopes), connection="google-oauth2", refresh_token="refresh-token", **params),
+        AUTH0,
+    )
+    authorizer.get_token.access_token_for_connection_async = endpoint
+    authorizer._handle_authorization_interrupts = lambda interrupt: interrupt
+    tool = authorizer.protect(lambda *args, **kwargs: CONTEXT, lambda: get_access_token_from_token_vault())
+    return authorizer, tool
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_exchange():
+    endpoint = FakeTokenEndpoint()
+    _, tool = make_tool(endpoint)
+
+    assert await asyncio.gather(*[tool() for _ in range(10)]) == ["token-1"] * 10
+    assert await tool() == "token-1"
+    assert endpoint.calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("store_factory", [InMemoryStore, BasicStore], ids=["in-memory", "basic"])
+async def test_reuses_a_connection_token_covering_the_required_scopes(store_factory):
+    store = store_factory()
+    endpoint = FakeTokenEndpoint(scope="read write")
+    _, broad = make_tool(endpoint, scopes=["read", "write"], store=store)
+    _, narrow = make_tool(endpoint, scopes=["write"], store=store)
+    _, other = make_tool(endpoint, scopes=["admin"], store=store)
+
+    assert await broad() == "token-1"
+    assert await narrow() == "token-1"
+    assert endpoint.calls == 1
+
+    interrupt = await other()
+    assert isinstance(interrupt, TokenVaultInterrupt)
+    assert endpoint.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_does_not_reuse_tokens_about_to_expire():
+    store = InMemoryStore()
+    endpoint = FakeTokenEndpoint(scope="read write", expires_in=1)
+    _, broad = make_tool(endpoint, scopes=["read", "write"], store=store)
+    _, narrow = make_tool(endpoint, scopes=["write"], store=store)
+
+    await broad()
+    assert await narrow() == "token-2"
+
+
+@pytest.mark.asyncio
+async def test_negative_cache_skips_the_token_endpoint_until_it_lapses():
+    endpoint = FakeTokenEndpoint()
+    endpoint.error = Auth0Error(403, "federated_connection_refresh_token_not_found", "Not linked")
+    _, tool = make_tool(endpoint, negative_cache_ttl_ms=50)
+
+    assert isinstance(await tool(), TokenVaultInterrupt)
+    assert isinstance(await tool(), TokenVaultInterrupt)
+    assert endpoint.calls == 1
+
+    await asyncio.sleep(0.06)
+    endpoint.error = None
+    assert await tool() == "token-2"
+    assert endpoint.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_stored_credentials_clear_the_negative_cache():
+    store = InMemoryStore()
+    endpoint = FakeTokenEndpoint(scope="read write")
+    endpoint.error = Auth0Error(403, "federated_connection_refresh_token_not_found", "Not linked")
+    _, narrow = make_tool(endpoint, scopes=["write"], store=store, negative_cache_ttl_ms=60_000)
+    assert isinstance(await narrow(), TokenVaultInterrupt)
+
+    # Another authorizer on the connection obtains credentials once the user links it.
+    endpoint.error = None
+    authorizer, broad = make_tool(endpoint, scopes=["read", "write"], store=store)
+    assert await broad() == "token-2"
+
+    assert await narrow() == "token-2"
+    digest = authorizer._subject_digest("refresh-token")
+    assert await authorizer.failed_exchanges_store.get([], digest) is None
+
+
+@pytest.mark.asyncio
+async def test_prewarm_reports_each_authorizer_and_warms_the_cache():
+    store = InMemoryStore()
+    ok = FakeTokenEndpoint()
+    unlinked = FakeTokenEndpoint()
+    unlinked.error = Auth0Error(403, "federated_connection_refresh_token_not_found", "Not linked")
+    broken = FakeTokenEndpoint()
+    broken.error = Auth0Error(503, "unavailable", "Service unavailable")
+
+    warm, tool = make_tool(ok, store=store)
+    authorizers = [
+        warm,
+        make_tool(unlinked, scopes=["write"], store=store)[0],
+        make_tool(broken, scopes=["admin"], store=store)[0],
+    ]
+
+    results = await prewarm({"thread_id": "thread"}, authorizers)
+
+    assert results[0] is None
+    assert isinstance(results[1], TokenVaultInterrupt)
+    assert isinstance(results[2], Auth0Error)
+    assert await tool() == "token-1"
+    assert ok.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_ahead_exchanges_in_the_background_once():
+    endpoint = FakeTokenEndpoint(expires_in=1)
+    authorizer, tool = make_tool(endpoint, refresh_ahead=0.2)
+
+    assert await tool() == "token-1"
+    await asyncio.sleep(0.3)
+
+    # Past the refresh point: callers keep getting the cached token while one exchange runs.
+    assert await asyncio.gather(tool(), tool(), tool()) == ["token-1"] * 3
+    await asyncio.gather(*authorizer._background_refreshes)
+    assert endpoint.calls == 2
+    assert await tool() == "token-2"
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_keeps_the_cached_token():
+    endpoint = FakeTokenEndpoint(expires_in=1)
+    authorizer, tool = make_tool(endpoint, refresh_ahead=0.2)
+
+    assert await tool() == "token-1"
+    await asyncio.sleep(0.3)
+    endpoint.error = Auth0Error(503, "unavailable", "Service unavailable")
+
+    assert await tool() == "token-1"
+    await asyncio.gather(*authorizer._background_refreshes, return_exceptions=True)
+    assert await tool() == "token-1"
+
+
+def test_refresh_ahead_must_be_a_fraction():
+    with pytest.raises(ValueError):
+        make_tool(FakeTokenEndpoint(), refresh_ahead=1.5)
+
+
+@pytest.mark.asyncio
+async def test_missing_scopes_raise_an_interrupt_for_their_union():
+    endpoint = FakeTokenEndpoint(scope="write read read")
+    _, tool = make_tool(endpoint, scopes=["read", "admin"])
+
+    interrupt = await tool()
+
+    assert isinstance(interrupt, TokenVaultInterrupt)
+    assert "Missing scopes: admin" in str(interrupt)
+    assert interrupt.required_scopes == ["admin", "read", "write"]
+
+
+@pytest.mark.asyncio
+async def test_a_token_rejected_by_the_tool_is_not_reused():
+    store = InMemoryStore()
+    endpoint = FakeTokenEndpoint(scope="read write")
+    authorizer = TokenVaultAuthorizerBase(
+        TokenVaultAuthorizerParams(scopes=["read"], connection="google-oauth2", refresh_token="refresh-token", store=store),
+        AUTH0,
+    )
+    authorizer.get_token.access_token_for_connection_async = endpoint
+    authorizer._handle_authorization_interrupts = lambda interrupt: interrupt
+    seen: list[str] = []
+
+    def execute():
+        seen.append(get_access_token_from_token_vault())
+        if len(seen) == 1:
+            raise TokenVaultError("The provider rejected the access token")
+        return seen[-1]
+
+    tool = authorizer.protect(lambda *args, **kwargs: CONTEXT, execute)
+    _, other = make_tool(endpoint, scopes=["write"], store=store)
+
+    assert isinstance(await tool(), TokenVaultInterrupt)
+    assert await tool() == "token-2"
+    assert await other() == "token-2"
+    assert seen == ["token-1", "token-2"]
+    assert endpoint.calls == 2
@@ -0,0 +1,116 @@
+import asyncio
+import threading
+
+import pytest
+from auth0_ai.utils import SingleFlight, call_soon_in_loop
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_flight():
+    flights = SingleFlight[int]()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    assert await asyncio.gather(*[flights.do("key", fn) for _ in range(10)]) == [1] * 10
+    assert await flights.do("key", fn) == 2
+    assert await flights.do("other", fn) == 3
+
+
+@pytest.mark.asyncio
+async def test_exceptions_are_shared_and_not_cached():
+    flights = SingleFlight[int]()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*[flights.do("key", fn) for _ in range(3)], return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert calls == 1
+
+    with pytest.raises(ValueError):
+        await flights.do("key", fn)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_a_waiter_does_not_cancel_the_flight():
+    flights = SingleFlight[str]()
+    release = asyncio.Event()
+
+    async def fn():
+        await release.wait()
+        return "done"
+
+    cancelled = asyncio.ensure_future(flights.do("key", fn))
+    waiting = asyncio.ensure_future(flights.do("key", fn))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+
+    assert await waiting == "done"
+    assert cancelled.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_cancel_abandoned_cancels_the_flight_once_every_waiter_left():
+    flights = SingleFlight[str](cancel_abandoned=True)
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fn():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    first = asyncio.ensure_future(flights.do("key", fn))
+    second = asyncio.ensure_future(flights.do("key", fn))
+    await started.wait()
+
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+
+    second.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert first.cancelled() and second.cancelled()
+
+    async def ok():
+        return "fresh"
+
+    assert await flights.do("key", ok) == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_call_soon_in_loop_runs_on_the_loop_from_any_thread():
+    loop = asyncio.get_running_loop()
+    calls: list[tuple[str, bool]] = []
+
+    def record(source):
+        calls.append((source, asyncio.get_running_loop() is loop))
+
+    assert call_soon_in_loop(loop, record, "loop")
+    assert calls == [("loop", True)]
+
+    thread = threading.Thread(target=call_soon_in_loop, args=(loop, record, "thread"))
+    thread.start()
+    thread.join()
+    await asyncio.sleep(0)
+    assert calls[1] == ("thread", True)
+
+    closed = asyncio.new_event_loop()
+    closed.close()
+    assert not call_soon_in_loop(closed, record, "closed")
+    assert not call_soon_in_loop(None, record, "none")
+    assert len(calls) == 2